@@ -1,7 +1,8 @@
 from django.db import models
 from django.db.models import CharField
 from tinymce.models import HTMLField
-from django.utils.text import slugify
+
+from strategy_management.slugs import UniqueSlugService
 
 class BlogPost(models.Model):
     title = models.CharField(max_length=255)
@@ -19,9 +20,7 @@ class BlogPost(models.Model):
         verbose_name_plural = 'Blog Posts'
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        UniqueSlugService.save(self, self.title, super().save, *args, **kwargs)
 
     def tag_list(self):
         return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
@@ -47,9 +46,7 @@ class VideoPost(models.Model):
         verbose_name_plural = 'Video Posts'
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        UniqueSlugService.save(self, self.title, super().save, *args, **kwargs)
 
     def tag_list(self):
         return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
@@ -72,9 +69,7 @@ class Documentation(models.Model):
     slug = models.SlugField(unique=True, blank=True)
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)  # Auto-generate slug
-        super().save(*args, **kwargs)
+        UniqueSlugService.save(self, self.title, super().save, *args, **kwargs)  # Auto-generate slug
 
     def __str__(self):
         return self.title
@@ -5,7 +5,7 @@ from .forms import *
 from management_project.models import (
     OrganizationalProfile, SwotAnalysis, Vision, Mission, Values, StrategyHierarchy,
     Stakeholder, StrategicCycle, StrategicActionPlan, StrategicReport, SwotReport, InitiativePlanning,
-    InitiativeReport, InitiativeResourceItemReport, InitiativeResourceItemPlan, RiskManagement
+    InitiativeReport, InitiativeResourceItemReport, InitiativeResourceItemPlan, RiskManagement, ExportJob
 )
 from management_project.forms import (
     OrganizationalProfileForm, SwotAnalysisForm, VisionForm, MissionForm, ValuesForm,
@@ -13,6 +13,7 @@ from management_project.forms import (
     StrategicReportForm, SwotReportForm, InitiativePlanningForm, InitiativeReportForm,
     InitiativeResourceItemReportForm, InitiativeResourceItemPlanForm, RiskManagementForm
 )
+from management_project.services.action_plan_labels import ActionPlanLabelService
 
 # Register your models here.
 @admin.register(OrganizationalProfile)
@@ -336,7 +337,8 @@ class StrategicActionPlanAdmin(admin.ModelAdmin):
         return form_kwargs
 
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        # Cycle, KPI and responsible bodies of every listed plan in two queries
+        qs = ActionPlanLabelService.picker_queryset(super().get_queryset(request))
         if request.user.is_superuser:
             return qs
         if hasattr(request.user, 'organization_name') and request.user.organization_name:
@@ -354,6 +356,8 @@ class StrategicReportAdmin(admin.ModelAdmin):
     )
 
     list_filter = ('action_plan', 'organization_name',)
+    # Plans are shown by their stored label
+    list_select_related = ('organization_name', 'action_plan')
     search_fields = ('action_plan__strategy_hierarchy__key_performance_indicator', 'responsible_body', 'organization_name__organization_name')
     ordering = ('-created_at',)
 
@@ -655,7 +659,9 @@ class InitiativeResourceItemReportAdmin(admin.ModelAdmin):
 
     # Restrict queryset to user's organization
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related(
+            'initiative_resource_plan__initiative_name', 'initiative_resource_plan__organization'
+        )
         if request.user.is_superuser:
             return qs
         if hasattr(request.user, 'organization_name') and request.user.organization_name:
@@ -699,4 +705,26 @@ class InitiativeResourceItemReportAdmin(admin.ModelAdmin):
     utilization_percent_display.short_description = 'Utilization %'
 
 
-#
\ No newline at end of file
+#
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        'export_type', 'organization_name', 'requested_by', 'status', 'progress', 'rows_written',
+        'data_version', 'created_at', 'finished_at',
+    )
+    list_filter = ('status', 'export_type')
+    readonly_fields = (
+        'token', 'params_key', 'data_version', 'progress', 'rows_written', 'error',
+        'created_at', 'started_at', 'finished_at',
+    )
+    ordering = ['-created_at']
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('organization_name', 'requested_by')
+        if request.user.is_superuser:
+            return qs
+        if hasattr(request.user, 'organization_name') and request.user.organization_name:
+            return qs.filter(organization_name=request.user.organization_name)
+        return qs.none()
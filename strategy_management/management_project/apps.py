@@ -5,3 +5,5 @@ class ManagementProjectConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'management_project'
 
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,10 @@
+# management_project/context_processors.py
+
+from django.utils.functional import SimpleLazyObject
+
+from .services.permissions import get_request_permissions
+
+
+def user_permissions(request):
+    """Expose the request-scoped permissions dict to every template."""
+    return {'permissions': SimpleLazyObject(lambda: get_request_permissions(request))}
@@ -13,6 +13,8 @@ from .services.values import ValuesService
 from .services.initiative import InitiativePlanningChoicesService
 from multiselectfield import MultiSelectFormField
 from .services.risk_management import RiskChoicesService
+from .services.action_plan_labels import ActionPlanLabelService
+from .services.report_periods import ReportPeriodService
 
 
 
@@ -240,11 +242,11 @@ class SwotAnalysisForm(forms.ModelForm):
         pillar = self.data.get('swot_pillar') or getattr(self.instance, 'swot_pillar', None)
 
         # Level 1: SWOT Type
-        self.fields['swot_type'].choices = [('', '--- Select SWOT Type ---')] + SwotChoicesService.get_swot_type_choices()
+        self.fields['swot_type'].choices = [('', '--- Select SWOT Type ---'), *SwotChoicesService.get_swot_type_choices()]
 
         # Level 2: Pillar
         if swot_type:
-            self.fields['swot_pillar'].choices = [('', '--- Select Pillar ---')] + SwotChoicesService.get_pillar_choices(swot_type)
+            self.fields['swot_pillar'].choices = [('', '--- Select Pillar ---'), *SwotChoicesService.get_pillar_choices(swot_type)]
             self.fields['swot_pillar'].widget.attrs.pop('disabled', None)
         else:
             self.fields['swot_pillar'].choices = [('', '--- Select Type First ---')]
@@ -252,7 +254,7 @@ class SwotAnalysisForm(forms.ModelForm):
 
         # Level 3: Factor
         if swot_type and pillar:
-            self.fields['swot_factor'].choices = [('', '--- Select Factor ---')] + SwotChoicesService.get_factor_choices(swot_type, pillar)
+            self.fields['swot_factor'].choices = [('', '--- Select Factor ---'), *SwotChoicesService.get_factor_choices(swot_type, pillar)]
             self.fields['swot_factor'].widget.attrs.pop('disabled', None)
         else:
             self.fields['swot_factor'].choices = [('', '--- Select Pillar First ---')]
@@ -296,22 +298,22 @@ class StrategyHierarchyForm(forms.ModelForm):
         kpi = self.data.get('kpi') or getattr(self.instance, 'kpi', None)
 
         # Populate dropdowns dynamically
-        self.fields['strategic_perspective'].choices = [('', '--- Select Perspective ---')] + service.get_perspective_choices()
+        self.fields['strategic_perspective'].choices = [('', '--- Select Perspective ---'), *service.get_perspective_choices()]
 
         if perspective:
-            self.fields['focus_area'].choices = [('', '--- Select Pillar ---')] + service.get_pillar_choices(perspective)
+            self.fields['focus_area'].choices = [('', '--- Select Pillar ---'), *service.get_pillar_choices(perspective)]
         else:
             self.fields['focus_area'].choices = [('', '--- Select Perspective First ---')]
             self.fields['focus_area'].widget.attrs['disabled'] = True
 
         if perspective and pillar:
-            self.fields['objective'].choices = [('', '--- Select Objective ---')] + service.get_objective_choices(perspective, pillar)
+            self.fields['objective'].choices = [('', '--- Select Objective ---'), *service.get_objective_choices(perspective, pillar)]
         else:
             self.fields['objective'].choices = [('', '--- Select Pillar First ---')]
             self.fields['objective'].widget.attrs['disabled'] = True
 
         if perspective and pillar and objective:
-            self.fields['kpi'].choices = [('', '--- Select KPI ---')] + service.get_kpi_choices(perspective, pillar, objective)
+            self.fields['kpi'].choices = [('', '--- Select KPI ---'), *service.get_kpi_choices(perspective, pillar, objective)]
         else:
             self.fields['kpi'].choices = [('', '--- Select Objective First ---')]
             self.fields['kpi'].widget.attrs['disabled'] = True
@@ -410,6 +412,20 @@ class StakeholderForm(forms.ModelForm):
             field.widget.attrs['class'] = css_classes
 
 
+class StakeholderImportForm(forms.Form):
+    file = forms.FileField(
+        label="Stakeholder file",
+        help_text="An .xlsx or .csv file with a header row (the stakeholder export's layout works).",
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.xlsx,.csv'}),
+    )
+
+    def clean_file(self):
+        uploaded = self.cleaned_data['file']
+        if not uploaded.name.lower().endswith(('.xlsx', '.csv')):
+            raise forms.ValidationError("Upload an .xlsx or .csv file.")
+        return uploaded
+
+
 class StrategicCycleForm(forms.ModelForm):
     class Meta:
         model = StrategicCycle
@@ -528,13 +544,15 @@ class InitiativePlanningForm(forms.ModelForm):
         initiative_focus_area = self.data.get('initiative_focus_area') or getattr(self.instance, 'initiative_focus_area', None)
 
         # --- Pillar dropdown ---
-        self.fields['initiative_focus_area'].choices = [('', '--- Select Pillar ---')] + \
-            InitiativePlanningChoicesService.get_initiative_focus_area_choices()
+        self.fields['initiative_focus_area'].choices = [
+            ('', '--- Select Pillar ---'), *InitiativePlanningChoicesService.get_initiative_focus_area_choices()
+        ]
 
         # --- Area dropdown ---
         if initiative_focus_area:
-            self.fields['initiative_dimension'].choices = [('', '--- Select Area ---')] + \
-                InitiativePlanningChoicesService.get_area_choices(initiative_focus_area)
+            self.fields['initiative_dimension'].choices = [
+                ('', '--- Select Area ---'), *InitiativePlanningChoicesService.get_area_choices(initiative_focus_area)
+            ]
             self.fields['initiative_dimension'].widget.attrs.pop('disabled', None)
         else:
             self.fields['initiative_dimension'].choices = [('', '--- Select Pillar First ---')]
@@ -717,7 +735,8 @@ class StrategicReportForm(forms.ModelForm):
         if instance_plan:
             qs = (qs | StrategicActionPlan.objects.filter(pk=instance_plan.pk)).distinct()
 
-        self.fields['action_plan'].queryset = qs
+        # The form template renders each plan's dropdown_label_lines
+        self.fields['action_plan'].queryset = ActionPlanLabelService.picker_queryset(qs)
 
 
 
@@ -750,19 +769,13 @@ class SwotReportForm(forms.ModelForm):
         self.request = kwargs.pop('request', None)
         super().__init__(*args, **kwargs)
 
-        # ---------------- Filter unique by action_plan ----------------
+        # ---------------- Latest report of each action plan ----------------
         if self.request and self.request.user.is_authenticated and hasattr(self.request.user, 'organization_name'):
             org = self.request.user.organization_name
-            reports = StrategicReport.objects.filter(organization_name=org).order_by('action_plan', '-id')
-
-            unique_ids = []
-            seen = set()
-            for report in reports:
-                if report.action_plan_id not in seen:
-                    seen.add(report.action_plan_id)
-                    unique_ids.append(report.id)
-
-            self.fields['strategic_report_period'].queryset = StrategicReport.objects.filter(id__in=unique_ids)
+            field = self.fields['strategic_report_period']
+            # The queryset only validates the posted report; the options come from the cache
+            field.queryset = ReportPeriodService.latest_reports(org)
+            field.choices = [('', field.empty_label), *ReportPeriodService.choices(org)]
         else:
             self.fields['strategic_report_period'].queryset = StrategicReport.objects.none()
 
@@ -771,11 +784,11 @@ class SwotReportForm(forms.ModelForm):
         pillar = self.data.get('swot_pillar') or getattr(self.instance, 'swot_pillar', None)
 
         # Level 1: SWOT Type
-        self.fields['swot_type'].choices = [('', '--- Select SWOT Type ---')] + SwotChoicesService.get_swot_type_choices()
+        self.fields['swot_type'].choices = [('', '--- Select SWOT Type ---'), *SwotChoicesService.get_swot_type_choices()]
 
         # Level 2: Pillar
         if swot_type:
-            self.fields['swot_pillar'].choices = [('', '--- Select Pillar ---')] + SwotChoicesService.get_pillar_choices(swot_type)
+            self.fields['swot_pillar'].choices = [('', '--- Select Pillar ---'), *SwotChoicesService.get_pillar_choices(swot_type)]
             self.fields['swot_pillar'].widget.attrs.pop('disabled', None)
         else:
             self.fields['swot_pillar'].choices = [('', '--- Select Type First ---')]
@@ -783,7 +796,7 @@ class SwotReportForm(forms.ModelForm):
 
         # Level 3: Factor
         if swot_type and pillar:
-            self.fields['swot_factor'].choices = [('', '--- Select Factor ---')] + SwotChoicesService.get_factor_choices(swot_type, pillar)
+            self.fields['swot_factor'].choices = [('', '--- Select Factor ---'), *SwotChoicesService.get_factor_choices(swot_type, pillar)]
             self.fields['swot_factor'].widget.attrs.pop('disabled', None)
         else:
             self.fields['swot_factor'].choices = [('', '--- Select Pillar First ---')]
@@ -821,8 +834,8 @@ class RiskManagementForm(forms.ModelForm):
 
         # Risk category & name logic
         risk_category = self.data.get('risk_category') or getattr(self.instance, 'risk_category', None)
-        self.fields['risk_category'].choices = [('', '--- Select Risk Category ---')] + RiskChoicesService.get_risk_category_choices()
-        self.fields['risk_name'].choices = [('', '--- Select Risk Name ---')] + (RiskChoicesService.get_risk_name_choices(risk_category) if risk_category else [])
+        self.fields['risk_category'].choices = [('', '--- Select Risk Category ---'), *RiskChoicesService.get_risk_category_choices()]
+        self.fields['risk_name'].choices = [('', '--- Select Risk Name ---'), *RiskChoicesService.get_risk_name_choices(risk_category)]
 
 
     def save(self, commit=True):
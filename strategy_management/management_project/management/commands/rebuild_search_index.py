@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from management_project.models import OrganizationalProfile
+from management_project.services.search_index import SearchIndexService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents of stakeholders, reports, SWOT entries and risks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization', type=int,
+            help="Only rebuild the documents of this organizational profile id.",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options['organization']:
+            organization = OrganizationalProfile.objects.filter(pk=options['organization']).first()
+            if organization is None:
+                raise CommandError(f"Organizational profile {options['organization']} does not exist.")
+
+        counts = SearchIndexService.rebuild(organization)
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {sum(counts.values())} search documents."))
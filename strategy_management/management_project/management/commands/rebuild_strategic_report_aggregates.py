@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from management_project.models import OrganizationalProfile
+from management_project.services.strategic_report_analytics import StrategicReportAnalyticsService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the precomputed strategic report dashboard aggregates."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization', type=int,
+            help="Only rebuild the cycles of this organizational profile id.",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options['organization']:
+            organization = OrganizationalProfile.objects.filter(pk=options['organization']).first()
+            if organization is None:
+                raise CommandError(f"Organizational profile {options['organization']} does not exist.")
+
+        rows = StrategicReportAnalyticsService.rebuild(organization)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} strategic report aggregate rows."))
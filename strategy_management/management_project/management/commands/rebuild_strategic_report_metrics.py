@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from management_project.models import OrganizationalProfile
+from management_project.services.report_metrics import ReportMetricsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored percent achieved, variance and weighted score of strategic "
+        "reports from their action plans' current baseline, target and weight, in one UPDATE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization', type=int,
+            help="Only recompute the reports of this organizational profile id.",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options['organization']:
+            organization = OrganizationalProfile.objects.filter(pk=options['organization']).first()
+            if organization is None:
+                raise CommandError(f"Organizational profile {options['organization']} does not exist.")
+
+        updated = ReportMetricsService.rebuild(organization)
+        self.stdout.write(self.style.SUCCESS(f"Recomputed {updated} strategic reports."))
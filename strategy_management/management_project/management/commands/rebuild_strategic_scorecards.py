@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from management_project.models import OrganizationalProfile, StrategicScorecard
+from management_project.services.strategic_scorecard import StrategicScorecardService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-cycle weighted scorecards and list the cycles whose action plan "
+        f"weights do not sum to {StrategicScorecard.WEIGHT_TOTAL}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization', type=int,
+            help="Only rebuild the cycles of this organizational profile id.",
+        )
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Only list the cycles with unbalanced weights, without rebuilding.",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options['organization']:
+            organization = OrganizationalProfile.objects.filter(pk=options['organization']).first()
+            if organization is None:
+                raise CommandError(f"Organizational profile {options['organization']} does not exist.")
+
+        if not options['check']:
+            rows = StrategicScorecardService.rebuild(organization)
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} strategic scorecard rows."))
+
+        unbalanced = StrategicScorecardService.unbalanced(organization).order_by('organization_name_id', 'strategic_cycle_id')
+        for scorecard in unbalanced:
+            self.stdout.write(self.style.WARNING(
+                f"Cycle {scorecard.strategic_cycle_id} ({scorecard.strategic_cycle.name}): plan weights sum to "
+                f"{scorecard.weight_total}, not {StrategicScorecard.WEIGHT_TOTAL}."
+            ))
+        if not unbalanced:
+            self.stdout.write(f"All plan weights sum to {StrategicScorecard.WEIGHT_TOTAL} per cycle.")
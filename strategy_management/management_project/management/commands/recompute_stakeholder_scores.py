@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from management_project.models import OrganizationalProfile
+from management_project.services.stakeholder_scoring import StakeholderScoringService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored stakeholder engagement scores and flags from the current "
+        "weights and thresholds, in one UPDATE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--organization', type=int,
+            help="Only recompute the stakeholders of this organizational profile id.",
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Show what would change without writing anything.",
+        )
+        parser.add_argument(
+            '--show', type=int, default=StakeholderScoringService.DIFF_SAMPLE_SIZE,
+            help="Changed stakeholders listed by --dry-run "
+                 f"(default: {StakeholderScoringService.DIFF_SAMPLE_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        organization = None
+        if options['organization']:
+            organization = OrganizationalProfile.objects.filter(pk=options['organization']).first()
+            if organization is None:
+                raise CommandError(f"Organizational profile {options['organization']} does not exist.")
+
+        if not options['dry_run']:
+            updated = StakeholderScoringService.recompute(organization)
+            self.stdout.write(self.style.SUCCESS(f"Recomputed {updated} stakeholders."))
+            return
+
+        diff = StakeholderScoringService.diff(organization, sample_size=options['show'])
+        self.stdout.write(f"{diff['changed']} stakeholders would change.")
+        for field_name, count in diff['fields'].items():
+            self.stdout.write(f"  {field_name}: {count}")
+        for sample in diff['samples']:
+            changes = ", ".join(
+                f"{field_name} {old} -> {new}" for field_name, (old, new) in sample['changes'].items()
+            )
+            self.stdout.write(f"{sample['stakeholder_code']} {sample['stakeholder_name']}: {changes}")
+        if diff['changed'] > len(diff['samples']):
+            self.stdout.write(f"... and {diff['changed'] - len(diff['samples'])} more.")
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from management_project.services.export_jobs import ExportJobService
+
+
+class Command(BaseCommand):
+    help = "Build queued background Excel exports and delete the expired ones."
+
+    # Seconds between two deletions of expired jobs while waiting for new ones
+    PURGE_EVERY = 3600
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Run the jobs queued now and exit instead of waiting for new ones.",
+        )
+        parser.add_argument(
+            '--sleep', type=float, default=2.0,
+            help="Seconds to wait between polls of an empty queue (default: 2).",
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            purged = ExportJobService.purge_expired()
+            count = ExportJobService.run_pending()
+            self.stdout.write(self.style.SUCCESS(f"Ran {count} export jobs, deleted {purged} expired ones."))
+            return
+
+        self.stdout.write("Waiting for export jobs (Ctrl+C to stop)...")
+        purged_at = None
+        try:
+            while True:
+                if purged_at is None or time.monotonic() - purged_at >= self.PURGE_EVERY:
+                    ExportJobService.purge_expired()
+                    purged_at = time.monotonic()
+                job = ExportJobService.claim_next()
+                if job is None:
+                    time.sleep(options['sleep'])
+                    continue
+                job = ExportJobService.run(job)
+                self.stdout.write(f"Export job {job.pk} ({job.export_type}): {job.status}")
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped.")
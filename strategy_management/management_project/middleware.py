@@ -0,0 +1,17 @@
+# management_project/middleware.py
+
+from .services.permissions import RoleResolver
+
+
+class RoleResolverMiddleware:
+    """
+    Attach a RoleResolver to every request.
+    The invitation lookup only runs when a decorator, view or template first asks for the role.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.role_resolver = RoleResolver(request.user)
+        return self.get_response(request)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationinvitation',
+            index=models.Index(fields=['organization_name', 'email', 'status'], name='management__organiz_aab4f0_idx'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+
+
+def fill_aggregates(apps, schema_editor):
+    """StrategicReportAnalyticsService.refresh_cycle() as of this migration, for every cycle."""
+    StrategicReport = apps.get_model('management_project', 'StrategicReport')
+    StrategicReportAggregate = apps.get_model('management_project', 'StrategicReportAggregate')
+    groups = {
+        'org_id': F('organization_name_id'),
+        'cycle_id': F('action_plan__strategic_cycle_id'),
+        'group_status': F('status'),
+        'group_perspective': F('action_plan__strategy_hierarchy__strategic_perspective'),
+        'group_focus_area': F('action_plan__strategy_hierarchy__focus_area'),
+        'group_objective': F('action_plan__strategy_hierarchy__objective'),
+        'group_kpi': F('action_plan__strategy_hierarchy__kpi'),
+    }
+
+    def grouped(reports, **extra):
+        return reports.values(**groups, **extra).annotate(
+            report_count=Count('id'),
+            percent_achieved_sum=Sum('percent_achieved'),
+            weighted_score_sum=Sum('weighted_score'),
+        ).order_by()
+
+    def row(values, body):
+        return StrategicReportAggregate(
+            organization_name_id=values['org_id'],
+            strategic_cycle_id=values['cycle_id'],
+            responsible_body=body or '',
+            status=values['group_status'],
+            strategic_perspective=values['group_perspective'] or '',
+            focus_area=values['group_focus_area'] or '',
+            objective=values['group_objective'] or '',
+            kpi=values['group_kpi'] or '',
+            report_count=values['report_count'],
+            percent_achieved_sum=values['percent_achieved_sum'] or 0,
+            weighted_score_sum=values['weighted_score_sum'] or 0,
+        )
+
+    # One all-reports row per group, plus one per responsible body
+    reports = StrategicReport.objects.all()
+    aggregates = [row(values, '') for values in grouped(reports)]
+    aggregates += [
+        row(values, values['body'])
+        for values in grouped(
+            reports.filter(action_plan__responsible_bodies__isnull=False),
+            body=F('action_plan__responsible_bodies__stakeholder_name'),
+        )
+    ]
+    StrategicReportAggregate.objects.bulk_create(aggregates, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0002_organizationinvitation_management__organiz_aab4f0_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StrategicReportAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('responsible_body', models.CharField(blank=True, default='', max_length=200)),
+                ('status', models.CharField(max_length=20)),
+                ('strategic_perspective', models.CharField(max_length=100)),
+                ('focus_area', models.CharField(max_length=100)),
+                ('objective', models.CharField(max_length=100)),
+                ('kpi', models.CharField(max_length=100)),
+                ('report_count', models.PositiveIntegerField(default=0)),
+                ('percent_achieved_sum', models.DecimalField(decimal_places=2, default=0, max_digits=30)),
+                ('weighted_score_sum', models.DecimalField(decimal_places=2, default=0, max_digits=30)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('organization_name', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='management_project.organizationalprofile')),
+                ('strategic_cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_aggregates', to='management_project.strategiccycle')),
+            ],
+            options={
+                'verbose_name': 'Strategic Report Aggregate',
+                'verbose_name_plural': 'Strategic Report Aggregates',
+                'indexes': [models.Index(fields=['organization_name', 'strategic_cycle', 'responsible_body'], name='management__organiz_72270c_idx')],
+            },
+        ),
+        migrations.RunPython(fill_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0003_strategicreportaggregate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrganizationDataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('organization_name', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='data_version', to='management_project.organizationalprofile')),
+            ],
+            options={
+                'verbose_name': 'Organization Data Version',
+                'verbose_name_plural': 'Organization Data Versions',
+            },
+        ),
+    ]
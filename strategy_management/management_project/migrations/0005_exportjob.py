@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:18
+
+import django.db.models.deletion
+import management_project.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0004_organizationdataversion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('export_type', models.CharField(choices=[('strategic_report', 'Strategic Reports'), ('strategic_action_plan', 'Strategic Action Plan'), ('stakeholder', 'Stakeholders'), ('initiative_report', 'Initiative Reports'), ('swot_analysis', 'SWOT Analysis'), ('risk_management', 'Risk Management')], max_length=50)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('params_key', models.CharField(max_length=32)),
+                ('data_version', models.PositiveBigIntegerField(default=0)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('progress', models.PositiveSmallIntegerField(default=0)),
+                ('rows_written', models.PositiveIntegerField(default=0)),
+                ('file', models.FileField(blank=True, max_length=255, upload_to=management_project.models.export_job_upload_to)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('organization_name', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to='management_project.organizationalprofile')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Export Job',
+                'verbose_name_plural': 'Export Jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['organization_name', 'export_type', 'params_key', 'data_version'], name='management__organiz_0efad3_idx'), models.Index(fields=['status', 'created_at'], name='management__status_bde797_idx')],
+            },
+        ),
+    ]
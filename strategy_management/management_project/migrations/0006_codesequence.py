@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:20
+
+import re
+
+from django.db import migrations, models
+
+
+def seed_stakeholder_code_sequences(apps, schema_editor):
+    """Start each prefix's counter after the highest stakeholder code already issued."""
+    Stakeholder = apps.get_model('management_project', 'Stakeholder')
+    CodeSequence = apps.get_model('management_project', 'CodeSequence')
+    pattern = re.compile(r'^(?P<prefix>.+)-(?P<number>\d+)$')
+
+    highest = {}
+    for code in Stakeholder.objects.values_list('stakeholder_code', flat=True).iterator():
+        match = pattern.match(code or '')
+        if match:
+            prefix, number = match.group('prefix'), int(match.group('number'))
+            highest[prefix] = max(highest.get(prefix, 0), number)
+
+    CodeSequence.objects.bulk_create(
+        [CodeSequence(prefix=prefix, last_value=number) for prefix, number in highest.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0005_exportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CodeSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=50, unique=True)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Code Sequence',
+                'verbose_name_plural': 'Code Sequences',
+            },
+        ),
+        migrations.RunPython(seed_stakeholder_code_sequences, migrations.RunPython.noop),
+    ]
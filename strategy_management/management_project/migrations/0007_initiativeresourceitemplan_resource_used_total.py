@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:28
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_resource_used_total(apps, schema_editor):
+    """Sum the existing reports of every plan."""
+    InitiativeResourceItemPlan = apps.get_model('management_project', 'InitiativeResourceItemPlan')
+    InitiativeResourceItemReport = apps.get_model('management_project', 'InitiativeResourceItemReport')
+    totals = (
+        InitiativeResourceItemReport.objects.filter(initiative_resource_plan=OuterRef('pk'))
+        .order_by()
+        .values('initiative_resource_plan')
+        .annotate(total=Sum('resource_used'))
+        .values('total')
+    )
+    InitiativeResourceItemPlan.objects.update(
+        resource_used_total=Coalesce(
+            Subquery(totals), Value(0),
+            output_field=models.DecimalField(max_digits=14, decimal_places=2),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0006_codesequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='initiativeresourceitemplan',
+            name='resource_used_total',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=14),
+        ),
+        migrations.RunPython(fill_resource_used_total, migrations.RunPython.noop),
+    ]
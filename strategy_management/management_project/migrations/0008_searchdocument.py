@@ -0,0 +1,131 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.urls import reverse
+
+DOCUMENT_TABLE = 'management_project_searchdocument'
+FTS_TABLE = f'{DOCUMENT_TABLE}_fts'
+
+# External-content FTS5 table over the documents, kept in sync by triggers
+CREATE_FTS = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, body, content='{DOCUMENT_TABLE}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER {FTS_TABLE}_insert AFTER INSERT ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_delete AFTER DELETE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_update AFTER UPDATE ON {DOCUMENT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+]
+DROP_FTS = [
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_update',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_delete',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_insert',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+# (model, kind, title, body, (url name, url arguments)) of the documents as of this migration
+SOURCES = [
+    ('Stakeholder', 'stakeholder', 'stakeholder_name',
+     ('stakeholder_code', 'role', 'department', 'description', 'notes', 'contact_info'),
+     ('update_stakeholder', ('pk',))),
+    ('StrategicReport', 'strategic_report', 'action_plan__strategy_hierarchy__kpi',
+     ('action_plan__strategy_hierarchy__strategic_perspective', 'action_plan__strategy_hierarchy__focus_area',
+      'action_plan__strategy_hierarchy__objective', 'action_plan__strategic_cycle__name',
+      'action_plan__strategic_cycle__end_date', 'achievement', 'status', 'progress_summary',
+      'performance_summary', 'challenges', 'successes', 'lessons_learned'),
+     ('strategic_report_detail', ('action_plan__strategic_cycle__slug', 'pk'))),
+    ('InitiativeReport', 'initiative_report', 'initiative_planning__initiative_name',
+     ('initiative_planning__initiative_focus_area', 'initiative_planning__initiative_dimension',
+      'achieved_status', 'notes'),
+     ('update_initiative_report', ('pk',))),
+    ('SwotAnalysis', 'swot_analysis', 'swot_factor', ('swot_type', 'swot_pillar', 'description'),
+     ('update_swot_analysis', ('pk',))),
+    ('SwotReport', 'swot_report', 'swot_factor',
+     ('swot_type', 'swot_pillar', 'description',
+      'strategic_report_period__action_plan__strategic_cycle__name',
+      'strategic_report_period__action_plan__strategic_cycle__time_horizon',
+      'strategic_report_period__action_plan__strategic_cycle__time_horizon_type'),
+     ('update_swot_report', ('pk',))),
+    ('RiskManagement', 'risk', 'risk_name', ('risk_category', 'mitigation_action', 'strategic_cycle__name'),
+     ('update_risk_management', ('pk',))),
+]
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in CREATE_FTS:
+        schema_editor.execute(statement)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_FTS:
+        schema_editor.execute(statement)
+
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return str(value)
+
+
+def index_existing_rows(apps, schema_editor):
+    """Write the documents of the existing rows; the FTS triggers index them."""
+    SearchDocument = apps.get_model('management_project', 'SearchDocument')
+    for model_name, kind, title, body, (url_name, url_args) in SOURCES:
+        model = apps.get_model('management_project', model_name)
+        fields = dict.fromkeys(('pk', 'organization_name_id', title, *body, *url_args))
+        rows = model.objects.order_by().values(*fields)
+        documents = []
+        for row in rows.iterator(chunk_size=500):
+            documents.append(SearchDocument(
+                organization_name_id=row['organization_name_id'],
+                kind=kind,
+                object_id=row['pk'],
+                title=_text(row[title])[:255],
+                body='\n'.join(text for text in (_text(row[field]) for field in body) if text),
+                url=reverse(url_name, args=[row[arg] for arg in url_args]),
+            ))
+        SearchDocument.objects.bulk_create(documents, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0007_initiativeresourceitemplan_resource_used_total'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('stakeholder', 'Stakeholder'), ('strategic_report', 'Strategic Report'), ('initiative_report', 'Initiative Report'), ('swot_analysis', 'SWOT Analysis'), ('swot_report', 'SWOT Report'), ('risk', 'Risk')], max_length=30)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('url', models.CharField(max_length=255)),
+                ('organization_name', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='management_project.organizationalprofile')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'indexes': [models.Index(fields=['organization_name', 'kind'], name='management__organiz_59e6c7_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.RunPython(create_fts, drop_fts),
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:41
+
+from django.db import migrations, models
+
+
+def _label(plan):
+    """StrategicActionPlan.build_label() as of this migration."""
+    cycle = plan.strategic_cycle
+    start = cycle.start_date.strftime("%B %d, %Y") if cycle.start_date else "N/A"
+    end = cycle.end_date.strftime("%B %d, %Y") if cycle.end_date else "N/A"
+    cycle_name = f"{cycle.name} - {cycle.time_horizon} - {cycle.time_horizon_type} - {start} - {end}"
+    responsible = ", ".join(
+        f"{stakeholder.stakeholder_name} ({stakeholder.get_primary_role_display()})"
+        for stakeholder in plan.responsible_bodies.all()
+    ) or "N/A"
+    return (
+        f"{cycle_name} | KPI: {plan.strategy_hierarchy.kpi} | Baseline: {plan.baseline or 0} | "
+        f"Target: {plan.target or 0} | Responsible: {responsible}"
+    )
+
+
+def fill_labels(apps, schema_editor):
+    StrategicActionPlan = apps.get_model('management_project', 'StrategicActionPlan')
+    plans = StrategicActionPlan.objects.select_related('strategic_cycle', 'strategy_hierarchy').prefetch_related(
+        'responsible_bodies'
+    )
+    batch = []
+    for plan in plans.iterator(chunk_size=500):
+        plan.label = _label(plan)
+        batch.append(plan)
+        if len(batch) == 500:
+            StrategicActionPlan.objects.bulk_update(batch, ['label'])
+            batch = []
+    StrategicActionPlan.objects.bulk_update(batch, ['label'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0008_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='strategicactionplan',
+            name='label',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(fill_labels, migrations.RunPython.noop),
+    ]
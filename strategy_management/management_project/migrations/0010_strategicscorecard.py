@@ -0,0 +1,85 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:48
+
+from collections import defaultdict
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_scorecards(apps, schema_editor):
+    """StrategicScorecardService.refresh_cycle() as of this migration, for every cycle."""
+    StrategicCycle = apps.get_model('management_project', 'StrategicCycle')
+    StrategicActionPlan = apps.get_model('management_project', 'StrategicActionPlan')
+    StrategicReport = apps.get_model('management_project', 'StrategicReport')
+    StrategicScorecard = apps.get_model('management_project', 'StrategicScorecard')
+
+    totals = defaultdict(lambda: {
+        'plan_count': 0, 'reported_plan_count': 0,
+        'weight_total': Decimal(0), 'composite_score': Decimal(0),
+    })
+    # The cycle-wide row of every cycle, kept even without plans
+    for cycle_id, organization_id in StrategicCycle.objects.values_list('id', 'organization_name_id'):
+        totals[(organization_id, cycle_id, '', '')]
+
+    latest_report = StrategicReport.objects.filter(action_plan=OuterRef('pk')).order_by('-pk')
+    plans = StrategicActionPlan.objects.order_by().annotate(
+        latest_score=Subquery(latest_report.values('weighted_score')[:1]),
+    ).values(
+        'strategic_cycle_id', 'strategic_cycle__organization_name_id', 'weight', 'latest_score',
+        'strategy_hierarchy__strategic_perspective', 'strategy_hierarchy__focus_area',
+    )
+    for plan in plans.iterator(chunk_size=500):
+        cycle = (plan['strategic_cycle__organization_name_id'], plan['strategic_cycle_id'])
+        perspective = plan['strategy_hierarchy__strategic_perspective'] or ''
+        focus_area = plan['strategy_hierarchy__focus_area'] or ''
+        for scope in {('', ''), (perspective, ''), (perspective, focus_area)}:
+            row = totals[cycle + scope]
+            row['plan_count'] += 1
+            row['weight_total'] += plan['weight'] or 0
+            if plan['latest_score'] is not None:
+                row['reported_plan_count'] += 1
+                row['composite_score'] += plan['latest_score']
+
+    StrategicScorecard.objects.bulk_create([
+        StrategicScorecard(
+            organization_name_id=organization_id,
+            strategic_cycle_id=cycle_id,
+            strategic_perspective=perspective,
+            focus_area=focus_area,
+            **row,
+        )
+        for (organization_id, cycle_id, perspective, focus_area), row in totals.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0009_strategicactionplan_label'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StrategicScorecard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('strategic_perspective', models.CharField(blank=True, default='', max_length=100)),
+                ('focus_area', models.CharField(blank=True, default='', max_length=100)),
+                ('plan_count', models.PositiveIntegerField(default=0)),
+                ('reported_plan_count', models.PositiveIntegerField(default=0)),
+                ('weight_total', models.DecimalField(decimal_places=2, default=0, max_digits=30)),
+                ('composite_score', models.DecimalField(decimal_places=2, default=0, max_digits=30)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('organization_name', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='management_project.organizationalprofile')),
+                ('strategic_cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scorecards', to='management_project.strategiccycle')),
+            ],
+            options={
+                'verbose_name': 'Strategic Scorecard',
+                'verbose_name_plural': 'Strategic Scorecards',
+                'constraints': [models.UniqueConstraint(fields=('strategic_cycle', 'strategic_perspective', 'focus_area'), name='unique_strategic_scorecard_scope')],
+            },
+        ),
+        migrations.RunPython(fill_scorecards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0010_strategicscorecard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organizationalprofile',
+            name='permissions_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
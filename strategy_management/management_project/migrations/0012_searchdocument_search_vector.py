@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:25
+
+from django.db import migrations
+
+DOCUMENT_TABLE = 'management_project_searchdocument'
+
+# Weighted tsvector of each document (title A, body B), computed by PostgreSQL on every write, and
+# its GIN index. The 'simple' configuration matches SearchIndexService.TS_CONFIG.
+CREATE_VECTOR = [
+    f"""ALTER TABLE {DOCUMENT_TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+    ) STORED""",
+    f'CREATE INDEX {DOCUMENT_TABLE}_search_vector ON {DOCUMENT_TABLE} USING gin (search_vector)',
+]
+DROP_VECTOR = [
+    f'DROP INDEX IF EXISTS {DOCUMENT_TABLE}_search_vector',
+    f'ALTER TABLE {DOCUMENT_TABLE} DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def create_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in CREATE_VECTOR:
+        schema_editor.execute(statement)
+
+
+def drop_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in DROP_VECTOR:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0011_organizationalprofile_permissions_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_vector, drop_vector),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:28
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_heartbeats(apps, schema_editor):
+    """Jobs running now last showed signs of life when they started, as far as we know."""
+    ExportJob = apps.get_model('management_project', 'ExportJob')
+    ExportJob.objects.filter(status='running').update(heartbeat_at=F('started_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management_project', '0012_searchdocument_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(fill_heartbeats, migrations.RunPython.noop),
+    ]
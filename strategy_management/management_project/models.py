@@ -1,11 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 import datetime
 from django.core.exceptions import ValidationError
 import re
 # choices
 from .choices.country_code_choices import COUNTRY_CODE_CHOICES
 # date and utils
-from django.utils.text import slugify
 from django.db.models import Sum
 # stakeholder_list info
 from decimal import Decimal, ROUND_HALF_UP
@@ -18,6 +17,7 @@ from .services.values import ValuesService
 import calendar
 from multiselectfield import MultiSelectField
 from account.models import CustomUser
+from strategy_management.slugs import UniqueSlugService
 import uuid
 
 
@@ -58,11 +58,23 @@ class OrganizationalProfile(models.Model):
     organization_type = models.CharField(choices=organization_choices, max_length=70)
     sector_name = models.CharField( max_length=50, choices=SECTOR_CHOICES)
     contact_personnel = models.CharField(max_length=90)
+    # Part of the cached role/permissions keys; bumped by services.permissions after an
+    # invitation or member change commits, so every worker stops reading the older entries
+    permissions_version = models.PositiveBigIntegerField(default=0, editable=False)
 
 
     def __str__(self):
         return str(self.organization_name)
 
+    def save(self, *args, **kwargs):
+        # Never write back a permissions_version loaded before a concurrent bump
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'permissions_version'
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Organizational Profile"
         verbose_name_plural = "               Organizational Profile"
@@ -105,6 +117,10 @@ class OrganizationInvitation(models.Model):
     message = models.TextField(blank=True, null=True, help_text="Optional message to the invitee")
     token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['organization_name', 'email', 'status']),
+        ]
 
     def __str__(self):
         return f"{self.email} ({self.status})"
@@ -413,26 +429,12 @@ class Stakeholder(models.Model):
 
     # ------------------ Save Override ------------------
     def save(self, *args, **kwargs):
-        # Auto-generate stakeholder_code
+        # Auto-generate stakeholder_code from the prefix's sequence (one statement, safe under concurrency)
         if not self.stakeholder_code:
+            from management_project.services.sequences import SequenceService
             org_prefix = self.organization_name.organization_name[:3].upper()
             base_code = f"STK-{org_prefix}-{self.stakeholder_name[:3].upper()}"
-            counter = 1
-            code = f"{base_code}-{counter:04d}"
-            while Stakeholder.objects.filter(stakeholder_code=code).exists():
-                counter += 1
-                code = f"{base_code}-{counter:04d}"
-            self.stakeholder_code = code
-
-        # Auto-generate slug
-        if not self.slug:
-            base_slug = slugify(f"{self.stakeholder_name}-{self.stakeholder_code}")
-            slug = base_slug
-            counter = 1
-            while Stakeholder.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+            self.stakeholder_code = f"{base_code}-{SequenceService.next_value(base_code):04d}"
 
         # Set primary role
         if not self.primary_role and self.role:
@@ -440,32 +442,64 @@ class Stakeholder(models.Model):
 
         # Calculate engagement score & flags
         self.calculate_engagement_priority()
-        self.is_key_stakeholder = self.engagement_priority_score >= Decimal('7.0')
-        self.requires_attention = (
-                self.engagement_priority_score >= Decimal('8.0') or
-                self.risk_level in ['high', 'very_high'] or
-                self.satisfaction_level in ['very_low', 'low']
+        self.is_key_stakeholder, self.requires_attention = self.engagement_flags(
+            self.engagement_priority_score, self.risk_level, self.satisfaction_level
         )
 
-        super().save(*args, **kwargs)
+        # Auto-generate a unique slug
+        UniqueSlugService.save(self, f"{self.stakeholder_name}-{self.stakeholder_code}", super().save, *args, **kwargs)
 
     # ------------------ Engagement Priority Calculation ------------------
+    LEVEL_SCORES = {
+        'very_low': 1,
+        'low': 2,
+        'medium': 3,
+        'high': 4,
+        'very_high': 5
+    }
+    # Score of a level outside LEVEL_SCORES (counted as medium)
+    UNKNOWN_LEVEL_SCORE = 3
+    # Weight of each level field in the engagement priority score (out of 10)
+    ENGAGEMENT_WEIGHTS = {
+        'impact_level': 0.3,
+        'influence_score': 0.25,
+        'interest_level': 0.2,
+        'risk_level': 0.25,
+    }
+    # Thresholds of is_key_stakeholder and requires_attention
+    KEY_STAKEHOLDER_SCORE = Decimal('7.0')
+    ATTENTION_SCORE = Decimal('8.0')
+    ATTENTION_RISK_LEVELS = ('high', 'very_high')
+    ATTENTION_SATISFACTION_LEVELS = ('very_low', 'low')
+
     def calculate_engagement_priority(self):
         """Calculate numerical engagement priority score"""
-        score_map = {
-            'very_low': 1,
-            'low': 2,
-            'medium': 3,
-            'high': 4,
-            'very_high': 5
-        }
+        self.engagement_priority_score = self.engagement_priority_for(
+            self.impact_level, self.influence_score, self.interest_level, self.risk_level
+        )
+
+    @classmethod
+    def engagement_priority_for(cls, impact_level, influence_score, interest_level, risk_level):
+        """Engagement priority score (0-10) for the given levels; unknown levels count as medium."""
+        weights = cls.ENGAGEMENT_WEIGHTS
         weighted_score = (
-                score_map.get(self.impact_level, 3) * 0.3 +
-                score_map.get(self.influence_score, 3) * 0.25 +
-                score_map.get(self.interest_level, 3) * 0.2 +
-                score_map.get(self.risk_level, 3) * 0.25
+                cls.LEVEL_SCORES.get(impact_level, cls.UNKNOWN_LEVEL_SCORE) * weights['impact_level'] +
+                cls.LEVEL_SCORES.get(influence_score, cls.UNKNOWN_LEVEL_SCORE) * weights['influence_score'] +
+                cls.LEVEL_SCORES.get(interest_level, cls.UNKNOWN_LEVEL_SCORE) * weights['interest_level'] +
+                cls.LEVEL_SCORES.get(risk_level, cls.UNKNOWN_LEVEL_SCORE) * weights['risk_level']
         )
-        self.engagement_priority_score = Decimal(round(weighted_score * 2, 1))
+        return Decimal(round(weighted_score * 2, 1))
+
+    @classmethod
+    def engagement_flags(cls, engagement_priority_score, risk_level, satisfaction_level):
+        """(is_key_stakeholder, requires_attention) for a score and the stakeholder's risk/satisfaction."""
+        is_key_stakeholder = engagement_priority_score >= cls.KEY_STAKEHOLDER_SCORE
+        requires_attention = (
+                engagement_priority_score >= cls.ATTENTION_SCORE or
+                risk_level in cls.ATTENTION_RISK_LEVELS or
+                satisfaction_level in cls.ATTENTION_SATISFACTION_LEVELS
+        )
+        return is_key_stakeholder, requires_attention
 
     # ------------------ Properties ------------------
     @property
@@ -560,21 +594,12 @@ class StrategicCycle(models.Model):
         # Auto-generate name based on org + time horizon + dates
         self.name = f"{self.organization_name} - {self.time_horizon} ({self.start_date:%B %Y}–{self.end_date:%B %Y})"
 
-        if not self.slug:
-            # Build slug from multiple fields
-            base_slug = slugify(
-                f"{self.name}-"
-                f"{self.time_horizon}-{self.time_horizon_type}-"
-                f"{self.start_date}-{self.end_date}"
-            )
-            slug = base_slug
-            counter = 1
-            while StrategicCycle.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-
-        super().save(*args, **kwargs)
+        # Auto-generate a unique slug from multiple fields
+        UniqueSlugService.save(
+            self,
+            f"{self.name}-{self.time_horizon}-{self.time_horizon_type}-{self.start_date}-{self.end_date}",
+            super().save, *args, **kwargs
+        )
 
     def __str__(self):
         start_str = self.start_date.strftime("%Y-%m-%d") if self.start_date else "N/A"
@@ -633,6 +658,9 @@ class StrategicActionPlan(models.Model):
         default=100,
         help_text="Weight of this Action Plan KPI relative to other KPI per strategic cycle"
     )
+    # build_label() stored for __str__, so plan pickers and admin filters read no related rows;
+    # kept current by ActionPlanLabelService when the cycle, KPI or responsible bodies change
+    label = models.TextField(blank=True, editable=False)
 
 
     class Meta:
@@ -648,9 +676,15 @@ class StrategicActionPlan(models.Model):
         if self.baseline is not None and self.target is not None:
             self.improvement_needed = self.target - self.baseline
 
-        super().save(*args, **kwargs)
+        self.label = self.build_label()
+        # Atomic so the signal rewriting the reports' stored metrics commits with the plan
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def responsible_bodies_display(self):
+        # A new plan has no responsible bodies until it is saved
+        if self.pk is None:
+            return ""
         return ", ".join([str(s) for s in self.responsible_bodies.all()])
 
     def get_full_display(self):
@@ -669,6 +703,9 @@ class StrategicActionPlan(models.Model):
 
     def __str__(self):
         """Single-line label for dropdown"""
+        return self.label or self.build_label()
+
+    def build_label(self):
         if self.strategic_cycle:
             start = self.strategic_cycle.start_date.strftime("%B %d, %Y") if self.strategic_cycle.start_date else "N/A"
             end = self.strategic_cycle.end_date.strftime("%B %d, %Y") if self.strategic_cycle.end_date else "N/A"
@@ -677,8 +714,9 @@ class StrategicActionPlan(models.Model):
             cycle_name = "N/A"
 
         kpi = self.strategy_hierarchy.kpi if self.strategy_hierarchy else "N/A"
-        baseline = self.baseline or 0
-        target = self.target or 0
+        # As read back from the database, whatever was assigned before saving
+        baseline = Decimal(str(self.baseline)).quantize(Decimal('0.01')) if self.baseline else 0
+        target = Decimal(str(self.target)).quantize(Decimal('0.01')) if self.target else 0
         responsible = self.responsible_bodies_display() or "N/A"
 
         return f"{cycle_name} | KPI: {kpi} | Baseline: {baseline} | Target: {target} | Responsible: {responsible}"
@@ -770,6 +808,8 @@ class InitiativeReport(models.Model):
         ('Low', 'Low'),
         ('Very Low', 'Very Low'),
     ]
+    # Score (%) of each level, for status_achievement_percent
+    STATUS_SCORES = {'Very Low': 20, 'Low': 40, 'Medium': 60, 'High': 80, 'Very High': 100}
 
     organization_name = models.ForeignKey(
         'OrganizationalProfile', on_delete=models.PROTECT
@@ -810,9 +850,14 @@ class InitiativeReport(models.Model):
     def budget_remaining(self):
         return max(self.planned_budget - self.total_budget_spent, 0)
 
+    @staticmethod
+    def _percent(used, planned):
+        """used / planned in %, halves rounded up like the database rounds them (see InitiativeReportMetricsService)."""
+        return (used / planned * 100).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP) if planned else 0
+
     @property
     def budget_utilization_percent(self):
-        return round((self.total_budget_spent / self.planned_budget) * 100, 1) if self.planned_budget else 0
+        return self._percent(self.total_budget_spent, self.planned_budget)
 
     @property
     def planned_hr(self):
@@ -824,7 +869,7 @@ class InitiativeReport(models.Model):
 
     @property
     def hr_utilization_percent(self):
-        return round((self.total_actual_hr / self.planned_hr) * 100, 1) if self.planned_hr else 0
+        return self._percent(self.total_actual_hr, self.planned_hr)
 
     @property
     def remaining_days(self):
@@ -846,7 +891,7 @@ class InitiativeReport(models.Model):
         """
         Calculates achievement percent based on baseline -> target mapping.
         """
-        mapping = {'Very Low': 20, 'Low': 40, 'Medium': 60, 'High': 80, 'Very High': 100}
+        mapping = self.STATUS_SCORES
         baseline = mapping.get(getattr(self.initiative_planning, 'baseline_status', 'Medium'), 0)
         target = mapping.get(getattr(self.initiative_planning, 'target_status', 'High'), 100)
         achieved = mapping.get(self.achieved_status, 0)
@@ -884,6 +929,8 @@ class InitiativeResourceItemPlan(models.Model):
     resource_required = models.DecimalField(
         max_digits=12, decimal_places=2, default=0, validators=[MinValueValidator(0)]
     )
+    # Sum of the plan's reports, kept up to date by InitiativeResourceUsageService
+    resource_used_total = models.DecimalField(max_digits=14, decimal_places=2, default=0, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -915,8 +962,8 @@ class InitiativeResourceItemReport(models.Model):
 
     @property
     def total_used(self):
-        """Total used resource for this plan, summing all reports."""
-        return self.initiative_resource_plan.reports.aggregate(total=models.Sum('resource_used'))['total'] or 0
+        """Total used resource for this plan, summing all reports (maintained on the plan)."""
+        return self.initiative_resource_plan.resource_used_total or 0
 
     @property
     def remaining(self):
@@ -994,6 +1041,228 @@ class StrategicReport(models.Model):
         )
 
 
+class StrategicReportAggregate(models.Model):
+    """
+    Precomputed report totals per organization and cycle for the strategic report dashboard.
+    Rows with an empty responsible_body count every report once; rows with a body name
+    count each report once per responsible body of its action plan.
+    Maintained by StrategicReportAnalyticsService.refresh_cycle.
+    """
+    organization_name = models.ForeignKey(OrganizationalProfile, on_delete=models.CASCADE)
+    strategic_cycle = models.ForeignKey(
+        StrategicCycle, on_delete=models.CASCADE, related_name='report_aggregates'
+    )
+    responsible_body = models.CharField(max_length=200, blank=True, default='')
+    status = models.CharField(max_length=20)
+    strategic_perspective = models.CharField(max_length=100)
+    focus_area = models.CharField(max_length=100)
+    objective = models.CharField(max_length=100)
+    kpi = models.CharField(max_length=100)
+
+    report_count = models.PositiveIntegerField(default=0)
+    percent_achieved_sum = models.DecimalField(max_digits=30, decimal_places=2, default=0)
+    weighted_score_sum = models.DecimalField(max_digits=30, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Strategic Report Aggregate"
+        verbose_name_plural = "Strategic Report Aggregates"
+        indexes = [
+            models.Index(fields=['organization_name', 'strategic_cycle', 'responsible_body']),
+        ]
+
+    def __str__(self):
+        return f"{self.strategic_cycle_id} | {self.responsible_body or 'All'} | {self.kpi} ({self.report_count})"
+
+
+class StrategicScorecard(models.Model):
+    """
+    Composite score of a strategic cycle: the weighted_score of each action plan's latest report,
+    summed over the whole cycle (empty perspective and focus area), per perspective (empty focus
+    area) and per perspective and focus area (pillar). weight_total sums the plans' weights,
+    which should come to WEIGHT_TOTAL over the cycle.
+    Maintained by StrategicScorecardService.refresh_cycle.
+    """
+    WEIGHT_TOTAL = Decimal(100)
+
+    organization_name = models.ForeignKey(OrganizationalProfile, on_delete=models.CASCADE)
+    strategic_cycle = models.ForeignKey(
+        StrategicCycle, on_delete=models.CASCADE, related_name='scorecards'
+    )
+    strategic_perspective = models.CharField(max_length=100, blank=True, default='')
+    focus_area = models.CharField(max_length=100, blank=True, default='')
+
+    plan_count = models.PositiveIntegerField(default=0)
+    reported_plan_count = models.PositiveIntegerField(default=0)
+    weight_total = models.DecimalField(max_digits=30, decimal_places=2, default=0)
+    composite_score = models.DecimalField(max_digits=30, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Strategic Scorecard"
+        verbose_name_plural = "Strategic Scorecards"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['strategic_cycle', 'strategic_perspective', 'focus_area'],
+                name='unique_strategic_scorecard_scope',
+            ),
+        ]
+
+    @property
+    def weights_balanced(self):
+        return self.weight_total == self.WEIGHT_TOTAL
+
+    def __str__(self):
+        scope = " / ".join(filter(None, [self.strategic_perspective, self.focus_area])) or 'Cycle'
+        return f"{self.strategic_cycle_id} | {scope} | {self.composite_score} ({self.weight_total}%)"
+
+
+class CodeSequence(models.Model):
+    """
+    Last number handed out for a code prefix (e.g. "STK-ACM-JOH" for stakeholder codes).
+    The prefix already embeds the organization's prefix, and codes are unique across
+    organizations, so organizations sharing a prefix also share its counter.
+    Maintained by SequenceService.
+    """
+    prefix = models.CharField(max_length=50, unique=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Code Sequence"
+        verbose_name_plural = "Code Sequences"
+
+    def __str__(self):
+        return f"{self.prefix} | {self.last_value}"
+
+
+class OrganizationDataVersion(models.Model):
+    """
+    Counter bumped after every committed write to an organization's dashboard data.
+    Cached chart pages are keyed by it, so a new version makes every older entry unreachable,
+    and background exports (ExportJob) are only reused while it is unchanged.
+    Maintained by ChartCacheService.
+    """
+    organization_name = models.OneToOneField(
+        OrganizationalProfile, on_delete=models.CASCADE, related_name='data_version'
+    )
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Organization Data Version"
+        verbose_name_plural = "Organization Data Versions"
+
+    def __str__(self):
+        return f"{self.organization_name} | v{self.version}"
+
+
+def export_job_upload_to(instance, filename):
+    return f"exports/{instance.organization_name_id}/{instance.token}/{filename}"
+
+
+class ExportJob(models.Model):
+    """
+    An Excel export built in the background by the run_export_jobs worker.
+    Jobs record the organization data version they were requested at, so an identical
+    request is served by the existing job until the organization's data changes.
+    Managed by ExportJobService.
+    """
+    EXPORT_TYPES = [
+        ('strategic_report', 'Strategic Reports'),
+        ('strategic_action_plan', 'Strategic Action Plan'),
+        ('stakeholder', 'Stakeholders'),
+        ('initiative_report', 'Initiative Reports'),
+        ('swot_analysis', 'SWOT Analysis'),
+        ('risk_management', 'Risk Management'),
+    ]
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    organization_name = models.ForeignKey(
+        OrganizationalProfile, on_delete=models.CASCADE, related_name='export_jobs'
+    )
+    requested_by = models.ForeignKey(CustomUser, on_delete=models.SET_NULL, null=True, blank=True)
+    token = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    export_type = models.CharField(max_length=50, choices=EXPORT_TYPES)
+    params = models.JSONField(default=dict, blank=True)
+    params_key = models.CharField(max_length=32)
+    data_version = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    progress = models.PositiveSmallIntegerField(default=0)
+    rows_written = models.PositiveIntegerField(default=0)
+    file = models.FileField(upload_to=export_job_upload_to, max_length=255, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Last sign of life of the worker running the job, refreshed as it writes rows
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Export Job"
+        verbose_name_plural = "Export Jobs"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['organization_name', 'export_type', 'params_key', 'data_version']),
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_export_type_display()} | {self.organization_name} | {self.status}"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
+
+
+class SearchDocument(models.Model):
+    """
+    Searchable text of one stakeholder, report, SWOT entry or risk: its title, the text of
+    the fields the list views search (joined fields included) and the page it links to.
+    On SQLite a full-text (FTS5) table over title and body is kept in sync with this table
+    by triggers; on PostgreSQL a generated search_vector column, which the model does not
+    declare, holds their tsvector. Maintained by SearchIndexService.
+    """
+    KIND_CHOICES = [
+        ('stakeholder', 'Stakeholder'),
+        ('strategic_report', 'Strategic Report'),
+        ('initiative_report', 'Initiative Report'),
+        ('swot_analysis', 'SWOT Analysis'),
+        ('swot_report', 'SWOT Report'),
+        ('risk', 'Risk'),
+    ]
+
+    organization_name = models.ForeignKey(
+        OrganizationalProfile, on_delete=models.CASCADE, related_name='search_documents'
+    )
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=255)
+
+    class Meta:
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_document'),
+        ]
+        indexes = [
+            models.Index(fields=['organization_name', 'kind']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} | {self.title}"
+
+
 class SwotReport(models.Model):
     SWOT_TYPES = [
         ('Strength', 'Strength'),
@@ -0,0 +1,42 @@
+from django.db.models import Prefetch
+
+from management_project.models import Stakeholder, StrategicActionPlan
+
+
+class ActionPlanLabelService:
+    """
+    Action plan labels without a query per plan.
+
+    A plan's label shows its cycle, KPI, baseline, target and responsible bodies. __str__ reads
+    the stored StrategicActionPlan.label, which refresh() rewrites whenever one of those related
+    rows changes (see signals), so a <select>, admin filter or list cell needs no related rows.
+    Pickers that render the multi-line dropdown_label_lines() load their plans through
+    picker_queryset(), which fetches the cycle, KPI and responsible bodies up front.
+    """
+
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def picker_queryset(queryset=None):
+        """`queryset` (every plan by default) with the rows of the plan labels fetched in two queries."""
+        if queryset is None:
+            queryset = StrategicActionPlan.objects.all()
+        return queryset.select_related('strategic_cycle', 'strategy_hierarchy').prefetch_related(
+            Prefetch(
+                'responsible_bodies',
+                queryset=Stakeholder.objects.only('pk', 'stakeholder_name', 'primary_role'),
+            )
+        )
+
+    @classmethod
+    def refresh(cls, plans):
+        """Rewrite the stale labels among `plans` (a queryset); returns the number rewritten."""
+        stale = []
+        for plan in cls.picker_queryset(plans.order_by('pk')).iterator(chunk_size=cls.BATCH_SIZE):
+            label = plan.build_label()
+            if plan.label != label:
+                plan.label = label
+                stale.append(plan)
+        # bulk_update sends no post_save, so the plans' own signals do not fire again
+        StrategicActionPlan.objects.bulk_update(stale, ['label'], batch_size=cls.BATCH_SIZE)
+        return len(stale)
@@ -0,0 +1,115 @@
+import heapq
+import re
+from bisect import bisect_left
+from functools import cached_property
+from types import MappingProxyType
+
+
+class CatalogIndex:
+    """
+    Read-only lookup tables over one of the nested choice catalogs (the *_HIERARCHY and
+    SECTOR_*_MAP literals of the choices services), compiled the first time it is used.
+
+    A catalog nests dicts down to either a list of names or a dict of {name: detail}, e.g.
+    perspective -> pillar -> objective -> {kpi: formula}. The index flattens it into:
+      choices  {path: ((name, name), ...)}  the form choices below each path, () being the top
+      members  {path: frozenset(names)}     membership checks
+      details  {path: detail}               the detail of a full path (formula, mitigation)
+      leaves   ((path, detail), ...)        every full path, for search()
+    Every table is immutable, so the cached tuples can be handed straight to form fields.
+    """
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    @cached_property
+    def _tables(self):
+        choices, details, leaves = {}, {}, []
+        pending = [((), self._catalog)]
+        while pending:
+            path, node = pending.pop()
+            names = tuple(node)
+            choices[path] = tuple((name, name) for name in names)
+            if not isinstance(node, dict):
+                leaves.extend((path + (name,), "") for name in names)
+                continue
+            for name, child in node.items():
+                if isinstance(child, (dict, list, tuple)):
+                    pending.append((path + (name,), child))
+                else:
+                    details[path + (name,)] = child
+                    leaves.append((path + (name,), child))
+        return {
+            'choices': MappingProxyType(choices),
+            'members': MappingProxyType({
+                path: frozenset(name for name, _ in names) for path, names in choices.items()
+            }),
+            'details': MappingProxyType(details),
+            'leaves': tuple(sorted(leaves)),
+        }
+
+    def choices(self, *path):
+        """Form choices below `path` (the top level without arguments); () for unknown paths."""
+        return self._tables['choices'].get(path, ())
+
+    def contains(self, name, *path):
+        return name in self._tables['members'].get(path, ())
+
+    def detail(self, *path, default=""):
+        return self._tables['details'].get(path, default)
+
+    # -------------------- Search --------------------
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    @cached_property
+    def _tokens(self):
+        """(sorted tokens, {token: frozenset(leaf positions)}) over every name and detail of each leaf."""
+        postings = {}
+        for position, (path, detail) in enumerate(self._tables['leaves']):
+            for token in set(self.tokenize(" ".join((*path, detail)))):
+                postings.setdefault(token, set()).add(position)
+        return tuple(sorted(postings)), MappingProxyType(
+            {token: frozenset(positions) for token, positions in postings.items()}
+        )
+
+    def _prefix_matches(self, word):
+        """Leaf positions having a token that starts with `word`."""
+        tokens, postings = self._tokens
+        matches = set()
+        for index in range(bisect_left(tokens, word), len(tokens)):
+            if not tokens[index].startswith(word):
+                break
+            matches |= postings[tokens[index]]
+        return matches
+
+    def search(self, query, limit=20):
+        """
+        Leaves ((path, detail), ...) matching every word of `query` as a word prefix anywhere
+        in the path or detail. Leaves whose own name matches come first.
+        """
+        words = self.tokenize(query)
+        if not words:
+            return []
+        # Rarest words first keeps the intersection small
+        candidates = None
+        for matches in sorted((self._prefix_matches(word) for word in set(words)), key=len):
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+
+        leaves = self._tables['leaves']
+        query_text = " ".join(words)
+
+        def rank(position):
+            path, _ = leaves[position]
+            name = path[-1].lower()
+            name_tokens = self.tokenize(name)
+            in_name = all(any(token.startswith(word) for token in name_tokens) for word in words)
+            return (not name.startswith(query_text), not in_name, len(name), position)
+
+        return [leaves[position] for position in heapq.nsmallest(limit, candidates, key=rank)]
@@ -0,0 +1,78 @@
+import hashlib
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from management_project.models import OrganizationDataVersion
+from management_project.services.commit_hooks import CommitHookService
+
+CHART_CACHE_TIMEOUT = getattr(settings, 'CHART_CACHE_TIMEOUT', 3600)
+
+
+class ChartCacheService:
+    """
+    Caches the computed context (ORM results and serialized Plotly figures) of the chart views.
+
+    Entries are keyed by (view, organization, filter params, organization data version).
+    Writes to the organization's dashboard data bump the version once their transaction
+    commits, so later requests miss and rebuild while the old entries simply expire.
+    The version lives in the database so every worker process sees the same value.
+    """
+
+    # -------------------- Data version --------------------
+
+    @classmethod
+    def data_version(cls, organization_id):
+        version = OrganizationDataVersion.objects.filter(
+            organization_name_id=organization_id
+        ).values_list('version', flat=True).first()
+        return version or 0
+
+    @classmethod
+    def schedule_bump(cls, organization_id):
+        """
+        Bump the organization's data version once the surrounding transaction commits
+        (immediately outside a transaction). Repeated writes in one transaction bump once.
+        """
+        if not organization_id:
+            return
+        CommitHookService.schedule_once(('chart_data_version', organization_id), partial(cls.bump, organization_id))
+
+    @classmethod
+    def bump(cls, organization_id):
+        updated = OrganizationDataVersion.objects.filter(organization_name_id=organization_id).update(
+            version=F('version') + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            OrganizationDataVersion.objects.get_or_create(
+                organization_name_id=organization_id, defaults={'version': 1}
+            )
+
+    # -------------------- Cached contexts --------------------
+
+    @staticmethod
+    def cache_key(view_name, organization_id, version, params):
+        query = urlencode(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+        digest = hashlib.md5(query.encode('utf-8')).hexdigest()
+        return f"chart:{view_name}:{organization_id}:{version}:{digest}"
+
+    @classmethod
+    def get_or_build(cls, view_name, organization, params, build):
+        """
+        Return the cached context for (view, organization, params) at the current data version,
+        calling build() and storing its result on a miss. build() must return a picklable dict.
+        """
+        if organization is None:
+            return build()
+
+        key = cls.cache_key(view_name, organization.pk, cls.data_version(organization.pk), params)
+        context = cache.get(key)
+        if context is None:
+            context = build()
+            cache.set(key, context, CHART_CACHE_TIMEOUT)
+        return context
+
@@ -0,0 +1,74 @@
+import hashlib
+import json
+from functools import lru_cache
+
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
+
+
+class ChartPayload:
+    """
+    Compact JSON form of a dashboard's charts, drawn in the browser by
+    static/management_project/js/charts.js with the page's single plotly.js.
+
+    A chart is either a go.Figure, of which only the traces and layout are sent, or chart data
+    made with ChartPayload.chart(), which charts.js turns into the figure itself; charts whose
+    trace count grows with the data use the latter, so the server never builds and validates
+    their figures. Layout templates (several KB each and usually identical across a dashboard)
+    are sent once per payload and referenced by key.
+    """
+
+    ENCODER = PlotlyJSONEncoder
+
+    # Chart data kinds charts.js knows how to draw (see its KINDS)
+    KINDS = ('pie', 'bars', 'bar_panels', 'bar_line', 'lines', 'boxes', 'heatmap')
+
+    @classmethod
+    def chart(cls, kind, **data):
+        """
+        Chart data for charts.js, e.g. chart('bars', x=months, series=[{'name': ..., 'y': ...}]).
+        See the matching builder in charts.js for the fields of each kind.
+        """
+        if kind not in cls.KINDS:
+            raise ValueError(f"Unknown chart kind {kind!r}.")
+        return {'kind': kind, **data}
+
+    @classmethod
+    def build(cls, figures, config=None):
+        """
+        figures: {chart name: go.Figure, chart() data or None}; None tells the client to show
+        the placeholder's empty-state message. config: Plotly config applied to every chart.
+        """
+        templates = {}
+        charts = {}
+        for name, fig in figures.items():
+            if fig is None:
+                charts[name] = None
+                continue
+            if isinstance(fig, dict):
+                # Drawn with the template go.Figure would have used, so both kinds look alike
+                charts[name] = {**fig, 'template': cls._add_template(templates, _default_template())}
+                continue
+            spec = fig.to_plotly_json()
+            layout = dict(spec.get('layout', {}))
+            template = layout.pop('template', None)
+            if template:
+                layout['template'] = cls._add_template(templates, template)
+            charts[name] = {'data': spec.get('data', []), 'layout': layout}
+        return {'templates': templates, 'charts': charts, 'config': config or {}}
+
+    @classmethod
+    def _add_template(cls, templates, template):
+        key = cls._template_key(template)
+        templates.setdefault(key, template)
+        return key
+
+    @classmethod
+    def _template_key(cls, template):
+        encoded = json.dumps(template, sort_keys=True, cls=cls.ENCODER)
+        return hashlib.md5(encoded.encode('utf-8')).hexdigest()[:12]
+
+
+@lru_cache(maxsize=1)
+def _default_template():
+    return pio.templates[pio.templates.default].to_plotly_json()
@@ -0,0 +1,130 @@
+import hashlib
+import json
+from functools import lru_cache
+
+from management_project.services.catalog_index import CatalogIndex
+from management_project.services.initiative import InitiativePlanningChoicesService
+from management_project.services.risk_management import RiskChoicesService
+from management_project.services.strategy_hierarchy import StrategyHierarchyChoicesService
+from management_project.services.swot import SwotChoicesService
+
+_strategy_hierarchy = StrategyHierarchyChoicesService()
+
+
+class ChoiceCatalogService:
+    """
+    The static cascading-choice catalogs (strategy hierarchy, SWOT, initiative planning, risk)
+    served level by level to the form dropdowns.
+
+    A catalog is a list of levels (form field names) with one getter per level, taking the
+    values selected at the levels above it. A catalog may also have details, values looked up
+    once every level is selected (e.g. the KPI formula). Every full path can also be searched
+    by word prefix (typeahead). Answers only depend on the code, so they are cached per
+    process and carry a strong ETag derived from their content.
+    """
+
+    SEARCH_LIMIT = 20
+
+    CATALOGS = {
+        'strategy-hierarchy': {
+            'levels': ('strategic_perspective', 'focus_area', 'objective', 'kpi'),
+            'getters': (
+                _strategy_hierarchy.get_perspective_choices,
+                _strategy_hierarchy.get_pillar_choices,
+                _strategy_hierarchy.get_objective_choices,
+                _strategy_hierarchy.get_kpi_choices,
+            ),
+            'details': {'formula': _strategy_hierarchy.get_formula},
+            'index': StrategyHierarchyChoicesService.INDEX,
+        },
+        'swot': {
+            'levels': ('swot_type', 'swot_pillar', 'swot_factor'),
+            'getters': (
+                SwotChoicesService.get_swot_type_choices,
+                SwotChoicesService.get_pillar_choices,
+                SwotChoicesService.get_factor_choices,
+            ),
+            'details': {},
+            'index': SwotChoicesService.INDEX,
+        },
+        'initiative-planning': {
+            'levels': ('initiative_focus_area', 'initiative_dimension'),
+            'getters': (
+                InitiativePlanningChoicesService.get_initiative_focus_area_choices,
+                InitiativePlanningChoicesService.get_area_choices,
+            ),
+            'details': {},
+            'index': InitiativePlanningChoicesService.INDEX,
+        },
+        'risk': {
+            'levels': ('risk_category', 'risk_name'),
+            'getters': (
+                RiskChoicesService.get_risk_category_choices,
+                RiskChoicesService.get_risk_name_choices,
+            ),
+            'details': {'mitigation_action': RiskChoicesService.get_mitigation_action},
+            'index': RiskChoicesService.INDEX,
+        },
+    }
+
+    @classmethod
+    def selected_path(cls, catalog, params):
+        """Values selected from the top level down, stopping at the first empty level."""
+        path = []
+        for level in cls.CATALOGS[catalog]['levels']:
+            value = params.get(level, '')
+            if not value:
+                break
+            path.append(value)
+        return tuple(path)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def options(cls, catalog, path):
+        """
+        (body, etag) of the JSON answer for `path`:
+        {"level": field to fill or null, "choices": [[value, label], ...], "details": {...}}.
+        """
+        definition = cls.CATALOGS[catalog]
+        levels = definition['levels']
+        if len(path) < len(levels):
+            payload = {
+                'level': levels[len(path)],
+                'choices': [list(choice) for choice in definition['getters'][len(path)](*path)],
+                'details': {},
+            }
+        else:
+            payload = {
+                'level': None,
+                'choices': [],
+                'details': {name: getter(*path) for name, getter in definition['details'].items()},
+            }
+        return cls._encode(payload)
+
+    @classmethod
+    def search_query(cls, query):
+        """Normalized form of a typeahead query, so equivalent queries share one cache entry."""
+        return " ".join(CatalogIndex.tokenize(query))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def search(cls, catalog, query, limit=SEARCH_LIMIT):
+        """
+        (body, etag) of the typeahead answer for a normalized `query`:
+        {"results": [{"values": {level: value, ...}, "label": "...", "detail": "..."}, ...]}.
+        """
+        levels = cls.CATALOGS[catalog]['levels']
+        results = [
+            {
+                'values': dict(zip(levels, path)),
+                'label': " › ".join(path),
+                'detail': detail,
+            }
+            for path, detail in cls.CATALOGS[catalog]['index'].search(query, limit)
+        ]
+        return cls._encode({'results': results})
+
+    @staticmethod
+    def _encode(payload):
+        body = json.dumps(payload, separators=(',', ':')).encode()
+        return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
@@ -0,0 +1,50 @@
+import weakref
+
+from django.db import transaction
+
+
+class CommitHookService:
+    """
+    transaction.on_commit() callbacks that run once per key and transaction, however many
+    writes schedule them (e.g. a cascade deleting many reports of one cycle).
+
+    Each connection keeps the scheduled keys in its own set. A key leaves the set when its
+    callback runs, so the next transaction schedules it again. Django drops the callbacks of a
+    rolled back transaction or savepoint without running them, so the set holds the callbacks
+    by weak reference: a dropped callback leaves the set with it, and the key can be scheduled
+    again in the same transaction.
+    """
+
+    @classmethod
+    def schedule_once(cls, key, func, using=None):
+        """Run func() once the surrounding transaction commits, unless `key` is already scheduled."""
+        scheduled = cls._scheduled(transaction.get_connection(using))
+        if key in scheduled:
+            return
+        callback = _Callback(scheduled, key, func)
+        # Added before on_commit(), which runs the callback immediately outside a transaction
+        scheduled[key] = callback
+        transaction.on_commit(callback, using=using)
+
+    @staticmethod
+    def _scheduled(connection):
+        try:
+            return connection.scheduled_commit_hooks
+        except AttributeError:
+            connection.scheduled_commit_hooks = weakref.WeakValueDictionary()
+            return connection.scheduled_commit_hooks
+
+
+class _Callback:
+    """on_commit callback that leaves its connection's scheduled set before calling func()."""
+
+    def __init__(self, scheduled, key, func):
+        self.scheduled = scheduled
+        self.key = key
+        self.func = func
+
+    def __call__(self):
+        # Removed first, so func() itself may schedule the same key for a later commit
+        if self.scheduled.get(self.key) is self:
+            del self.scheduled[self.key]
+        self.func()
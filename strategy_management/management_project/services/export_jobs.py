@@ -0,0 +1,248 @@
+import hashlib
+import logging
+import tempfile
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.core.files import File
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.utils.http import urlencode
+from django.utils.module_loading import import_string
+
+from management_project.models import ExportJob
+from management_project.services.chart_cache import ChartCacheService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_JOB_STALE_AFTER = getattr(settings, 'EXPORT_JOB_STALE_AFTER', 600)
+EXPORT_JOB_RETENTION = getattr(settings, 'EXPORT_JOB_RETENTION', 7 * 24 * 3600)
+
+
+class ExportJobService:
+    """
+    Database-backed queue for Excel exports built outside the request cycle.
+
+    Export views enqueue a job instead of building the workbook when called with ?background=1;
+    the run_export_jobs worker claims queued jobs, builds them with the same builder function the
+    view uses and stores the file under MEDIA_ROOT/exports/. A request identical to an existing
+    job (same organization, export, parameters and organization data version) reuses that job,
+    so repeated clicks and different users share one file until the organization's data changes.
+
+    A running job belongs to the worker that claimed it at its started_at. The worker refreshes
+    the job's heartbeat_at as it writes rows; a job whose heartbeat stops is queued again for
+    another worker, and the first worker's later writes no longer touch it. Finished jobs and
+    their files are deleted EXPORT_JOB_RETENTION seconds after they finished.
+    """
+
+    # export_type -> builder(organization, params, progress=None) returning an ExcelExport
+    BUILDERS = {
+        'strategic_report': 'management_project.views.strategic_report.build_strategic_report_export',
+        'strategic_action_plan': 'management_project.views.strategic_action_plan.build_strategic_action_plan_export',
+        'stakeholder': 'management_project.views.stakeholder.build_stakeholder_export',
+        'initiative_report': 'management_project.views.initiative_report.build_initiative_report_export',
+        'swot_analysis': 'management_project.views.swot_analysis.build_swot_analysis_export',
+        'risk_management': 'management_project.views.risk_management.build_risk_management_export',
+    }
+
+    # Query parameters that never change the exported data
+    IGNORED_PARAMS = ('background', 'page')
+
+    # -------------------- Enqueue --------------------
+
+    @staticmethod
+    def params_key(params):
+        query = urlencode(sorted((str(name), str(value)) for name, value in params.items()))
+        return hashlib.md5(query.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def request_params(cls, request, view_kwargs):
+        """Export parameters of a request: its query string plus the view's URL kwargs."""
+        params = {
+            name: value for name, value in request.GET.items()
+            if name not in cls.IGNORED_PARAMS and value != ''
+        }
+        params.update({name: str(value) for name, value in view_kwargs.items()})
+        return params
+
+    @classmethod
+    def enqueue(cls, organization, export_type, params, user=None):
+        """
+        Return (job, created). An unfinished job, or a finished one whose file still exists,
+        for the same export at the current data version is returned instead of a new job.
+        """
+        version = ChartCacheService.data_version(organization.pk)
+        key = cls.params_key(params)
+        existing = (
+            ExportJob.objects.filter(
+                organization_name=organization, export_type=export_type,
+                params_key=key, data_version=version,
+            )
+            .exclude(status=ExportJob.STATUS_FAILED)
+            .order_by('-created_at')
+            .first()
+        )
+        if existing and (existing.status != ExportJob.STATUS_DONE or cls.file_exists(existing)):
+            return existing, False
+
+        job = ExportJob.objects.create(
+            organization_name=organization, requested_by=user, export_type=export_type,
+            params=params, params_key=key, data_version=version,
+        )
+        return job, True
+
+    @staticmethod
+    def file_exists(job):
+        return bool(job.file) and job.file.storage.exists(job.file.name)
+
+    # -------------------- Worker --------------------
+
+    @staticmethod
+    def requeue_stale():
+        """
+        Queue again the running jobs without a heartbeat for more than EXPORT_JOB_STALE_AFTER
+        seconds, whose worker was presumably killed or redeployed before it could finish them.
+        Returns their number.
+        """
+        cutoff = timezone.now() - timedelta(seconds=EXPORT_JOB_STALE_AFTER)
+        requeued = ExportJob.objects.filter(status=ExportJob.STATUS_RUNNING, heartbeat_at__lt=cutoff).update(
+            status=ExportJob.STATUS_QUEUED, started_at=None, heartbeat_at=None, progress=0, rows_written=0
+        )
+        if requeued:
+            logger.warning("Re-queued %s stale export job(s)", requeued)
+        return requeued
+
+    @classmethod
+    def claim_next(cls):
+        """
+        Mark the oldest queued job as running and return it (None when the queue is empty).
+        The conditional update lets several workers share the queue without claiming a job twice.
+        Stale running jobs are queued again first, so a job never stays running forever.
+        """
+        cls.requeue_stale()
+        while True:
+            job_id = (
+                ExportJob.objects.filter(status=ExportJob.STATUS_QUEUED)
+                .order_by('created_at', 'id')
+                .values_list('id', flat=True)
+                .first()
+            )
+            if job_id is None:
+                return None
+            now = timezone.now()
+            claimed = ExportJob.objects.filter(pk=job_id, status=ExportJob.STATUS_QUEUED).update(
+                status=ExportJob.STATUS_RUNNING, started_at=now, heartbeat_at=now
+            )
+            if claimed:
+                return ExportJob.objects.select_related('organization_name').get(pk=job_id)
+
+    @staticmethod
+    def claimed(job):
+        """The job's row while it is still running under the claim `job` was loaded with."""
+        return ExportJob.objects.filter(pk=job.pk, status=ExportJob.STATUS_RUNNING, started_at=job.started_at)
+
+    @classmethod
+    def run(cls, job):
+        """
+        Build the job's workbook and store it on the job, recording failures instead of raising.
+        When the job was queued again and claimed by another worker meanwhile, its row is left
+        to that worker and the file built here is deleted. Returns the job as stored.
+        """
+        try:
+            builder = import_string(cls.BUILDERS[job.export_type])
+            export = builder(job.organization_name, job.params, progress=_ProgressReporter(job))
+            with tempfile.TemporaryFile() as handle:
+                export.save(handle)
+                job.file.save(export.filename, File(handle), save=False)
+        except Exception as exc:
+            logger.exception("Export job %s failed", job.pk)
+            finished = cls.claimed(job).update(
+                status=ExportJob.STATUS_FAILED, error=str(exc) or exc.__class__.__name__,
+                finished_at=timezone.now(),
+            )
+        else:
+            finished = cls.claimed(job).update(
+                status=ExportJob.STATUS_DONE, progress=100, rows_written=export.rows_written,
+                file=job.file.name, finished_at=timezone.now(),
+            )
+            if not finished:
+                job.file.delete(save=False)
+
+        if not finished:
+            logger.warning("Export job %s was claimed by another worker; dropped this run's result", job.pk)
+        job.refresh_from_db()
+        return job
+
+    @classmethod
+    def run_pending(cls, limit=None):
+        """Run queued jobs until the queue is empty (or `limit` jobs ran); return how many ran."""
+        count = 0
+        while limit is None or count < limit:
+            job = cls.claim_next()
+            if job is None:
+                break
+            cls.run(job)
+            count += 1
+        return count
+
+    @staticmethod
+    def purge_expired():
+        """
+        Delete the jobs finished more than EXPORT_JOB_RETENTION seconds ago, and their files.
+        Returns the number of jobs deleted.
+        """
+        cutoff = timezone.now() - timedelta(seconds=EXPORT_JOB_RETENTION)
+        expired = ExportJob.objects.filter(
+            status__in=[ExportJob.STATUS_DONE, ExportJob.STATUS_FAILED], finished_at__lt=cutoff,
+        )
+        count = 0
+        for job in expired.only('pk', 'file').iterator():
+            if job.file:
+                job.file.delete(save=False)
+            job.delete()
+            count += 1
+        if count:
+            logger.info("Deleted %s expired export job(s)", count)
+        return count
+
+
+class _ProgressReporter:
+    """
+    ExcelExport progress callback that stores the job's progress and heartbeat on its row,
+    as long as the job is still running under this worker's claim.
+    """
+
+    def __init__(self, job):
+        self.job = job
+
+    def __call__(self, done, total):
+        values = {'rows_written': done, 'heartbeat_at': timezone.now()}
+        if total:
+            # 100 is reserved for the finished file
+            values['progress'] = min(99, done * 100 // total)
+        ExportJobService.claimed(self.job).update(**values)
+
+
+# -------------------- Decorator --------------------
+
+
+def background_export(export_type):
+    """
+    Let an export view run as a background job: with ?background=1 the export is enqueued
+    (or matched to an identical job) and the user is redirected to the job's progress page.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            organization = request.user.organization_name
+            if request.GET.get('background') != '1' or organization is None:
+                return view_func(request, *args, **kwargs)
+
+            params = ExportJobService.request_params(request, kwargs)
+            job, _ = ExportJobService.enqueue(organization, export_type, params, user=request.user)
+            return redirect('export_job_detail', token=job.token)
+
+        return _wrapped_view
+    return decorator
@@ -1,3 +1,6 @@
+from management_project.services.catalog_index import CatalogIndex
+
+
 class InitiativePlanningChoicesService:
     """
     Enterprise-grade initiative_planning hierarchy:
@@ -384,10 +387,12 @@ class InitiativePlanningChoicesService:
         ],
     }
 
+    INDEX = CatalogIndex(INITIATIVE_HIERARCHY)
+
     @classmethod
     def get_initiative_focus_area_choices(cls):
-        return [(p, p) for p in cls.INITIATIVE_HIERARCHY.keys()]
+        return cls.INDEX.choices()
 
     @classmethod
     def get_area_choices(cls, initiative_focus_area):
-        return [(a, a) for a in cls.INITIATIVE_HIERARCHY.get(initiative_focus_area, [])]
\ No newline at end of file
+        return cls.INDEX.choices(initiative_focus_area)
\ No newline at end of file
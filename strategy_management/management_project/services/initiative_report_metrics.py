@@ -0,0 +1,108 @@
+from django.db.models import Avg, Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, Greatest, Least, Round
+from django.db.models.lookups import GreaterThanOrEqual
+
+from management_project.models import InitiativeReport
+
+
+class InitiativeReportMetricsService:
+    """
+    The InitiativeReport calculated properties (planned_budget, budget_utilization_percent,
+    hr_utilization_percent, status_achievement_percent, ...) as database expressions, so the
+    initiative dashboard gets its per-report figures from one values() query and its headline
+    KPIs and performer buckets from one aggregate row instead of evaluating properties per row.
+    """
+
+    # status_achievement_percent bounds of the performer buckets
+    HIGH_PERFORMER_PERCENT = 80
+    MODERATE_PERFORMER_PERCENT = 60
+
+    # -------------------- Per-report expressions --------------------
+
+    @staticmethod
+    def _float(expression):
+        return Cast(expression, FloatField())
+
+    @classmethod
+    def _utilization(cls, used_field, planned_field):
+        """round(used / planned * 100, 1), or 0 without a plan, as the model properties compute it."""
+        return Case(
+            When(
+                **{f'{planned_field}__gt': 0},
+                then=Round(cls._float(used_field) * 100.0 / cls._float(planned_field), 1),
+            ),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+    @staticmethod
+    def _status_score(field_name, default):
+        return Case(
+            *[When(**{field_name: level}, then=Value(score)) for level, score in InitiativeReport.STATUS_SCORES.items()],
+            default=Value(default),
+        )
+
+    @classmethod
+    def annotations(cls):
+        """{name: expression} of the per-report metrics; names avoid the model's property names."""
+        baseline = cls._status_score('initiative_planning__baseline_status', 0)
+        target = cls._status_score('initiative_planning__target_status', 100)
+        achieved = cls._status_score('achieved_status', 0)
+        achievement = Case(
+            When(GreaterThanOrEqual(baseline, target), then=Value(100.0)),
+            default=Greatest(
+                Value(0.0),
+                Least(
+                    Value(100.0),
+                    Round((achieved - baseline) * 100.0 / (target - baseline), 1, output_field=FloatField()),
+                ),
+            ),
+            output_field=FloatField(),
+        )
+        return {
+            'budget_planned': Coalesce(cls._float('initiative_planning__total_budget_planned'), Value(0.0)),
+            'budget_spent': cls._float('total_budget_spent'),
+            'hr_planned': Coalesce(cls._float('initiative_planning__total_hr_planned'), Value(0.0)),
+            'hr_used': cls._float('total_actual_hr'),
+            'budget_utilization': cls._utilization('total_budget_spent', 'initiative_planning__total_budget_planned'),
+            'hr_utilization': cls._utilization('total_actual_hr', 'initiative_planning__total_hr_planned'),
+            'achievement': achievement,
+        }
+
+    @classmethod
+    def rows(cls, reports):
+        """One dict per report with the initiative name and the metrics of annotations()."""
+        annotations = cls.annotations()
+        return list(reports.annotate(**annotations).values(
+            'pk', *annotations, initiative_name=F('initiative_planning__initiative_name'),
+        ))
+
+    # -------------------- Aggregates --------------------
+
+    @classmethod
+    def summary(cls, reports):
+        """
+        Headline KPIs and performer buckets of `reports` in one aggregate row. Averages of
+        utilization only count reports whose initiative has a plan, as the dashboard always did.
+        """
+        annotated = reports.annotate(**cls.annotations())
+        has_budget = Q(initiative_planning__total_budget_planned__gt=0)
+        has_hr = Q(initiative_planning__total_hr_planned__gt=0)
+        totals = annotated.aggregate(
+            total_reports=Count('pk'),
+            initiative_count=Count('initiative_planning', distinct=True),
+            total_budget_planned=Sum('budget_planned'),
+            total_budget_spent=Sum('budget_spent'),
+            total_hr_planned=Sum('hr_planned'),
+            total_hr_used=Sum('hr_used'),
+            avg_budget_utilization=Avg('budget_utilization', filter=has_budget),
+            avg_hr_utilization=Avg('hr_utilization', filter=has_hr),
+            avg_achievement=Avg('achievement'),
+            high_performers=Count('pk', filter=Q(achievement__gte=cls.HIGH_PERFORMER_PERCENT)),
+            moderate_performers=Count('pk', filter=Q(
+                achievement__gte=cls.MODERATE_PERFORMER_PERCENT, achievement__lt=cls.HIGH_PERFORMER_PERCENT,
+            )),
+            low_performers=Count('pk', filter=Q(achievement__lt=cls.MODERATE_PERFORMER_PERCENT)),
+        )
+        # Empty sets aggregate to NULL
+        return {name: value or 0 for name, value in totals.items()}
@@ -0,0 +1,65 @@
+from django.db.models import F, OuterRef, Subquery, Sum, Value, Window
+from django.db.models.functions import Coalesce
+
+from management_project.models import InitiativeResourceItemPlan, InitiativeResourceItemReport
+
+
+class InitiativeResourceUsageService:
+    """
+    Resource usage of initiative resource item plans.
+
+    Each plan stores the sum of its reports (resource_used_total), refreshed by the report
+    signals, so a report's total_used, remaining and utilization_percent are read from the
+    plan row instead of aggregating the plan's reports on every access.
+    """
+
+    @staticmethod
+    def _used_total():
+        return Coalesce(
+            Subquery(
+                InitiativeResourceItemReport.objects.filter(initiative_resource_plan=OuterRef('pk'))
+                .order_by()
+                .values('initiative_resource_plan')
+                .annotate(total=Sum('resource_used'))
+                .values('total')
+            ),
+            Value(0),
+            output_field=InitiativeResourceItemPlan._meta.get_field('resource_used_total'),
+        )
+
+    @classmethod
+    def refresh(cls, plan_ids):
+        """Recompute resource_used_total of the given plans in one UPDATE."""
+        plan_ids = {plan_id for plan_id in plan_ids if plan_id}
+        if not plan_ids:
+            return 0
+        return InitiativeResourceItemPlan.objects.filter(pk__in=plan_ids).update(
+            resource_used_total=cls._used_total()
+        )
+
+    @classmethod
+    def rebuild(cls, organization=None):
+        """Recompute resource_used_total of every plan (of one organization when given)."""
+        plans = InitiativeResourceItemPlan.objects.all()
+        if organization is not None:
+            plans = plans.filter(organization=organization)
+        return plans.update(resource_used_total=cls._used_total())
+
+    @staticmethod
+    def report_queryset(organization):
+        """
+        The organization's resource item reports with their plan and initiative, annotated
+        with cumulative_used: the plan's usage up to and including each report.
+        The window runs over the filtered rows, so filter it by plan or initiative only.
+        """
+        return InitiativeResourceItemReport.objects.filter(
+            initiative_resource_plan__organization=organization
+        ).select_related(
+            'initiative_resource_plan', 'initiative_resource_plan__initiative_name'
+        ).annotate(
+            cumulative_used=Window(
+                Sum('resource_used'),
+                partition_by=[F('initiative_resource_plan')],
+                order_by=[F('report_date').asc(), F('pk').asc()],
+            )
+        )
@@ -1,4 +1,5 @@
 from management_project.models import Vision, OrganizationalProfile
+from management_project.services.catalog_index import CatalogIndex
 
 
 class MissionService:
@@ -263,18 +264,18 @@ class MissionService:
             "To lead in sustainable mining and resource management",
         ],
     }
+    INDEX = CatalogIndex(SECTOR_MISSION_MAP)
 
     def __init__(self, org_obj: OrganizationalProfile):
         self.org = org_obj
         self.sector_name = org_obj.sector_name
 
     def get_choices(self):
-        """Return list of tuples for form select."""
-        missions = self.SECTOR_MISSION_MAP.get(self.sector_name, [])
-        return [(m, m) for m in missions]
+        """Return tuple of choices for form select."""
+        return self.INDEX.choices(self.sector_name)
 
     def validate_choice(self, mission_statement):
-        if mission_statement not in self.SECTOR_MISSION_MAP.get(self.sector_name, []):
+        if not self.INDEX.contains(mission_statement, self.sector_name):
             raise ValueError(f"Invalid mission '{mission_statement}' for sector '{self.sector_name}'.")
 
     def create_mission(self, mission_statement):
@@ -1,9 +1,117 @@
-from functools import wraps
+import hashlib
+from functools import partial, wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
 from django.http import HttpResponseForbidden
 from django.contrib.auth import get_user_model
-from management_project.models import OrganizationInvitation
+from django.utils.functional import cached_property
+from management_project.models import OrganizationalProfile, OrganizationInvitation
+from management_project.services.commit_hooks import CommitHookService
 from django.contrib import messages
 
+# -------------------- Permission Cache --------------------
+
+PERMISSIONS_CACHE_TIMEOUT = getattr(settings, 'PERMISSIONS_CACHE_TIMEOUT', 300)
+
+
+def _permissions_cache_key(email, organization):
+    # The organization's permissions_version is in the key, so a bump makes every older entry
+    # unreachable in all worker processes, whatever the cache backend
+    digest = hashlib.md5(email.encode('utf-8')).hexdigest()
+    return f"permissions:{organization.pk}:{organization.permissions_version}:{digest}"
+
+
+def invalidate_organization_permissions(organization_id):
+    """
+    Bump the organization's permissions version once the surrounding transaction commits
+    (immediately outside a transaction). Called from the invitation and user signals.
+    """
+    if organization_id:
+        CommitHookService.schedule_once(
+            ('permissions_version', organization_id), partial(_bump_permissions_version, organization_id)
+        )
+
+
+def _bump_permissions_version(organization_id):
+    OrganizationalProfile.objects.filter(pk=organization_id).update(permissions_version=F('permissions_version') + 1)
+
+
+# -------------------- Role Resolver --------------------
+
+
+class RoleResolver:
+    """
+    Resolve the user's organization role once and memoize it.
+    One resolver is attached to each request by RoleResolverMiddleware so the
+    decorators, views and templates share a single invitation lookup.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    @cached_property
+    def organization(self):
+        if not getattr(self.user, 'is_authenticated', False):
+            return None
+        return getattr(self.user, 'organization_name', None)
+
+    @cached_property
+    def _entry(self):
+        """Role and permissions for (user, organization), shared across requests through the cache."""
+        if not self.organization:
+            return self._build_entry(None)
+
+        key = _permissions_cache_key(self.user.email, self.organization)
+        entry = cache.get(key)
+        if entry is None:
+            invitation = OrganizationInvitation.objects.filter(
+                email=self.user.email,
+                organization_name=self.organization,
+                status=OrganizationInvitation.ACCEPTED
+            ).only('role').first()
+            entry = self._build_entry(invitation.role if invitation else None)
+            cache.set(key, entry, PERMISSIONS_CACHE_TIMEOUT)
+        return entry
+
+    def _build_entry(self, invitation_role):
+        # Fallback to user.role if no accepted invitation exists
+        role = invitation_role or getattr(self.user, 'role', None)
+        return {
+            'invitation_role': invitation_role,
+            'role': role,
+            'permissions': build_permissions(role),
+        }
+
+    @property
+    def invitation_role(self):
+        """Role from the accepted invitation for the user's organization, or None."""
+        return self._entry['invitation_role']
+
+    @property
+    def role(self):
+        """Invitation role with fallback to user.role if no accepted invitation exists."""
+        return self._entry['role']
+
+    @property
+    def permissions(self):
+        return self._entry['permissions']
+
+
+def get_role_resolver(request):
+    """Return the resolver attached to the request, creating it if the middleware did not run."""
+    resolver = getattr(request, 'role_resolver', None)
+    if resolver is None or resolver.user is not request.user:
+        resolver = RoleResolver(request.user)
+        request.role_resolver = resolver
+    return resolver
+
+
+def get_request_permissions(request):
+    """Permissions dict for request.user, computed once per request."""
+    return get_role_resolver(request).permissions
+
+
 # -------------------- Decorator --------------------
 
 
@@ -13,23 +121,14 @@ def role_required(allowed_roles):
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
-            # Safely get user's organization
-            org = getattr(request.user, 'organization_name', None)
+            resolver = get_role_resolver(request)
 
-            if not org:
+            # Safely get user's organization
+            if not resolver.organization:
                 return HttpResponseForbidden("You do not have permission to access this page.")
 
             # Check accepted invitation for this organization
-            invitation = OrganizationInvitation.objects.filter(
-                email=request.user.email,
-                organization_name=org,
-                status=OrganizationInvitation.ACCEPTED
-            ).first()
-
-            if not invitation:
-                return HttpResponseForbidden("You do not have permission to access this page.")
-
-            if invitation.role not in allowed_roles:
+            if resolver.invitation_role not in allowed_roles:
                 return HttpResponseForbidden("You do not have permission to access this page.")
 
             return view_func(request, *args, **kwargs)
@@ -43,21 +142,12 @@ def role_required_invitation(allowed_roles):
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
-            org = getattr(request.user, 'organization_name', None)
-            if not org:
+            resolver = get_role_resolver(request)
+            if not resolver.organization:
                 return HttpResponseForbidden("You do not have permission to access this page.")
 
-            # Try to find accepted invitation
-            invitation = OrganizationInvitation.objects.filter(
-                email=request.user.email,
-                organization_name=org,
-                status=OrganizationInvitation.ACCEPTED
-            ).first()
-
             # If no invitation, fallback to checking if user is staff/editor
-            role = invitation.role if invitation else getattr(request.user, 'role', None)
-
-            if role not in allowed_roles:
+            if resolver.role not in allowed_roles:
                 return HttpResponseForbidden("You do not have permission to access this page.")
 
             return view_func(request, *args, **kwargs)
@@ -96,20 +186,8 @@ def role_required_invitation(allowed_roles):
 
 # -------------------- Service Function --------------------
 
-def get_user_permissions(user):
-    """
-    Return a dictionary of permissions based on accepted invitation role.
-    Fallback to user.role if no accepted invitation exists.
-    """
-    org = getattr(user, 'organization_name', None)
-    org_id = org.id if org else None
-
-    invitation = OrganizationInvitation.objects.filter(
-        email=user.email,
-        organization_name_id=org_id,
-        status=OrganizationInvitation.ACCEPTED
-    ).first()
-
+def build_permissions(role):
+    """Return a dictionary of permissions for the given role."""
     permissions = {
         # Vision
         'vision_view': False,
@@ -133,9 +211,6 @@ def get_user_permissions(user):
         'invitation_delete': False,
     }
 
-    # Determine role: invitation role or user role fallback
-    role = invitation.role if invitation else getattr(user, 'role', None)
-
     if role == 'editor':
         permissions.update({
             'vision_view': True,
@@ -165,6 +240,15 @@ def get_user_permissions(user):
     return permissions
 
 
+def get_user_permissions(user):
+    """
+    Return a dictionary of permissions based on accepted invitation role.
+    Fallback to user.role if no accepted invitation exists.
+    Inside a view prefer get_request_permissions(request), which is memoized per request.
+    """
+    return RoleResolver(user).permissions
+
+
 
 #
 # def get_user_permissions(user):
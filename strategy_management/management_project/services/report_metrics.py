@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Case, ExpressionWrapper, F, FloatField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Cast
+from django.db.models.lookups import Exact
+
+from management_project.models import StrategicActionPlan, StrategicReport
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.strategic_report_analytics import StrategicReportAnalyticsService
+from management_project.services.strategic_scorecard import StrategicScorecardService
+
+
+class ReportMetricsService:
+    """
+    Recomputes the metrics StrategicReport stores from its action plan (percent_achieved,
+    variance, weighted_score) inside the database.
+
+    StrategicReport.save() computes them from the plan's baseline, target and weight at the
+    time of the save. When a plan's baseline, target or weight changes, propagate() rewrites
+    the metrics of all its reports in one UPDATE (see signals), and rebuild() does the same for
+    every report of an organization, e.g. for data saved before propagation existed.
+    """
+
+    # Plan fields the stored report metrics are computed from
+    PLAN_FIELDS = ('baseline', 'target', 'weight')
+
+    # -------------------- Expressions --------------------
+
+    @classmethod
+    def expressions(cls):
+        """{field: expression} for the stored report metrics, as StrategicReport.save() sets them."""
+        plan = StrategicActionPlan.objects.filter(pk=OuterRef('action_plan_id')).order_by()
+        baseline, target, weight = (Subquery(plan.values(field_name)) for field_name in cls.PLAN_FIELDS)
+        actual = F('achievement')
+        percent_achieved = Case(
+            When(Exact(target, baseline), then=Value(0.0 if cls._sqlite() else Decimal(0))),
+            default=cls._number(cls._operand(actual - baseline) * 100 / (target - baseline), 'percent_achieved'),
+            output_field=cls._output_field('percent_achieved'),
+        )
+        return {
+            'percent_achieved': percent_achieved,
+            'variance': target - actual,
+            'weighted_score': cls._number(cls._operand(actual) * weight / 100, 'weighted_score'),
+        }
+
+    @staticmethod
+    def _sqlite():
+        return connection.vendor == 'sqlite'
+
+    @classmethod
+    def _operand(cls, expression):
+        # Decimals holding whole numbers are integers to SQLite, so it divides them as floats;
+        # server databases keep exact numeric arithmetic
+        return Cast(expression, FloatField()) if cls._sqlite() else expression
+
+    @classmethod
+    def _output_field(cls, field_name):
+        return FloatField() if cls._sqlite() else StrategicReport._meta.get_field(field_name)
+
+    @classmethod
+    def _number(cls, expression, field_name):
+        return ExpressionWrapper(expression, output_field=cls._output_field(field_name))
+
+    # -------------------- Recompute --------------------
+
+    @classmethod
+    def propagate(cls, plan_ids):
+        """
+        Rewrite the metrics of every report of the given action plans in one UPDATE; returns the
+        row count. Runs in the caller's transaction, so a plan and its reports change together.
+        The plans' own post_save refreshes their cycles' aggregates, scorecards and the charts.
+        """
+        with transaction.atomic():
+            return StrategicReport.objects.filter(action_plan_id__in=plan_ids).update(**cls.expressions())
+
+    @classmethod
+    def rebuild(cls, organization=None):
+        """Rewrite the metrics of every report, optionally limited to one organization; returns the row count."""
+        reports = StrategicReport.objects.all()
+        if organization is not None:
+            reports = reports.filter(organization_name=organization)
+        with transaction.atomic():
+            updated = reports.update(**cls.expressions())
+            # update() sends no post_save signals, so refresh the aggregates, scorecards and charts here
+            cycles = StrategicActionPlan.objects.filter(reports__in=reports).order_by().values_list(
+                'strategic_cycle_id', 'organization_name_id'
+            ).distinct()
+            for cycle_id, organization_id in cycles:
+                StrategicReportAnalyticsService.schedule_refresh(cycle_id)
+                StrategicScorecardService.schedule_refresh(cycle_id)
+                ChartCacheService.schedule_bump(organization_id)
+        return updated
@@ -0,0 +1,38 @@
+from django.db.models import Max
+
+from management_project.models import StrategicReport
+from management_project.services.chart_cache import ChartCacheService
+
+
+class ReportPeriodService:
+    """
+    The strategic reports a SWOT report can be attached to (its "report period"): the latest
+    report of each of the organization's action plans.
+
+    The set is selected by one grouped subquery, and the rendered choices are cached per
+    organization data version, which every strategic report, plan or cycle write bumps.
+    So building a SwotReportForm costs the same however long the report history grows.
+    """
+
+    CACHE_NAME = 'swot_report_periods'
+
+    @staticmethod
+    def latest_reports(organization):
+        """The latest (highest id) report of each action plan, as a lazy queryset."""
+        latest_ids = (
+            StrategicReport.objects.filter(organization_name=organization)
+            .order_by()
+            .values('action_plan')
+            .annotate(latest_id=Max('pk'))
+            .values('latest_id')
+        )
+        return StrategicReport.objects.filter(pk__in=latest_ids)
+
+    @classmethod
+    def choices(cls, organization):
+        """[(report id, label), ...] of latest_reports(), cached until the organization's data changes."""
+        def build():
+            reports = cls.latest_reports(organization).select_related('action_plan__strategic_cycle')
+            return {'choices': [(report.pk, str(report)) for report in reports]}
+
+        return ChartCacheService.get_or_build(cls.CACHE_NAME, organization, None, build)['choices']
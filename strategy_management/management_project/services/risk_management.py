@@ -1,3 +1,4 @@
+from management_project.services.catalog_index import CatalogIndex
 
 
 class RiskChoicesService:
@@ -156,15 +157,17 @@ class RiskChoicesService:
         }
     }
 
+    INDEX = CatalogIndex(RISK_HIERARCHY)
+
     # Simplified getters for forms
     @classmethod
     def get_risk_category_choices(cls):
-        return [(o, o) for o in cls.RISK_HIERARCHY.keys()]
+        return cls.INDEX.choices()
 
     @classmethod
     def get_risk_name_choices(cls, risk_category):
-        return [(risk_name, risk_name) for risk_name in cls.RISK_HIERARCHY.get(risk_category, {}).keys()]
+        return cls.INDEX.choices(risk_category)
 
     @classmethod
     def get_mitigation_action(cls, risk_category, risk_name):
-        return cls.RISK_HIERARCHY.get(risk_category, {}).get(risk_name, "")
\ No newline at end of file
+        return cls.INDEX.detail(risk_category, risk_name)
\ No newline at end of file
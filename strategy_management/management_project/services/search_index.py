@@ -0,0 +1,381 @@
+import re
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVectorField
+from django.db import connection, transaction
+from django.db.models import Expression, F, Q
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from management_project.models import (
+    InitiativePlanning, InitiativeReport, RiskManagement, SearchDocument, Stakeholder, StrategicActionPlan,
+    StrategicCycle, StrategicReport, StrategyHierarchy, SwotAnalysis, SwotReport,
+)
+
+DOCUMENT_TABLE = SearchDocument._meta.db_table
+FTS_TABLE = f'{DOCUMENT_TABLE}_fts'
+
+# Control characters around the matched words, replaced with <mark> once the text is escaped
+MATCH_START, MATCH_END = '\x02', '\x03'
+
+
+class DocumentVector(Expression):
+    """
+    The search_vector column PostgreSQL keeps on the documents (see migration 0012); the model
+    does not declare it, as no other database has it.
+    """
+    output_field = SearchVectorField()
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.query.get_initial_alias()
+        return f"{compiler.quote_name_unless_alias(alias)}.{connection.ops.quote_name('search_vector')}", []
+
+
+class SearchIndexService:
+    """
+    Per-organization full-text search over stakeholders, strategic and initiative reports,
+    SWOT entries and risks.
+
+    Each searchable row has one SearchDocument holding the text of the fields the list views
+    search, joined fields included (e.g. a strategic report's KPI and objective), so a search
+    reads one indexed table instead of scanning every joined table with icontains. On SQLite
+    the documents are indexed by an FTS5 table (see migration 0008), which ranks matches with
+    bm25 and highlights them. On PostgreSQL a generated tsvector column with a GIN index
+    (see migration 0012) is matched with a tsquery, ranked with ts_rank and highlighted with
+    ts_headline. Other databases fall back to icontains over the documents.
+
+    On SQLite and PostgreSQL every word of a query matches as a word prefix: "jo" finds "John"
+    but "ohn" does not, where the list views used to match any substring.
+
+    SOURCES describe each kind of document:
+      model       the indexed model
+      title/body  field lookups whose values make up the document
+      url         (url name, lookups of its arguments) of the page a result links to
+      depends_on  {related model: lookup from the indexed model}; saving a related row
+                  refreshes the documents built from it (e.g. renaming a cycle)
+    The documents are refreshed by the signals on save and delete, and by the bulk writers
+    (e.g. the stakeholder import). rebuild() rewrites them all, for the rebuild_search_index command.
+    """
+
+    SOURCES = {
+        'stakeholder': {
+            'model': Stakeholder,
+            'title': 'stakeholder_name',
+            'body': ('stakeholder_code', 'role', 'department', 'description', 'notes', 'contact_info'),
+            'url': ('update_stakeholder', ('pk',)),
+            'depends_on': {},
+        },
+        'strategic_report': {
+            'model': StrategicReport,
+            'title': 'action_plan__strategy_hierarchy__kpi',
+            'body': (
+                'action_plan__strategy_hierarchy__strategic_perspective',
+                'action_plan__strategy_hierarchy__focus_area',
+                'action_plan__strategy_hierarchy__objective',
+                'action_plan__strategic_cycle__name',
+                'action_plan__strategic_cycle__end_date',
+                'achievement',
+                'status',
+                'progress_summary',
+                'performance_summary',
+                'challenges',
+                'successes',
+                'lessons_learned',
+            ),
+            'url': ('strategic_report_detail', ('action_plan__strategic_cycle__slug', 'pk')),
+            'depends_on': {
+                StrategicActionPlan: 'action_plan',
+                StrategyHierarchy: 'action_plan__strategy_hierarchy',
+                StrategicCycle: 'action_plan__strategic_cycle',
+            },
+        },
+        'initiative_report': {
+            'model': InitiativeReport,
+            'title': 'initiative_planning__initiative_name',
+            'body': (
+                'initiative_planning__initiative_focus_area',
+                'initiative_planning__initiative_dimension',
+                'achieved_status',
+                'notes',
+            ),
+            'url': ('update_initiative_report', ('pk',)),
+            'depends_on': {InitiativePlanning: 'initiative_planning'},
+        },
+        'swot_analysis': {
+            'model': SwotAnalysis,
+            'title': 'swot_factor',
+            'body': ('swot_type', 'swot_pillar', 'description'),
+            'url': ('update_swot_analysis', ('pk',)),
+            'depends_on': {},
+        },
+        'swot_report': {
+            'model': SwotReport,
+            'title': 'swot_factor',
+            'body': (
+                'swot_type',
+                'swot_pillar',
+                'description',
+                'strategic_report_period__action_plan__strategic_cycle__name',
+                'strategic_report_period__action_plan__strategic_cycle__time_horizon',
+                'strategic_report_period__action_plan__strategic_cycle__time_horizon_type',
+            ),
+            'url': ('update_swot_report', ('pk',)),
+            'depends_on': {
+                StrategicReport: 'strategic_report_period',
+                StrategicActionPlan: 'strategic_report_period__action_plan',
+                StrategicCycle: 'strategic_report_period__action_plan__strategic_cycle',
+            },
+        },
+        'risk': {
+            'model': RiskManagement,
+            'title': 'risk_name',
+            'body': ('risk_category', 'mitigation_action', 'strategic_cycle__name'),
+            'url': ('update_risk_management', ('pk',)),
+            'depends_on': {StrategicCycle: 'strategic_cycle'},
+        },
+    }
+
+    BATCH_SIZE = 500
+    SEARCH_LIMIT = 50
+    # bm25 weights of the title and body columns
+    TITLE_WEIGHT = 10.0
+    BODY_WEIGHT = 1.0
+    SNIPPET_WORDS = 16
+    # PostgreSQL text search configuration of the search_vector column (migration 0012); 'simple'
+    # neither stems nor drops stop words, like the FTS5 tokenizer
+    TS_CONFIG = 'simple'
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+
+    # -------------------- Maintenance --------------------
+
+    @classmethod
+    def kind_for(cls, model):
+        for kind, source in cls.SOURCES.items():
+            if source['model'] is model:
+                return kind
+        return None
+
+    @classmethod
+    def dependent_sources(cls, model):
+        """[(kind, lookup), ...] of the documents built from rows of `model`."""
+        return [
+            (kind, source['depends_on'][model])
+            for kind, source in cls.SOURCES.items()
+            if model in source['depends_on']
+        ]
+
+    @classmethod
+    def refresh(cls, kind, pks):
+        """Rewrite the documents of the `kind` rows `pks`; rows that no longer exist lose theirs."""
+        pks = [pk for pk in pks if pk is not None]
+        for start in range(0, len(pks), cls.BATCH_SIZE):
+            batch = pks[start:start + cls.BATCH_SIZE]
+            documents = [cls._document(kind, row) for row in cls._rows(kind).filter(pk__in=batch)]
+            with transaction.atomic():
+                SearchDocument.objects.filter(kind=kind, object_id__in=batch).delete()
+                SearchDocument.objects.bulk_create(documents)
+
+    @classmethod
+    def remove(cls, kind, pks):
+        SearchDocument.objects.filter(kind=kind, object_id__in=pks).delete()
+
+    @classmethod
+    def refresh_dependents(cls, instance):
+        """Refresh the documents that include text of `instance`, a row of a related model."""
+        for kind, lookup in cls.dependent_sources(type(instance)):
+            pks = cls.SOURCES[kind]['model'].objects.filter(**{lookup: instance.pk}).values_list('pk', flat=True)
+            cls.refresh(kind, list(pks))
+
+    @classmethod
+    def rebuild(cls, organization=None):
+        """Rewrite every document (of one organization); returns {kind: documents written}."""
+        counts = {}
+        for kind, source in cls.SOURCES.items():
+            rows = source['model'].objects.all()
+            documents = SearchDocument.objects.filter(kind=kind)
+            if organization is not None:
+                rows = rows.filter(organization_name=organization)
+                documents = documents.filter(organization_name=organization)
+            with transaction.atomic():
+                documents.delete()
+                cls.refresh(kind, list(rows.order_by('pk').values_list('pk', flat=True)))
+            counts[kind] = documents.count()
+        return counts
+
+    @classmethod
+    def _rows(cls, kind):
+        source = cls.SOURCES[kind]
+        _, url_args = source['url']
+        fields = dict.fromkeys(('pk', 'organization_name_id', source['title'], *source['body'], *url_args))
+        return source['model'].objects.order_by().values(*fields)
+
+    @classmethod
+    def _document(cls, kind, row):
+        source = cls.SOURCES[kind]
+        url_name, url_args = source['url']
+        body = (cls._text(row[field]) for field in source['body'])
+        return SearchDocument(
+            organization_name_id=row['organization_name_id'],
+            kind=kind,
+            object_id=row['pk'],
+            title=cls._text(row[source['title']])[:255],
+            body="\n".join(text for text in body if text),
+            url=reverse(url_name, args=[row[arg] for arg in url_args]),
+        )
+
+    @staticmethod
+    def _text(value):
+        if value is None:
+            return ""
+        if isinstance(value, (list, tuple)):
+            # MultiSelectField values
+            return ", ".join(str(item) for item in value)
+        return str(value)
+
+    # -------------------- Queries --------------------
+
+    @staticmethod
+    def uses_fts():
+        return connection.vendor == 'sqlite'
+
+    @staticmethod
+    def uses_tsvector():
+        return connection.vendor == 'postgresql'
+
+    @classmethod
+    def words(cls, query):
+        return cls.TOKEN_PATTERN.findall(query.lower())
+
+    @classmethod
+    def match_expression(cls, words):
+        """FTS5 query matching every word as a word prefix; quoting keeps user input out of the query syntax."""
+        return " ".join(f'"{word}"*' for word in words)
+
+    @classmethod
+    def ts_query(cls, words):
+        """PostgreSQL tsquery matching every word as a word prefix; words() leaves no tsquery operators to escape."""
+        return SearchQuery(" & ".join(f"{word}:*" for word in words), config=cls.TS_CONFIG, search_type='raw')
+
+    @classmethod
+    def filter(cls, queryset, kind, organization, query):
+        """`queryset` narrowed to the rows whose document matches every word of `query`."""
+        words = cls.words(query)
+        if not words:
+            return queryset
+        if cls.uses_fts():
+            matching = RawSQL(
+                f"SELECT d.object_id FROM {FTS_TABLE} JOIN {DOCUMENT_TABLE} d ON d.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s AND d.kind = %s AND d.organization_name_id = %s",
+                (cls.match_expression(words), kind, organization.pk),
+            )
+        elif cls.uses_tsvector():
+            matching = cls._tsvector_documents(organization, words).filter(kind=kind).values('object_id')
+        else:
+            matching = cls._fallback_documents(organization, words).filter(kind=kind).values('object_id')
+        return queryset.filter(pk__in=matching)
+
+    @classmethod
+    def search(cls, organization, query, kinds=None, limit=SEARCH_LIMIT):
+        """
+        Best matches of `query` across every kind (or `kinds`), best first:
+        [{'kind', 'kind_label', 'object_id', 'url', 'title', 'snippet'}, ...], the title and
+        snippet being safe HTML with the matched words in <mark>.
+        """
+        words = cls.words(query)
+        if not words:
+            return []
+        kinds = list(kinds or cls.SOURCES)
+        if cls.uses_fts():
+            rows = cls._fts_search(organization, words, kinds, limit)
+        elif cls.uses_tsvector():
+            rows = cls._tsvector_search(organization, words, kinds, limit)
+        else:
+            rows = cls._fallback_search(organization, words, kinds, limit)
+
+        labels = dict(SearchDocument.KIND_CHOICES)
+        return [
+            {
+                'kind': kind,
+                'kind_label': labels[kind],
+                'object_id': object_id,
+                'url': url,
+                'title': cls._marked(title),
+                'snippet': cls._marked(snippet),
+            }
+            for kind, object_id, url, title, snippet in rows
+        ]
+
+    @classmethod
+    def _fts_search(cls, organization, words, kinds, limit):
+        kind_placeholders = ", ".join(["%s"] * len(kinds))
+        sql = (
+            f"SELECT d.kind, d.object_id, d.url, "
+            f"highlight({FTS_TABLE}, 0, %s, %s), "
+            f"snippet({FTS_TABLE}, 1, %s, %s, '…', %s) "
+            f"FROM {FTS_TABLE} JOIN {DOCUMENT_TABLE} d ON d.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND d.organization_name_id = %s AND d.kind IN ({kind_placeholders}) "
+            f"ORDER BY bm25({FTS_TABLE}, %s, %s) LIMIT %s"
+        )
+        params = [
+            MATCH_START, MATCH_END, MATCH_START, MATCH_END, cls.SNIPPET_WORDS,
+            cls.match_expression(words), organization.pk, *kinds,
+            cls.TITLE_WEIGHT, cls.BODY_WEIGHT, limit,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    @classmethod
+    def _tsvector_documents(cls, organization, words):
+        return SearchDocument.objects.filter(organization_name=organization).alias(
+            vector=DocumentVector(),
+        ).filter(vector=cls.ts_query(words))
+
+    @classmethod
+    def _tsvector_search(cls, organization, words, kinds, limit):
+        query = cls.ts_query(words)
+        highlight = {'config': cls.TS_CONFIG, 'start_sel': MATCH_START, 'stop_sel': MATCH_END}
+        documents = cls._tsvector_documents(organization, words).filter(kind__in=kinds).annotate(
+            # ts_rank weights are {D, C, B, A} in 0..1; the title is A, the body B
+            rank=SearchRank(F('vector'), query, weights=[0.0, 0.0, cls.BODY_WEIGHT / cls.TITLE_WEIGHT, 1.0]),
+            title_marked=SearchHeadline('title', query, highlight_all=True, **highlight),
+            snippet=SearchHeadline(
+                'body', query, max_words=cls.SNIPPET_WORDS, min_words=cls.SNIPPET_WORDS // 2,
+                max_fragments=1, **highlight,
+            ),
+        ).order_by('-rank', 'title', 'pk')
+        return list(documents.values_list('kind', 'object_id', 'url', 'title_marked', 'snippet')[:limit])
+
+    @classmethod
+    def _fallback_documents(cls, organization, words):
+        documents = SearchDocument.objects.filter(organization_name=organization)
+        for word in words:
+            documents = documents.filter(Q(title__icontains=word) | Q(body__icontains=word))
+        return documents
+
+    @classmethod
+    def _fallback_search(cls, organization, words, kinds, limit):
+        documents = cls._fallback_documents(organization, words).filter(kind__in=kinds).order_by('title', 'pk')
+        pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+
+        def marked(text):
+            return pattern.sub(lambda match: f"{MATCH_START}{match.group(0)}{MATCH_END}", text)
+
+        rows = []
+        for document in documents[:limit]:
+            match = pattern.search(document.body)
+            start = max(match.start() - 60, 0) if match else 0
+            excerpt = document.body[start:start + 160]
+            rows.append((
+                document.kind, document.object_id, document.url, marked(document.title),
+                ("…" if start else "") + marked(excerpt),
+            ))
+        return rows
+
+    @staticmethod
+    def _marked(text):
+        # Document fields are stored one per line
+        text = escape(text).replace("\n", " · ")
+        return mark_safe(text.replace(MATCH_START, "<mark>").replace(MATCH_END, "</mark>"))
@@ -0,0 +1,54 @@
+from django.db import connection, transaction
+from django.db.models import F
+
+from management_project.models import CodeSequence
+
+
+class SequenceService:
+    """
+    Allocates numbered codes (e.g. stakeholder codes) from CodeSequence counters.
+
+    On PostgreSQL and SQLite 3.35+ the counter is created or incremented and its new value
+    returned by a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement, so allocation
+    costs one query and concurrent writers can never receive the same number. Other databases,
+    and older SQLite libraries without RETURNING, fall back to incrementing the locked row
+    inside a transaction.
+    """
+
+    UPSERT_VENDORS = ('sqlite', 'postgresql')
+
+    @classmethod
+    def next_value(cls, prefix):
+        """Reserve and return the next number for `prefix` (1 for a new prefix)."""
+        return cls.reserve(prefix, 1)
+
+    @classmethod
+    def reserve(cls, prefix, count):
+        """
+        Reserve `count` consecutive numbers for `prefix` in one statement and return the last;
+        the block is range(last - count + 1, last + 1).
+        """
+        if cls._can_upsert():
+            table = connection.ops.quote_name(CodeSequence._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} (prefix, last_value) VALUES (%s, %s) "
+                    f"ON CONFLICT (prefix) DO UPDATE SET last_value = {table}.last_value + %s "
+                    f"RETURNING last_value",
+                    [prefix, count, count],
+                )
+                return cursor.fetchone()[0]
+
+        with transaction.atomic():
+            sequence, created = CodeSequence.objects.select_for_update().get_or_create(
+                prefix=prefix, defaults={'last_value': count}
+            )
+            if created:
+                return count
+            CodeSequence.objects.filter(pk=sequence.pk).update(last_value=F('last_value') + count)
+            return CodeSequence.objects.values_list('last_value', flat=True).get(pk=sequence.pk)
+
+    @classmethod
+    def _can_upsert(cls):
+        # Django sets the flag from the SQLite library version (RETURNING needs 3.35)
+        return connection.vendor in cls.UPSERT_VENDORS and connection.features.can_return_rows_from_bulk_insert
@@ -0,0 +1,295 @@
+import csv
+import io
+from datetime import date, datetime
+from itertools import islice
+from zipfile import BadZipFile
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.utils.dateparse import parse_date
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+from management_project.models import Stakeholder
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.search_index import SearchIndexService
+from management_project.services.sequences import SequenceService
+from strategy_management.slugs import UniqueSlugService
+
+
+class StakeholderImportService:
+    """
+    Bulk stakeholder import from an .xlsx or .csv file.
+
+    Rows are streamed (openpyxl read-only mode / csv reader) and handled BATCH_SIZE at a time,
+    so only one batch is ever in memory. Each batch is validated row by row, scored in one pass
+    (scores are memoized per combination of levels), given a block of stakeholder codes per
+    code prefix, slugged with one query and written with a single bulk_create. Invalid rows are
+    reported with their spreadsheet row number and skipped; the valid rows are imported.
+
+    The header row may use field names ("stakeholder_name") or the titles written by the
+    stakeholder export ("Stakeholder Name"), so an exported file can be edited and re-imported.
+    """
+
+    BATCH_SIZE = 500
+    MAX_REPORTED_ERRORS = 200
+    # Rows searched for the header (the export puts a title row above it)
+    HEADER_SEARCH_ROWS = 10
+
+    REQUIRED_FIELDS = ('stakeholder_name', 'stakeholder_type')
+    IMPORT_FIELDS = (
+        'stakeholder_name', 'stakeholder_type', 'stakeholder_category',
+        'role', 'primary_role',
+        'impact_level', 'interest_level', 'influence_score', 'risk_level', 'contribution_score',
+        'priority', 'satisfaction_level', 'engagement_strategy',
+        'email', 'phone', 'contact_info', 'department', 'location',
+        'description', 'notes',
+        'relationship_status', 'last_engagement_date', 'next_engagement_date',
+    )
+    MULTI_CHOICE_FIELDS = ('role', 'engagement_strategy')
+    DATE_FIELDS = ('last_engagement_date', 'next_engagement_date')
+    # Besides ISO dates, accept the format written by the stakeholder export
+    DATE_FORMATS = ("%d %B, %Y",)
+
+    # {field name: {lower-cased value or label: value}}, built on first use
+    _choice_lookups = {}
+
+    # Computed on import, never read from the file
+    EXCLUDED_FROM_VALIDATION = (
+        'organization_name', 'stakeholder_code', 'slug', 'aligned_objectives',
+        'engagement_priority_score', 'is_key_stakeholder', 'requires_attention',
+    )
+
+    @classmethod
+    def import_file(cls, organization, uploaded_file):
+        """
+        Import every valid row of `uploaded_file` for `organization`.
+        Returns {'rows', 'created', 'error_count', 'errors': [(row number, message), ...]}.
+        """
+        result = {'rows': 0, 'created': 0, 'error_count': 0, 'errors': []}
+        rows = cls._read_rows(uploaded_file)
+        while True:
+            try:
+                batch = list(islice(rows, cls.BATCH_SIZE))
+            except (UnicodeDecodeError, csv.Error) as exc:
+                # Rows before the unreadable part are already imported
+                cls._add_error(result, result['rows'] + 1, f"The rest of the file could not be read: {exc}")
+                break
+            if not batch:
+                break
+            result['rows'] += len(batch)
+            cls._import_batch(organization, batch, result)
+
+        if result['created']:
+            # bulk_create sends no post_save signals, so refresh the organization's charts here
+            ChartCacheService.schedule_bump(organization.pk)
+        return result
+
+    # -------------------- Reading --------------------
+
+    @classmethod
+    def _read_rows(cls, uploaded_file):
+        """Yield (row number, {field: raw value}) for each non-empty data row."""
+        name = (getattr(uploaded_file, 'name', '') or '').lower()
+        if name.endswith('.csv'):
+            stream = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', newline='')
+            raw_rows = csv.reader(stream)
+        else:
+            try:
+                workbook = load_workbook(uploaded_file, read_only=True, data_only=True)
+            except (InvalidFileException, BadZipFile, KeyError, OSError):
+                raise ValidationError("The file is not a valid .xlsx workbook.")
+            raw_rows = workbook.worksheets[0].iter_rows(values_only=True)
+
+        columns = None
+        for row_number, values in enumerate(raw_rows, start=1):
+            if columns is None:
+                columns = cls._header_columns(values)
+                if columns is None and row_number >= cls.HEADER_SEARCH_ROWS:
+                    raise ValidationError(
+                        "No header row with a 'Stakeholder Name' column was found in the first "
+                        f"{cls.HEADER_SEARCH_ROWS} rows."
+                    )
+                continue
+            if not any(value not in (None, '') for value in values):
+                continue
+            yield row_number, {
+                field: values[index] for index, field in columns.items() if index < len(values)
+            }
+
+        if columns is None:
+            raise ValidationError("The file has no header row with a 'Stakeholder Name' column.")
+
+    @classmethod
+    def _header_columns(cls, values):
+        """{column index: field name} when `values` is the header row, else None."""
+        columns = {}
+        for index, value in enumerate(values):
+            field = str(value or '').strip().lower().replace(' ', '_').replace('-', '_')
+            if field in cls.IMPORT_FIELDS:
+                columns[index] = field
+        return columns if 'stakeholder_name' in columns.values() else None
+
+    # -------------------- Validation --------------------
+
+    @classmethod
+    def _build(cls, organization, data):
+        """Unsaved Stakeholder from one row, or raise ValidationError."""
+        errors = {}
+        values = {}
+        for field_name, raw in data.items():
+            try:
+                value = cls._convert(field_name, raw)
+            except ValidationError as exc:
+                errors[field_name] = exc.messages
+                continue
+            if value not in (None, '', []):
+                values[field_name] = value
+
+        for field_name in cls.REQUIRED_FIELDS:
+            if field_name not in values and field_name not in errors:
+                errors[field_name] = ["This field is required."]
+        if errors:
+            raise ValidationError(errors)
+
+        stakeholder = Stakeholder(organization_name=organization, **values)
+        if not stakeholder.primary_role and stakeholder.role:
+            stakeholder.primary_role = stakeholder.role[0]
+        stakeholder.full_clean(
+            exclude=cls.EXCLUDED_FROM_VALIDATION, validate_unique=False, validate_constraints=False
+        )
+        return stakeholder
+
+    @classmethod
+    def _convert(cls, field_name, raw):
+        if isinstance(raw, str):
+            raw = raw.strip()
+        if raw is None or raw == '':
+            return None
+
+        if field_name in cls.DATE_FIELDS:
+            return cls._parse_date(raw)
+        if field_name in cls.MULTI_CHOICE_FIELDS:
+            return [cls._choice_value(field_name, part.strip()) for part in str(raw).split(',') if part.strip()]
+        if isinstance(raw, float) and raw.is_integer():
+            # Spreadsheet numbers such as phone numbers arrive as floats
+            raw = int(raw)
+        if Stakeholder._meta.get_field(field_name).choices:
+            return cls._choice_value(field_name, str(raw))
+        return str(raw)
+
+    @classmethod
+    def _choice_value(cls, field_name, value):
+        """Accept a choice's stored value or its label, case-insensitively."""
+        lookup = cls._choice_lookup(field_name)
+        try:
+            return lookup[value.lower()]
+        except KeyError:
+            raise ValidationError(f"'{value}' is not a valid choice.")
+
+    @classmethod
+    def _choice_lookup(cls, field_name):
+        if field_name not in cls._choice_lookups:
+            lookup = {}
+            for value, label in Stakeholder._meta.get_field(field_name).flatchoices:
+                lookup[str(label).lower()] = value
+                lookup[str(value).lower()] = value
+                lookup[str(value).replace('_', ' ').lower()] = value
+            cls._choice_lookups[field_name] = lookup
+        return cls._choice_lookups[field_name]
+
+    @classmethod
+    def _parse_date(cls, raw):
+        if isinstance(raw, datetime):
+            return raw.date()
+        if isinstance(raw, date):
+            return raw
+        text = str(raw)
+        try:
+            parsed = parse_date(text)
+        except ValueError:
+            parsed = None
+        if parsed:
+            return parsed
+        for date_format in cls.DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format).date()
+            except ValueError:
+                pass
+        raise ValidationError(f"'{text}' is not a valid date (use YYYY-MM-DD).")
+
+    # -------------------- Writing --------------------
+
+    @classmethod
+    def _import_batch(cls, organization, batch, result):
+        stakeholders = []
+        row_numbers = []
+        for row_number, data in batch:
+            try:
+                stakeholders.append(cls._build(organization, data))
+                row_numbers.append(row_number)
+            except ValidationError as exc:
+                cls._add_error(result, row_number, cls._format_error(exc))
+        if not stakeholders:
+            return
+
+        cls._score(stakeholders)
+        try:
+            with transaction.atomic():
+                cls._assign_codes(organization, stakeholders)
+                UniqueSlugService.generate_many(
+                    stakeholders, [f"{s.stakeholder_name}-{s.stakeholder_code}" for s in stakeholders]
+                )
+                Stakeholder.objects.bulk_create(stakeholders)
+                # bulk_create sends no post_save signals either
+                SearchIndexService.refresh('stakeholder', [stakeholder.pk for stakeholder in stakeholders])
+        except DatabaseError as exc:
+            for row_number in row_numbers:
+                cls._add_error(result, row_number, f"Not saved: {exc}")
+            return
+        result['created'] += len(stakeholders)
+
+    @staticmethod
+    def _score(stakeholders):
+        """Engagement score and flags for the whole batch, computing each combination of levels once."""
+        scores = {}
+        for stakeholder in stakeholders:
+            levels = (
+                stakeholder.impact_level, stakeholder.influence_score,
+                stakeholder.interest_level, stakeholder.risk_level,
+            )
+            if levels not in scores:
+                scores[levels] = Stakeholder.engagement_priority_for(*levels)
+            stakeholder.engagement_priority_score = scores[levels]
+            stakeholder.is_key_stakeholder, stakeholder.requires_attention = Stakeholder.engagement_flags(
+                scores[levels], stakeholder.risk_level, stakeholder.satisfaction_level
+            )
+
+    @staticmethod
+    def _assign_codes(organization, stakeholders):
+        """Stakeholder codes as in Stakeholder.save(), reserving one block of numbers per prefix."""
+        org_prefix = organization.organization_name[:3].upper()
+        by_prefix = {}
+        for stakeholder in stakeholders:
+            prefix = f"STK-{org_prefix}-{stakeholder.stakeholder_name[:3].upper()}"
+            by_prefix.setdefault(prefix, []).append(stakeholder)
+
+        for prefix, group in by_prefix.items():
+            last = SequenceService.reserve(prefix, len(group))
+            for number, stakeholder in enumerate(group, start=last - len(group) + 1):
+                stakeholder.stakeholder_code = f"{prefix}-{number:04d}"
+
+    @classmethod
+    def _add_error(cls, result, row_number, message):
+        result['error_count'] += 1
+        if len(result['errors']) < cls.MAX_REPORTED_ERRORS:
+            result['errors'].append((row_number, message))
+
+    @staticmethod
+    def _format_error(exc):
+        if hasattr(exc, 'error_dict'):
+            return "; ".join(
+                f"{field.replace('_', ' ').title()}: {' '.join(messages)}"
+                for field, messages in exc.message_dict.items()
+            )
+        return " ".join(exc.messages)
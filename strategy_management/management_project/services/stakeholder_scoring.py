@@ -0,0 +1,146 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, DecimalField, Q, Value, When
+from django.db.models.functions import Round
+from django.db.models.lookups import GreaterThanOrEqual
+
+from management_project.models import Stakeholder
+from management_project.services.chart_cache import ChartCacheService
+
+
+class StakeholderScoringService:
+    """
+    Recomputes the stored engagement fields of stakeholders (engagement_priority_score,
+    is_key_stakeholder, requires_attention) inside the database.
+
+    The fields are normally set by Stakeholder.save(). After a change to Stakeholder's
+    LEVEL_SCORES, ENGAGEMENT_WEIGHTS or thresholds, recompute() rewrites every stale row in
+    one UPDATE ... SET ... = CASE ... statement built from the same constants, instead of
+    re-saving each stakeholder. diff() reports what that UPDATE would change without writing.
+    """
+
+    FIELDS = ('engagement_priority_score', 'is_key_stakeholder', 'requires_attention')
+    DIFF_SAMPLE_SIZE = 20
+
+    # -------------------- Expressions --------------------
+
+    @classmethod
+    def score_expression(cls):
+        """SQL twin of Stakeholder.engagement_priority_for()."""
+        terms = [
+            cls._level_term(field_name, weight)
+            for field_name, weight in Stakeholder.ENGAGEMENT_WEIGHTS.items()
+        ]
+        total = terms[0]
+        for term in terms[1:]:
+            total = total + term
+        return Round(
+            total, 1,
+            output_field=DecimalField(max_digits=3, decimal_places=1),
+        )
+
+    @classmethod
+    def expressions(cls):
+        """{field: expression} for the stored engagement fields, as Stakeholder.save() sets them."""
+        score = cls.score_expression()
+        is_key = GreaterThanOrEqual(score, Value(Stakeholder.KEY_STAKEHOLDER_SCORE))
+        requires_attention = (
+            Q(GreaterThanOrEqual(score, Value(Stakeholder.ATTENTION_SCORE)))
+            | Q(risk_level__in=Stakeholder.ATTENTION_RISK_LEVELS)
+            | Q(satisfaction_level__in=Stakeholder.ATTENTION_SATISFACTION_LEVELS)
+        )
+        return {
+            'engagement_priority_score': score,
+            'is_key_stakeholder': cls._flag(is_key),
+            'requires_attention': cls._flag(requires_attention),
+        }
+
+    @classmethod
+    def _level_term(cls, field_name, weight):
+        """CASE mapping a level field to its weighted contribution to the score."""
+        def contribution(level_score):
+            # The score is out of 10: weighted levels (1-5) are doubled
+            return Value(Decimal(str(round(level_score * weight * 2, 6))), output_field=cls._score_field())
+
+        return Case(
+            *[
+                When(**{field_name: level}, then=contribution(level_score))
+                for level, level_score in Stakeholder.LEVEL_SCORES.items()
+            ],
+            default=contribution(Stakeholder.UNKNOWN_LEVEL_SCORE),
+            output_field=cls._score_field(),
+        )
+
+    @staticmethod
+    def _flag(condition):
+        return Case(When(condition, then=Value(True)), default=Value(False), output_field=BooleanField())
+
+    @staticmethod
+    def _score_field():
+        # Room for the unrounded sum of the weighted levels
+        return DecimalField(max_digits=6, decimal_places=3)
+
+    # -------------------- Recompute --------------------
+
+    @classmethod
+    def stale(cls, organization=None):
+        """Stakeholders whose stored engagement fields differ from the current formula."""
+        queryset = Stakeholder.objects.all()
+        if organization is not None:
+            queryset = queryset.filter(organization_name=organization)
+        # NOT (score = ... AND is_key = ... AND requires_attention = ...)
+        return queryset.exclude(**cls.expressions())
+
+    @classmethod
+    def diff(cls, organization=None, sample_size=DIFF_SAMPLE_SIZE):
+        """
+        What recompute() would change, without writing:
+        {'changed': stale rows, 'fields': {field: rows changed}, 'samples': [row, ...]}.
+        Each sample row holds the stakeholder's code and name and (old, new) per field.
+        """
+        expressions = cls.expressions()
+        stale = cls.stale(organization)
+        fields = stale.aggregate(
+            changed=Count('pk'),
+            **{
+                field_name: Count('pk', filter=~Q(**{field_name: expression}))
+                for field_name, expression in expressions.items()
+            },
+        )
+        changed = fields.pop('changed')
+
+        annotations = {f'new_{field_name}': expression for field_name, expression in expressions.items()}
+        samples = []
+        rows = stale.annotate(**annotations).order_by('pk').values(
+            'pk', 'stakeholder_code', 'stakeholder_name', *cls.FIELDS, *annotations
+        )[:sample_size]
+        for row in rows:
+            # SQLite returns computed decimals unquantized
+            row['new_engagement_priority_score'] = row['new_engagement_priority_score'].quantize(Decimal('0.1'))
+            samples.append({
+                'pk': row['pk'],
+                'stakeholder_code': row['stakeholder_code'],
+                'stakeholder_name': row['stakeholder_name'],
+                'changes': {
+                    field_name: (row[field_name], row[f'new_{field_name}'])
+                    for field_name in cls.FIELDS
+                    if row[field_name] != row[f'new_{field_name}']
+                },
+            })
+
+        return {'changed': changed, 'fields': fields, 'samples': samples}
+
+    @classmethod
+    def recompute(cls, organization=None):
+        """Rewrite the engagement fields of every stale stakeholder in one UPDATE; returns the row count."""
+        stale = cls.stale(organization)
+        with transaction.atomic():
+            organization_ids = list(
+                stale.order_by().values_list('organization_name_id', flat=True).distinct()
+            )
+            updated = stale.update(**cls.expressions())
+            # update() sends no post_save signals, so refresh the organizations' charts here
+            for organization_id in organization_ids:
+                ChartCacheService.schedule_bump(organization_id)
+        return updated
@@ -0,0 +1,275 @@
+import datetime
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Count, Sum, F
+
+from management_project.models import StrategicCycle, StrategicReport, StrategicReportAggregate
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.commit_hooks import CommitHookService
+
+
+class StrategicReportAnalyticsService:
+    """
+    Maintains StrategicReportAggregate, the per-organization, per-cycle rollup of
+    StrategicReport rows that the strategic report dashboard reads in one query.
+    """
+
+    # Aliases avoid clashing with StrategicReport field names inside values()
+    GROUP_EXPRESSIONS = {
+        'org_id': F('organization_name_id'),
+        'group_status': F('status'),
+        'group_perspective': F('action_plan__strategy_hierarchy__strategic_perspective'),
+        'group_focus_area': F('action_plan__strategy_hierarchy__focus_area'),
+        'group_objective': F('action_plan__strategy_hierarchy__objective'),
+        'group_kpi': F('action_plan__strategy_hierarchy__kpi'),
+    }
+
+    ROW_FIELDS = (
+        'strategic_cycle_id', 'strategic_cycle__name', 'strategic_cycle__end_date',
+        'responsible_body', 'status', 'strategic_perspective', 'focus_area', 'objective', 'kpi',
+        'report_count', 'percent_achieved_sum', 'weighted_score_sum',
+    )
+
+    # -------------------- Maintenance --------------------
+
+    @classmethod
+    def schedule_refresh(cls, cycle_id):
+        """
+        Refresh the cycle's aggregates once the surrounding transaction commits.
+        A cycle already queued in the same transaction (e.g. a cascade deleting many reports)
+        is refreshed only once.
+        """
+        if not cycle_id:
+            return
+        CommitHookService.schedule_once(('report_aggregates', cycle_id), partial(cls.refresh_cycle, cycle_id))
+
+    @classmethod
+    def refresh_cycle(cls, cycle_id):
+        """
+        Recompute the aggregate rows of one strategic cycle, then bump the organization's
+        data version so cached dashboards built from the old rows are not served again.
+        """
+        with transaction.atomic():
+            StrategicReportAggregate.objects.filter(strategic_cycle_id=cycle_id).delete()
+            organization_id = StrategicCycle.objects.filter(pk=cycle_id).values_list(
+                'organization_name_id', flat=True
+            ).first()
+            if organization_id is None:
+                return 0
+
+            reports = StrategicReport.objects.filter(action_plan__strategic_cycle_id=cycle_id)
+            aggregates = [
+                cls._build_row(cycle_id, row, '')
+                for row in cls._grouped(reports)
+            ]
+            aggregates += [
+                cls._build_row(cycle_id, row, row['body'])
+                for row in cls._grouped(
+                    reports.filter(action_plan__responsible_bodies__isnull=False),
+                    body=F('action_plan__responsible_bodies__stakeholder_name'),
+                )
+            ]
+            StrategicReportAggregate.objects.bulk_create(aggregates, batch_size=500)
+            ChartCacheService.schedule_bump(organization_id)
+        return len(aggregates)
+
+    @classmethod
+    def rebuild(cls, organization=None):
+        """Recompute aggregates for every cycle, optionally limited to one organization."""
+        cycles = StrategicCycle.objects.all()
+        if organization is not None:
+            cycles = cycles.filter(organization_name=organization)
+        return sum(cls.refresh_cycle(cycle_id) for cycle_id in cycles.values_list('id', flat=True))
+
+    @classmethod
+    def _grouped(cls, reports, **extra):
+        return reports.values(**cls.GROUP_EXPRESSIONS, **extra).annotate(
+            report_count=Count('id'),
+            percent_achieved_sum=Sum('percent_achieved'),
+            weighted_score_sum=Sum('weighted_score'),
+        ).order_by()
+
+    @staticmethod
+    def _build_row(cycle_id, row, body):
+        return StrategicReportAggregate(
+            organization_name_id=row['org_id'],
+            strategic_cycle_id=cycle_id,
+            responsible_body=body or '',
+            status=row['group_status'],
+            strategic_perspective=row['group_perspective'] or '',
+            focus_area=row['group_focus_area'] or '',
+            objective=row['group_objective'] or '',
+            kpi=row['group_kpi'] or '',
+            report_count=row['report_count'],
+            percent_achieved_sum=row['percent_achieved_sum'] or 0,
+            weighted_score_sum=row['weighted_score_sum'] or 0,
+        )
+
+    # -------------------- Reading --------------------
+
+    @classmethod
+    def dashboard_rows(cls, organization, cycle_id=None, responsible_body=None):
+        """
+        Aggregate rows for the dashboard in a single query.
+        Without a body filter both the all-reports rows and the per-body rows are returned;
+        with one, only that body's rows.
+        """
+        rows = StrategicReportAggregate.objects.filter(organization_name=organization)
+        if cycle_id:
+            rows = rows.filter(strategic_cycle_id=cycle_id)
+        if responsible_body:
+            rows = rows.filter(responsible_body=responsible_body)
+        return list(rows.values(*cls.ROW_FIELDS))
+
+
+class StrategicReportRollup:
+    """
+    Single-pass grouping engine over strategic report aggregate rows.
+
+    Rows are fetched once and held as columnar arrays; compute() walks them one time and
+    accumulates report count, % achieved and weighted score sums for every requested
+    dimension (optionally per month) together. Shared by the dashboard and the Excel export.
+    """
+
+    # Dimension name -> aggregate column ('month' and 'total' are derived)
+    DIMENSIONS = {
+        'responsible_body': 'responsible_body',
+        'objective': 'objective',
+        'kpi': 'kpi',
+        'perspective': 'strategic_perspective',
+        'pillar': 'focus_area',
+        'status': 'status',
+        'cycle': 'strategic_cycle__name',
+        'month': 'month',
+        'total': None,
+    }
+
+    MONTH_FORMAT = "%b %Y"
+
+    def __init__(self, rows, body_scoped=False):
+        """
+        body_scoped: the rows all belong to one responsible body (dashboard body filter), so
+        every dimension reads them. Otherwise responsible_body reads the per-body rows and all
+        other dimensions read the all-reports rows, so no report is counted twice.
+        """
+        self.size = len(rows)
+        self.body_scoped = body_scoped
+        self.columns = {
+            field: [row[field] for row in rows]
+            for field in StrategicReportAnalyticsService.ROW_FIELDS
+        }
+        self.columns['month'] = [
+            end_date.replace(day=1) if end_date else None
+            for end_date in self.columns['strategic_cycle__end_date']
+        ]
+
+    @classmethod
+    def for_organization(cls, organization, cycle_id=None, responsible_body=None):
+        rows = StrategicReportAnalyticsService.dashboard_rows(organization, cycle_id, responsible_body)
+        return cls(rows, body_scoped=bool(responsible_body))
+
+    def values(self, dimension):
+        """Sorted distinct values of a dimension."""
+        column = self.columns[self.DIMENSIONS[dimension]]
+        return sorted({value for value, in_scope in zip(column, self._scope(dimension)) if in_scope and value})
+
+    def _scope(self, dimension):
+        if self.body_scoped:
+            return [True] * self.size
+        wants_body_rows = dimension == 'responsible_body'
+        return [bool(body) == wants_body_rows for body in self.columns['responsible_body']]
+
+    def compute(self, dimensions, by_month=False):
+        """
+        Return {dimension: {key: metrics}}, and with by_month=True also
+        {dimension: {(month, key): metrics}}, from one pass over the rows.
+        metrics = {'report_count', 'achievement', 'weighted_score'} with averages per report.
+        """
+        plan = []
+        for dimension in dimensions:
+            field = self.DIMENSIONS[dimension]
+            column = self.columns[field] if field else None
+            plan.append((dimension, column, dimension == 'responsible_body'))
+
+        totals = {dimension: {} for dimension in dimensions}
+        monthly = {dimension: {} for dimension in dimensions}
+
+        bodies = self.columns['responsible_body']
+        months = self.columns['month']
+        counts = self.columns['report_count']
+        achieved = self.columns['percent_achieved_sum']
+        weighted = self.columns['weighted_score_sum']
+
+        for i in range(self.size):
+            is_body_row = bool(bodies[i])
+            count, achieved_sum, weighted_sum = counts[i], achieved[i], weighted[i]
+            for dimension, column, wants_body_rows in plan:
+                if not self.body_scoped and is_body_row != wants_body_rows:
+                    continue
+                key = column[i] if column is not None else None
+                _accumulate(totals[dimension], key, count, achieved_sum, weighted_sum)
+                if by_month:
+                    _accumulate(monthly[dimension], (months[i], key), count, achieved_sum, weighted_sum)
+
+        totals = {dimension: _averages(groups) for dimension, groups in totals.items()}
+        if not by_month:
+            return totals
+        return totals, {dimension: _averages(groups) for dimension, groups in monthly.items()}
+
+    @classmethod
+    def performance(cls, monthly_groups):
+        """
+        Turn {(month, key): metrics} into the dashboard's per-month and per-key views:
+        by_month  {month label: {key: % achieved}}
+        ranking   [(key, {count, avg_achievement, avg_weighted, monthly_achievement, monthly_weighted})]
+                  sorted by report count, averages taken over the key's months.
+        """
+        by_month = {}
+        performance = {}
+        for (month, key), metrics in sorted(monthly_groups.items(), key=_month_key_order):
+            month_key = month.strftime(cls.MONTH_FORMAT) if month else "Unknown"
+            by_month.setdefault(month_key, {})[key] = metrics['achievement']
+
+            data = performance.setdefault(key, {
+                'achievement': [], 'weighted': [], 'count': 0,
+                'monthly_achievement': {}, 'monthly_weighted': {},
+            })
+            data['achievement'].append(metrics['achievement'])
+            data['weighted'].append(metrics['weighted_score'])
+            data['count'] += metrics['report_count']
+            data['monthly_achievement'][month_key] = metrics['achievement']
+            data['monthly_weighted'][month_key] = metrics['weighted_score']
+
+        for data in performance.values():
+            data['avg_achievement'] = sum(data['achievement']) / len(data['achievement'])
+            data['avg_weighted'] = sum(data['weighted']) / len(data['weighted'])
+
+        ranking = sorted(performance.items(), key=lambda item: item[1]['count'], reverse=True)
+        return by_month, ranking
+
+
+def _month_key_order(item):
+    (month, key), _ = item
+    return month or datetime.date.min, key or ''
+
+
+def _accumulate(groups, key, count, achieved_sum, weighted_sum):
+    total = groups.get(key)
+    if total is None:
+        groups[key] = [count, achieved_sum, weighted_sum]
+    else:
+        total[0] += count
+        total[1] += achieved_sum
+        total[2] += weighted_sum
+
+
+def _averages(groups):
+    return {
+        key: {
+            'report_count': count,
+            'achievement': achieved_sum / count if count else 0,
+            'weighted_score': weighted_sum / count if count else 0,
+        }
+        for key, (count, achieved_sum, weighted_sum) in groups.items()
+    }
@@ -0,0 +1,119 @@
+from collections import defaultdict
+from decimal import Decimal
+from functools import partial
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from management_project.models import StrategicActionPlan, StrategicCycle, StrategicReport, StrategicScorecard
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.commit_hooks import CommitHookService
+
+
+class StrategicScorecardService:
+    """
+    Maintains StrategicScorecard, the composite weighted score of each strategic cycle and of
+    its perspectives and pillars, so the dashboard and exports read it with one indexed lookup.
+
+    A cycle's rows are built when it is created and recomputed once per transaction that
+    writes one of its reports or plans (see signals); migration 0010 built those of the cycles
+    that existed before. Every cycle has a cycle-wide row, even without plans. Reading never
+    builds rows: a cycle missing from the table is repaired by the rebuild_strategic_scorecards
+    command.
+    """
+
+    # -------------------- Maintenance --------------------
+
+    @classmethod
+    def schedule_refresh(cls, cycle_id):
+        """Refresh the cycle's scorecard once the surrounding transaction commits (once per cycle)."""
+        if not cycle_id:
+            return
+        CommitHookService.schedule_once(('strategic_scorecard', cycle_id), partial(cls.refresh_cycle, cycle_id))
+
+    @classmethod
+    def refresh_cycle(cls, cycle_id):
+        """
+        Recompute the scorecard rows of one strategic cycle from the latest report of each of its
+        plans, then bump the organization's data version so cached dashboards are rebuilt.
+        """
+        with transaction.atomic():
+            StrategicScorecard.objects.filter(strategic_cycle_id=cycle_id).delete()
+            organization_id = StrategicCycle.objects.filter(pk=cycle_id).values_list(
+                'organization_name_id', flat=True
+            ).first()
+            if organization_id is None:
+                return 0
+
+            latest_report = StrategicReport.objects.filter(action_plan=OuterRef('pk')).order_by('-pk')
+            plans = StrategicActionPlan.objects.filter(strategic_cycle_id=cycle_id).order_by().annotate(
+                latest_score=Subquery(latest_report.values('weighted_score')[:1]),
+            ).values(
+                'weight', 'latest_score',
+                'strategy_hierarchy__strategic_perspective', 'strategy_hierarchy__focus_area',
+            )
+
+            totals = defaultdict(lambda: {
+                'plan_count': 0, 'reported_plan_count': 0,
+                'weight_total': Decimal(0), 'composite_score': Decimal(0),
+            })
+            totals[('', '')]  # the cycle-wide row, kept even without plans
+            for plan in plans:
+                perspective = plan['strategy_hierarchy__strategic_perspective'] or ''
+                focus_area = plan['strategy_hierarchy__focus_area'] or ''
+                for scope in {('', ''), (perspective, ''), (perspective, focus_area)}:
+                    row = totals[scope]
+                    row['plan_count'] += 1
+                    row['weight_total'] += plan['weight'] or 0
+                    if plan['latest_score'] is not None:
+                        row['reported_plan_count'] += 1
+                        row['composite_score'] += plan['latest_score']
+
+            StrategicScorecard.objects.bulk_create([
+                StrategicScorecard(
+                    organization_name_id=organization_id,
+                    strategic_cycle_id=cycle_id,
+                    strategic_perspective=perspective,
+                    focus_area=focus_area,
+                    **row,
+                )
+                for (perspective, focus_area), row in totals.items()
+            ], batch_size=500)
+            ChartCacheService.schedule_bump(organization_id)
+        return len(totals)
+
+    @classmethod
+    def rebuild(cls, organization=None):
+        """Recompute the scorecards of every cycle, optionally limited to one organization."""
+        cycles = StrategicCycle.objects.all()
+        if organization is not None:
+            cycles = cycles.filter(organization_name=organization)
+        return sum(cls.refresh_cycle(cycle_id) for cycle_id in cycles.values_list('id', flat=True))
+
+    # -------------------- Reading --------------------
+
+    @classmethod
+    def composite(cls, organization, cycle_id):
+        """The cycle-wide StrategicScorecard row of one of the organization's cycles, or None."""
+        return StrategicScorecard.objects.filter(
+            organization_name=organization, strategic_cycle_id=cycle_id, strategic_perspective='', focus_area='',
+        ).first()
+
+    @classmethod
+    def for_cycle(cls, organization, cycle_id):
+        """Every scorecard row of the cycle: the cycle-wide row first, then perspectives each followed by their pillars."""
+        return list(
+            StrategicScorecard.objects.filter(organization_name=organization, strategic_cycle_id=cycle_id)
+            .order_by('strategic_perspective', 'focus_area')
+        )
+
+    @staticmethod
+    def unbalanced(organization=None):
+        """Cycle-wide scorecard rows whose plan weights do not sum to StrategicScorecard.WEIGHT_TOTAL."""
+        scorecards = StrategicScorecard.objects.filter(strategic_perspective='', focus_area='').exclude(
+            weight_total=StrategicScorecard.WEIGHT_TOTAL
+        ).select_related('strategic_cycle')
+        if organization is not None:
+            scorecards = scorecards.filter(organization_name=organization)
+        return scorecards
+
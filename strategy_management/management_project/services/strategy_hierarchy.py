@@ -1,3 +1,6 @@
+from management_project.services.catalog_index import CatalogIndex
+
+
 class StrategyHierarchyChoicesService:
     # Define the complete hierarchy in a single structure
     STRATEGY_MAP_HIERARCHY = {
@@ -1289,34 +1292,24 @@ class StrategyHierarchyChoicesService:
         },
     }
 
-    # Getters for forms
-    # Getters for forms
+    # Compiled on first use; the getters below are lookups in its tables
+    INDEX = CatalogIndex(STRATEGY_MAP_HIERARCHY)
+
+    # Getters for forms (tuples of choices, shared between calls)
     def get_perspective_choices(self):
-        return [(p, p) for p in self.STRATEGY_MAP_HIERARCHY.keys()]
+        return self.INDEX.choices()
 
     def get_pillar_choices(self, perspective):
-        return [(p, p) for p in self.STRATEGY_MAP_HIERARCHY.get(perspective, {}).keys()]
+        return self.INDEX.choices(perspective)
 
     def get_objective_choices(self, perspective, pillar):
-        return [(o, o) for o in self.STRATEGY_MAP_HIERARCHY.get(perspective, {}).get(pillar, {}).keys()]
+        return self.INDEX.choices(perspective, pillar)
 
     def get_kpi_choices(self, perspective, pillar, objective):
-        return [
-            (kpi, kpi)
-            for kpi in self.STRATEGY_MAP_HIERARCHY.get(perspective, {})
-            .get(pillar, {})
-            .get(objective, {})
-            .keys()
-        ]
+        return self.INDEX.choices(perspective, pillar, objective)
 
     def get_formula(self, perspective, pillar, objective, kpi):
-        return (
-            self.STRATEGY_MAP_HIERARCHY
-            .get(perspective, {})
-            .get(pillar, {})
-            .get(objective, {})
-            .get(kpi, "")
-        )
+        return self.INDEX.detail(perspective, pillar, objective, kpi)
 
     # @classmethod
     # def get_perspective_choices(cls):
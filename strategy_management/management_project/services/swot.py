@@ -1,3 +1,6 @@
+from management_project.services.catalog_index import CatalogIndex
+
+
 #
 #
 class SwotChoicesService:
@@ -283,17 +286,19 @@ class SwotChoicesService:
         },
     }
 
+    INDEX = CatalogIndex(SWOT_HIERARCHY)
+
     # Form getters
     @classmethod
     def get_swot_type_choices(cls):
-        return [(s, s) for s in cls.SWOT_HIERARCHY.keys()]
+        return cls.INDEX.choices()
 
     @classmethod
     def get_pillar_choices(cls, swot_type):
-        return [(p, p) for p in cls.SWOT_HIERARCHY.get(swot_type, {}).keys()]
+        return cls.INDEX.choices(swot_type)
 
     @classmethod
     def get_factor_choices(cls, swot_type, pillar):
-        return [(f, f) for f in cls.SWOT_HIERARCHY.get(swot_type, {}).get(pillar, [])]
+        return cls.INDEX.choices(swot_type, pillar)
 
 #
\ No newline at end of file
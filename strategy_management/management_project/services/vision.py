@@ -1,4 +1,5 @@
 from management_project.models import Vision, OrganizationalProfile
+from management_project.services.catalog_index import CatalogIndex
 
 
 class VisionService:
@@ -466,18 +467,18 @@ class VisionService:
         ],
 
     }
+    INDEX = CatalogIndex(SECTOR_VISION_MAP)
 
     def __init__(self, org_obj: OrganizationalProfile):
         self.org = org_obj
         self.sector_name = org_obj.sector_name
 
     def get_choices(self):
-        """Return list of tuples for form select."""
-        visions = self.SECTOR_VISION_MAP.get(self.sector_name, [])
-        return [(v, v) for v in visions]
+        """Return tuple of choices for form select."""
+        return self.INDEX.choices(self.sector_name)
 
     def validate_choice(self, vision_statement):
-        if vision_statement not in self.SECTOR_VISION_MAP.get(self.sector_name, []):
+        if not self.INDEX.contains(vision_statement, self.sector_name):
             raise ValueError(f"Invalid vision '{vision_statement}' for sector '{self.sector_name}'.")
 
     def create_vision(self, vision_statement):
@@ -0,0 +1,272 @@
+# management_project/signals.py
+
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from account.models import CustomUser
+
+from .models import (
+    StrategicReport, StrategicActionPlan, Stakeholder, StrategyHierarchy, StrategicCycle,
+    InitiativePlanning, InitiativeReport, SwotAnalysis, SwotReport, RiskManagement,
+    InitiativeResourceItemReport, OrganizationInvitation,
+)
+from .services.action_plan_labels import ActionPlanLabelService
+from .services.chart_cache import ChartCacheService
+from .services.initiative_resource_usage import InitiativeResourceUsageService
+from .services.permissions import invalidate_organization_permissions
+from .services.report_metrics import ReportMetricsService
+from .services.search_index import SearchIndexService
+from .services.strategic_report_analytics import StrategicReportAnalyticsService
+from .services.strategic_scorecard import StrategicScorecardService
+
+
+# -------------------- Previous values --------------------
+
+# The receivers below also refresh the cycle a moved report or plan leaves
+
+@receiver(pre_save, sender=StrategicReport)
+def remember_previous_report_cycle(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_cycle_id = sender.objects.filter(pk=instance.pk).values_list(
+            'action_plan__strategic_cycle_id', flat=True
+        ).first()
+
+
+@receiver(pre_save, sender=StrategicActionPlan)
+def remember_previous_plan_values(sender, instance, **kwargs):
+    # The cycle for the aggregates and scorecards, the metric inputs for the stored report metrics
+    if not instance.pk:
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list(
+        'strategic_cycle_id', *ReportMetricsService.PLAN_FIELDS
+    ).first()
+    if previous is not None:
+        instance._previous_cycle_id, *metric_inputs = previous
+        instance._previous_metric_inputs = tuple(metric_inputs)
+
+
+# -------------------- Strategic report aggregates --------------------
+
+@receiver([post_save, post_delete], sender=StrategicReport)
+def refresh_report_aggregates(sender, instance, **kwargs):
+    try:
+        cycle_id = instance.action_plan.strategic_cycle_id
+    except StrategicActionPlan.DoesNotExist:
+        # Cascaded from the plan, whose own signal schedules the refresh
+        return
+    StrategicReportAnalyticsService.schedule_refresh(cycle_id)
+    StrategicReportAnalyticsService.schedule_refresh(getattr(instance, '_previous_cycle_id', None))
+
+
+@receiver([post_save, post_delete], sender=StrategicActionPlan)
+def refresh_action_plan_aggregates(sender, instance, **kwargs):
+    StrategicReportAnalyticsService.schedule_refresh(instance.strategic_cycle_id)
+    StrategicReportAnalyticsService.schedule_refresh(getattr(instance, '_previous_cycle_id', None))
+
+
+@receiver(m2m_changed, sender=StrategicActionPlan.responsible_bodies.through)
+def refresh_responsible_body_aggregates(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, StrategicActionPlan):
+        StrategicReportAnalyticsService.schedule_refresh(instance.strategic_cycle_id)
+
+
+@receiver(post_save, sender=Stakeholder)
+@receiver(post_save, sender=StrategyHierarchy)
+def refresh_renamed_dimension_aggregates(sender, instance, created, **kwargs):
+    # Names are stored on the aggregate rows, so renames must be pushed to every affected cycle
+    if created:
+        return
+    cycle_ids = instance.action_plans.values_list('strategic_cycle_id', flat=True).distinct()
+    for cycle_id in cycle_ids:
+        StrategicReportAnalyticsService.schedule_refresh(cycle_id)
+
+
+# -------------------- Strategic scorecards --------------------
+
+@receiver([post_save, post_delete], sender=StrategicReport)
+def refresh_report_scorecard(sender, instance, **kwargs):
+    try:
+        cycle_id = instance.action_plan.strategic_cycle_id
+    except StrategicActionPlan.DoesNotExist:
+        # Cascaded from the plan, whose own signal schedules the refresh
+        return
+    StrategicScorecardService.schedule_refresh(cycle_id)
+    StrategicScorecardService.schedule_refresh(getattr(instance, '_previous_cycle_id', None))
+
+
+@receiver([post_save, post_delete], sender=StrategicActionPlan)
+def refresh_action_plan_scorecard(sender, instance, **kwargs):
+    StrategicScorecardService.schedule_refresh(instance.strategic_cycle_id)
+    StrategicScorecardService.schedule_refresh(getattr(instance, '_previous_cycle_id', None))
+
+
+@receiver(post_save, sender=StrategicCycle)
+def build_new_cycle_scorecard(sender, instance, created, **kwargs):
+    # The cycle-wide row exists from the start, before any plan is added
+    if created:
+        StrategicScorecardService.schedule_refresh(instance.pk)
+
+
+@receiver(post_save, sender=StrategyHierarchy)
+def refresh_renamed_pillar_scorecards(sender, instance, created, **kwargs):
+    # Perspectives and pillars are stored on the scorecard rows
+    if created:
+        return
+    cycle_ids = instance.action_plans.values_list('strategic_cycle_id', flat=True).distinct()
+    for cycle_id in cycle_ids:
+        StrategicScorecardService.schedule_refresh(cycle_id)
+
+
+# -------------------- Stored report metrics --------------------
+
+@receiver(post_save, sender=StrategicActionPlan)
+def propagate_report_metrics(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_metric_inputs', None)
+    if created or previous is None:
+        return
+    current = tuple(getattr(instance, field_name) for field_name in ReportMetricsService.PLAN_FIELDS)
+    if current != previous:
+        ReportMetricsService.propagate([instance.pk])
+
+
+# -------------------- Action plan labels --------------------
+
+@receiver(m2m_changed, sender=StrategicActionPlan.responsible_bodies.through)
+def refresh_responsible_body_labels(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            ActionPlanLabelService.refresh(StrategicActionPlan.objects.filter(pk=instance.pk))
+        return
+    # Changed from the stakeholder's side; a clear does not say which plans it removed
+    if action == 'pre_clear':
+        instance._cleared_plan_ids = list(instance.action_plans.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        ActionPlanLabelService.refresh(StrategicActionPlan.objects.filter(pk__in=pk_set))
+    elif action == 'post_clear':
+        ActionPlanLabelService.refresh(
+            StrategicActionPlan.objects.filter(pk__in=getattr(instance, '_cleared_plan_ids', []))
+        )
+
+
+@receiver(post_save, sender=StrategicCycle)
+@receiver(post_save, sender=StrategyHierarchy)
+@receiver(post_save, sender=Stakeholder)
+def refresh_related_plan_labels(sender, instance, created, **kwargs):
+    if not created:
+        ActionPlanLabelService.refresh(instance.action_plans.all())
+
+
+@receiver(pre_delete, sender=Stakeholder)
+def remember_responsible_plans(sender, instance, **kwargs):
+    # Deleting a stakeholder removes it from its plans without an m2m_changed signal
+    instance._responsible_plan_ids = list(instance.action_plans.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Stakeholder)
+def refresh_responsible_plan_labels(sender, instance, **kwargs):
+    ActionPlanLabelService.refresh(
+        StrategicActionPlan.objects.filter(pk__in=getattr(instance, '_responsible_plan_ids', []))
+    )
+
+
+# -------------------- Initiative resource usage --------------------
+
+@receiver(pre_save, sender=InitiativeResourceItemReport)
+def remember_resource_report_plan(sender, instance, **kwargs):
+    # A report moved to another plan must also be taken off the old plan's total
+    if instance.pk:
+        instance._previous_plan_id = sender.objects.filter(pk=instance.pk).values_list(
+            'initiative_resource_plan_id', flat=True
+        ).first()
+
+
+@receiver([post_save, post_delete], sender=InitiativeResourceItemReport)
+def refresh_resource_usage(sender, instance, **kwargs):
+    InitiativeResourceUsageService.refresh([
+        instance.initiative_resource_plan_id, getattr(instance, '_previous_plan_id', None),
+    ])
+
+
+# -------------------- Search index --------------------
+
+def index_search_document(sender, instance, **kwargs):
+    SearchIndexService.refresh(SearchIndexService.kind_for(sender), [instance.pk])
+
+
+def remove_search_document(sender, instance, **kwargs):
+    SearchIndexService.remove(SearchIndexService.kind_for(sender), [instance.pk])
+
+
+def refresh_dependent_search_documents(sender, instance, created, **kwargs):
+    # A new row is not part of any document yet
+    if not created:
+        SearchIndexService.refresh_dependents(instance)
+
+
+for _kind, _source in SearchIndexService.SOURCES.items():
+    post_save.connect(index_search_document, sender=_source['model'], dispatch_uid=f'search_index_save_{_kind}')
+    post_delete.connect(remove_search_document, sender=_source['model'], dispatch_uid=f'search_index_delete_{_kind}')
+
+for _model in {model for source in SearchIndexService.SOURCES.values() for model in source['depends_on']}:
+    post_save.connect(
+        refresh_dependent_search_documents, sender=_model, dispatch_uid=f'search_index_dependents_{_model.__name__}'
+    )
+
+
+# -------------------- Organization data version --------------------
+
+# Models read by the chart views and exports; a committed write to any of them invalidates the
+# organization's cached charts and makes identical export requests build a new file
+DATA_VERSION_MODELS = (
+    Stakeholder, StrategyHierarchy, StrategicCycle, StrategicActionPlan, StrategicReport,
+    InitiativePlanning, InitiativeReport, SwotAnalysis, SwotReport, RiskManagement,
+)
+
+
+def bump_chart_data_version(sender, instance, **kwargs):
+    ChartCacheService.schedule_bump(instance.organization_name_id)
+
+
+# Connected per model rather than globally so deletes of other models keep Django's fast path
+for _model in DATA_VERSION_MODELS:
+    post_save.connect(bump_chart_data_version, sender=_model, dispatch_uid=f'chart_version_save_{_model.__name__}')
+    post_delete.connect(bump_chart_data_version, sender=_model, dispatch_uid=f'chart_version_delete_{_model.__name__}')
+
+
+@receiver(m2m_changed, sender=StrategicActionPlan.responsible_bodies.through)
+def bump_responsible_body_data_version(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, StrategicActionPlan):
+        ChartCacheService.schedule_bump(instance.organization_name_id)
+
+
+# -------------------- Permissions cache --------------------
+
+# User fields the cached role/permissions entries depend on
+PERMISSION_USER_FIELDS = ('email', 'organization_name_id')
+
+
+@receiver([post_save, post_delete], sender=OrganizationInvitation)
+def invalidate_invitation_permissions(sender, instance, **kwargs):
+    invalidate_organization_permissions(instance.organization_name_id)
+
+
+@receiver(pre_save, sender=CustomUser)
+def remember_previous_permission_fields(sender, instance, update_fields=None, **kwargs):
+    # Skips the lookup for saves that cannot change them, e.g. the last_login update on every login
+    instance._previous_permission_fields = None
+    if not instance.pk or (update_fields is not None and not {'email', 'organization_name'} & set(update_fields)):
+        return
+    instance._previous_permission_fields = sender.objects.filter(pk=instance.pk).values_list(
+        *PERMISSION_USER_FIELDS
+    ).first()
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_permissions(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_permission_fields', None)
+    if created or previous is None:
+        return
+    if previous != tuple(getattr(instance, field_name) for field_name in PERMISSION_USER_FIELDS):
+        # The organization left and the one joined
+        invalidate_organization_permissions(previous[1])
+        invalidate_organization_permissions(instance.organization_name_id)
@@ -0,0 +1,174 @@
+// charts.js
+// Draws dashboard charts in the browser from their JSON endpoint.
+// Markup: a container with data-chart-source="<endpoint url>" holding one
+// <div data-chart="<chart name>" data-empty="<message>"></div> per chart.
+// A chart arrives either as a figure ({data, layout}) or as chart data
+// ({kind, ...}, see ChartPayload.chart()) that one of the KINDS below turns into a figure.
+(function () {
+  // Layout fields shared by every kind
+  function baseLayout(chart) {
+    const layout = { template: chart.template };
+    if (chart.title) layout.title = { text: chart.title };
+    if (chart.height) layout.height = chart.height;
+    if (chart.showlegend !== undefined) layout.showlegend = chart.showlegend;
+    layout.xaxis = {};
+    if (chart.x_title) layout.xaxis.title = { text: chart.x_title };
+    if (chart.tickangle !== undefined) layout.xaxis.tickangle = chart.tickangle;
+    layout.yaxis = {};
+    if (chart.y_title) layout.yaxis.title = { text: chart.y_title };
+    return layout;
+  }
+
+  // One trace per series: {name, y, color, hovertemplate}; the chart's hovertemplate is the default
+  function seriesTraces(chart, trace) {
+    return chart.series.map((series) =>
+      Object.assign(
+        {
+          x: chart.x,
+          y: series.y,
+          name: series.name,
+          marker: { color: series.color },
+          hovertemplate: series.hovertemplate || chart.hovertemplate,
+        },
+        trace(series)
+      )
+    );
+  }
+
+  const KINDS = {
+    // labels, values, colors, hole, center (text in the hole)
+    pie(chart) {
+      const layout = baseLayout(chart);
+      if (chart.center) {
+        layout.annotations = [{ text: chart.center, x: 0.5, y: 0.5, font: { size: 16 }, showarrow: false }];
+      }
+      return {
+        data: [{
+          type: "pie", labels: chart.labels, values: chart.values, hole: chart.hole,
+          marker: { colors: chart.colors }, textinfo: "percent+label",
+          hovertemplate: "<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>",
+        }],
+        layout: layout,
+      };
+    },
+
+    // x, series; grouped bars
+    bars(chart) {
+      const layout = Object.assign(baseLayout(chart), { barmode: "group" });
+      return { data: seriesTraces(chart, () => ({ type: "bar" })), layout: layout };
+    },
+
+    // x, series; one bar panel per series, side by side, titled with the series' title
+    bar_panels(chart) {
+      const layout = baseLayout(chart);
+      const count = chart.series.length;
+      const spacing = 0.2 / count;
+      const width = (1 - spacing * (count - 1)) / count;
+      layout.annotations = [];
+      const data = seriesTraces(chart, () => ({ type: "bar" })).map((trace, i) => {
+        const axis = i ? String(i + 1) : "";
+        const domain = [i * (width + spacing), i * (width + spacing) + width];
+        layout["xaxis" + axis] = Object.assign({}, layout.xaxis, { domain: domain, anchor: "y" + axis });
+        layout["yaxis" + axis] = Object.assign({}, layout.yaxis, { anchor: "x" + axis });
+        layout.annotations.push({
+          text: chart.series[i].title, x: (domain[0] + domain[1]) / 2, y: 1, xref: "paper", yref: "paper",
+          xanchor: "center", yanchor: "bottom", showarrow: false, font: { size: 16 },
+        });
+        return Object.assign(trace, { xaxis: "x" + axis, yaxis: "y" + axis });
+      });
+      return { data: data, layout: layout };
+    },
+
+    // x, bar and line (one series each), y_titles: [bar axis, line axis on the right]
+    bar_line(chart) {
+      const layout = baseLayout(chart);
+      // Room on the right for the second axis, as plotly's make_subplots leaves it
+      layout.xaxis.domain = [0, 0.94];
+      layout.yaxis = { title: { text: chart.y_titles[0] } };
+      layout.yaxis2 = { title: { text: chart.y_titles[1] }, anchor: "x", overlaying: "y", side: "right" };
+      const bar = seriesTraces({ x: chart.x, series: [chart.bar] }, () => ({ type: "bar" }));
+      const line = seriesTraces({ x: chart.x, series: [chart.line] }, () => ({
+        type: "scatter", mode: "lines+markers", yaxis: "y2",
+      }));
+      return { data: bar.concat(line), layout: layout };
+    },
+
+    // x, series; one line per series
+    lines(chart) {
+      const data = seriesTraces(chart, (series) => ({
+        type: "scatter", mode: "lines+markers", line: { color: series.color, width: 2 },
+        marker: { color: series.color, size: 4 },
+      }));
+      return { data: data, layout: baseLayout(chart) };
+    },
+
+    // series; one box per series, outliers shown
+    boxes(chart) {
+      const data = chart.series.map((series) => ({
+        type: "box", y: series.y, name: series.name, boxpoints: "outliers", marker: { color: series.color },
+      }));
+      return { data: data, layout: baseLayout(chart) };
+    },
+
+    // x, y, z (one row per y), colorscale, hovertemplate
+    heatmap(chart) {
+      return {
+        data: [{
+          type: "heatmap", x: chart.x, y: chart.y, z: chart.z, colorscale: chart.colorscale,
+          hoverongaps: false, hovertemplate: chart.hovertemplate,
+        }],
+        layout: baseLayout(chart),
+      };
+    },
+  };
+
+  function showMessage(el, message) {
+    el.innerHTML = "";
+    const note = document.createElement("div");
+    note.className = "no-data text-muted text-center py-5";
+    note.textContent = message;
+    el.appendChild(note);
+  }
+
+  function draw(container, payload) {
+    container.querySelectorAll("[data-chart]").forEach((el) => {
+      let figure = payload.charts[el.dataset.chart];
+      if (!figure) {
+        showMessage(el, el.dataset.empty || "No data available");
+        return;
+      }
+      if (figure.kind) {
+        figure = KINDS[figure.kind](figure);
+      }
+      const layout = Object.assign({}, figure.layout);
+      if (typeof layout.template === "string") {
+        layout.template = payload.templates[layout.template];
+      }
+      const config = Object.assign({ responsive: true }, payload.config);
+      Plotly.newPlot(el, figure.data, layout, config);
+    });
+  }
+
+  function load(container) {
+    fetch(container.dataset.chartSource, {
+      credentials: "same-origin",
+      headers: { Accept: "application/json" },
+    })
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error(response.status);
+        }
+        return response.json();
+      })
+      .then((payload) => draw(container, payload))
+      .catch(() => {
+        container.querySelectorAll("[data-chart]").forEach((el) => {
+          showMessage(el, "Chart could not be loaded. Please refresh the page.");
+        });
+      });
+  }
+
+  document.addEventListener("DOMContentLoaded", () => {
+    document.querySelectorAll("[data-chart-source]").forEach(load);
+  });
+})();
@@ -0,0 +1,159 @@
+// choice_cascade.js
+// Fills cascading dropdowns from the choice catalog endpoint instead of resubmitting the form.
+// Markup: a <form data-choice-source="<choice_options url>"> whose level selects carry
+// data-choice-level and data-placeholder="<empty option label>". Fields with
+// data-choice-detail="<name>" receive that detail once every level is selected.
+// An <input data-choice-search="<choice_search url>"> in the form is a typeahead over the full
+// paths of the catalog; picking a result selects every level at once. Its results are listed
+// in the form's [data-choice-results] element.
+// Answers carry long-lived ETags, so repeated selections are served from the browser cache.
+(function () {
+  function levels(form) {
+    return Array.from(form.querySelectorAll("select[data-choice-level]"));
+  }
+
+  function reset(select) {
+    select.innerHTML = "";
+    const option = document.createElement("option");
+    option.value = "";
+    option.textContent = select.dataset.placeholder || "---------";
+    select.appendChild(option);
+  }
+
+  function fill(select, choices) {
+    reset(select);
+    choices.forEach(([value, label]) => {
+      const option = document.createElement("option");
+      option.value = value;
+      option.textContent = label;
+      select.appendChild(option);
+    });
+    select.disabled = false;
+  }
+
+  function showDetails(form, details) {
+    form.querySelectorAll("[data-choice-detail]").forEach((field) => {
+      const value = details[field.dataset.choiceDetail];
+      field.value = value === undefined ? field.dataset.placeholder || "" : value;
+    });
+  }
+
+  function fetchJson(url) {
+    return fetch(url, {
+      credentials: "same-origin",
+      headers: { Accept: "application/json" },
+    }).then((response) => {
+      if (!response.ok) {
+        throw new Error(response.status);
+      }
+      return response.json();
+    });
+  }
+
+  function update(form, changed) {
+    const selects = levels(form);
+    const position = selects.indexOf(changed);
+    const params = new URLSearchParams();
+    selects.slice(0, position + 1).forEach((select) => {
+      if (select.value) {
+        params.append(select.name, select.value);
+      }
+    });
+    // Deeper levels depend on the changed one
+    selects.slice(position + 1).forEach((select) => {
+      reset(select);
+      select.disabled = true;
+    });
+    showDetails(form, {});
+
+    fetchJson(form.dataset.choiceSource + "?" + params.toString())
+      .then((answer) => {
+        const next = selects.find((select) => select.name === answer.level);
+        if (next && changed.value) {
+          fill(next, answer.choices);
+        }
+        showDetails(form, answer.details);
+      })
+      .catch(() => {
+        // Fall back to the server-side cascade
+        form.requestSubmit();
+      });
+  }
+
+  // -------------------- Typeahead --------------------
+
+  // Selects the levels of `values` ({level: value}) top-down, loading each level's choices
+  function select(form, values) {
+    const selects = levels(form);
+    const params = new URLSearchParams();
+    let chain = Promise.resolve();
+    selects.forEach((level) => {
+      const query = params.toString();
+      chain = chain
+        .then(() => fetchJson(form.dataset.choiceSource + "?" + query))
+        .then((answer) => {
+          if (answer.level === level.name) {
+            fill(level, answer.choices);
+            level.value = values[level.name] || "";
+          }
+        });
+      params.append(level.name, values[level.name] || "");
+    });
+    return chain
+      .then(() => fetchJson(form.dataset.choiceSource + "?" + params.toString()))
+      .then((answer) => showDetails(form, answer.details));
+  }
+
+  function showResults(form, input, results) {
+    const list = form.querySelector("[data-choice-results]");
+    if (!list) {
+      return;
+    }
+    list.innerHTML = "";
+    results.forEach((result) => {
+      const item = document.createElement("button");
+      item.type = "button";
+      item.className = "list-group-item list-group-item-action";
+      item.textContent = result.label;
+      item.addEventListener("click", () => {
+        list.innerHTML = "";
+        input.value = "";
+        select(form, result.values).catch(() => form.requestSubmit());
+      });
+      list.appendChild(item);
+    });
+  }
+
+  let searchTimer = null;
+
+  document.addEventListener("input", (event) => {
+    const input = event.target;
+    const form = input.closest("form[data-choice-source]");
+    if (!form || !input.matches("input[data-choice-search]")) {
+      return;
+    }
+    clearTimeout(searchTimer);
+    const query = input.value.trim();
+    if (!query) {
+      showResults(form, input, []);
+      return;
+    }
+    searchTimer = setTimeout(() => {
+      fetchJson(input.dataset.choiceSearch + "?" + new URLSearchParams({ q: query }).toString())
+        .then((answer) => {
+          // Ignore answers to a query the user has already typed past
+          if (input.value.trim() === query) {
+            showResults(form, input, answer.results);
+          }
+        })
+        .catch(() => showResults(form, input, []));
+    }, 150);
+  });
+
+  document.addEventListener("change", (event) => {
+    const form = event.target.closest("form[data-choice-source]");
+    if (form && event.target.matches("select[data-choice-level]")) {
+      update(form, event.target);
+    }
+  });
+})();
@@ -1,3 +1,890 @@
-from django.test import TestCase
+import datetime
+import importlib
+import itertools
+import tempfile
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db.models import Avg, Count, F
+from django.db.models.functions import TruncMonth
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from django.utils.text import slugify
+from openpyxl import load_workbook
+import plotly.graph_objects as go
+
+from account.models import CustomUser
+from strategy_management.slugs import UniqueSlugService
+
+from .models import (
+    CodeSequence, ExportJob, InitiativePlanning, InitiativeReport, OrganizationalProfile, OrganizationInvitation,
+    Stakeholder, StrategicActionPlan, StrategicCycle, StrategicReport, StrategyHierarchy,
+)
+from .services.chart_payload import ChartPayload
+from .services.initiative_report_metrics import InitiativeReportMetricsService
+from .services.export_jobs import EXPORT_JOB_RETENTION, EXPORT_JOB_STALE_AFTER, ExportJobService
+from .services.permissions import RoleResolver
+from .services.report_metrics import ReportMetricsService
+from .services.report_periods import ReportPeriodService
+from .services.search_index import SearchIndexService
+from .services.sequences import SequenceService
+from .services.stakeholder_scoring import StakeholderScoringService
+from .services.strategic_report_analytics import StrategicReportRollup
+from .views.stakeholder import _stakeholder_graph_context, build_stakeholder_export
+
+
+def _rounded(value):
+    """Averages compared across the database's and Python's arithmetic."""
+    return round(float(value or 0), 4)
+
+
+def create_organization(name):
+    return OrganizationalProfile.objects.create(
+        organization_name=name, organization_address='Addis Ababa', employer_tin='0000000001',
+        organization_type='other', sector_name='education', contact_personnel='Admin',
+    )
+
+
+class StakeholderExportQueryTests(TestCase):
+    """The stakeholder export costs the same number of queries however many stakeholders it lists."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cls.cycle = StrategicCycle.objects.create(
+            organization_name=cls.organization, time_horizon='1 year', time_horizon_type='Short Term',
+            start_date=datetime.date(2025, 1, 1), end_date=datetime.date(2025, 12, 31),
+        )
+        cls.objectives = [
+            StrategyHierarchy.objects.create(
+                organization_name=cls.organization, strategic_perspective='Customer',
+                focus_area='Service', objective=f'Objective {i}', kpi=f'KPI {i}',
+            )
+            for i in range(3)
+        ]
+        # Another organization's stakeholders must never reach the export
+        other = create_organization('Other')
+        Stakeholder.objects.create(organization_name=other, stakeholder_name='Outsider', stakeholder_type='internal')
+
+    def create_stakeholders(self, count):
+        """`count` stakeholders, each aligned to objectives and responsible for an action plan."""
+        start = Stakeholder.objects.filter(organization_name=self.organization).count()
+        for i in range(start, start + count):
+            stakeholder = Stakeholder.objects.create(
+                organization_name=self.organization, stakeholder_name=f'Department {i}',
+                stakeholder_type='internal', role=['employee'],
+            )
+            stakeholder.aligned_objectives.set(self.objectives[:i % 3 + 1])
+            plan = StrategicActionPlan.objects.create(
+                organization_name=self.organization, strategic_cycle=self.cycle,
+                strategy_hierarchy=self.objectives[i % 3], indicator_type='Lead',
+                direction_of_change='Increasing', baseline=Decimal(0), target=Decimal(100), weight=Decimal(1),
+            )
+            plan.responsible_bodies.add(stakeholder)
+
+    def export_rows(self):
+        export = build_stakeholder_export(self.organization, {})
+        sheet = load_workbook(export.save(BytesIO()), read_only=True).active
+        # Heading and header rows first
+        return list(sheet.iter_rows(min_row=3, values_only=True))
+
+    def test_query_count_is_independent_of_row_count(self):
+        for count in (5, 45):
+            self.create_stakeholders(count)
+            # One stakeholder query plus one aligned objectives query
+            with self.assertNumQueries(2):
+                rows = self.export_rows()
+            self.assertEqual(len(rows), Stakeholder.objects.filter(organization_name=self.organization).count())
+
+        self.assertEqual(len(rows), 50)
+        self.assertNotIn('Outsider', [row[1] for row in rows])
+
+
+class StakeholderSummaryParityTests(TestCase):
+    """The dashboard's one-query summary gives the counts its per-bucket queries and loops used to."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cls.user = CustomUser.objects.create_user(
+            'member', 'member@example.com', 'password', organization_name=cls.organization,
+        )
+        levels = [level for level, _ in Stakeholder.LEVEL_CHOICES]
+        statuses = [status for status, _ in Stakeholder.RELATIONSHIP_STATUS_CHOICES]
+        # Engagements on both sides of the 90 day limit, and none at all
+        days_ago = [None, 10, 89, 90, 91, 400]
+        for i in range(30):
+            Stakeholder.objects.create(
+                organization_name=cls.organization, stakeholder_name=f'Stakeholder {i}',
+                stakeholder_type=['internal', 'external', 'interface'][i % 3], role=['employee'],
+                risk_level=levels[i % 5], priority=levels[i * 2 % 5], satisfaction_level=levels[i * 3 % 5],
+                impact_level=levels[i * 7 % 5], relationship_status=statuses[i % 5],
+                last_engagement_date=(
+                    datetime.date.today() - datetime.timedelta(days=days_ago[i % 6]) if days_ago[i % 6] else None
+                ),
+            )
+        Stakeholder.objects.create(
+            organization_name=create_organization('Other'), stakeholder_name='Outsider',
+            stakeholder_type='internal', risk_level='very_high', last_engagement_date=datetime.date(2000, 1, 1),
+        )
+
+    def baseline_summary(self):
+        """The summary as the dashboard computed it with one count() per bucket and Python loops."""
+        qs = Stakeholder.objects.filter(organization_name=self.organization)
+        ninety_days_ago = datetime.date.today() - datetime.timedelta(days=90)
+        total = qs.count()
+
+        def percentage(count):
+            return round((count / total * 100) if total > 0 else 0, 1)
+
+        counts = {
+            'internal_count': qs.filter(stakeholder_type='internal').count(),
+            'external_count': qs.filter(stakeholder_type='external').count(),
+            'interface_count': qs.filter(stakeholder_type='interface').count(),
+            'high_risk_count': qs.filter(risk_level__in=['high', 'very_high']).count(),
+            'high_priority_count': qs.filter(priority__in=['high', 'very_high']).count(),
+            'key_stakeholder_count': qs.filter(is_key_stakeholder=True).count(),
+            'attention_required_count': qs.filter(requires_attention=True).count(),
+            'overdue_engagement_count': sum(
+                1 for stakeholder in qs
+                if stakeholder.last_engagement_date and stakeholder.last_engagement_date < ninety_days_ago
+            ),
+            'high_satisfaction_count': qs.filter(satisfaction_level__in=['high', 'very_high']).count(),
+            'low_satisfaction_count': qs.filter(satisfaction_level__in=['low', 'very_low']).count(),
+        }
+        overdue_by_status = {}
+        for status in qs.values_list('relationship_status', flat=True).distinct():
+            overdue_by_status[status] = sum(
+                1 for stakeholder in qs.filter(relationship_status=status)
+                if stakeholder.last_engagement_date and stakeholder.last_engagement_date < ninety_days_ago
+            )
+        summary = {
+            'total_stakeholders': total,
+            **counts,
+            'internal_percentage': percentage(counts['internal_count']),
+            'external_percentage': percentage(counts['external_count']),
+            'high_risk_percentage': percentage(counts['high_risk_count']),
+            'medium_risk_percentage': percentage(qs.filter(risk_level='medium').count()),
+            'low_risk_percentage': percentage(qs.filter(risk_level__in=['low', 'very_low']).count()),
+            'attention_percentage': percentage(counts['attention_required_count']),
+            'overdue_percentage': percentage(counts['overdue_engagement_count']),
+            'avg_engagement_score': round(qs.aggregate(avg=Avg('engagement_priority_score'))['avg'] or 0, 1),
+            'high_satisfaction_percentage': percentage(counts['high_satisfaction_count']),
+            'low_satisfaction_percentage': percentage(counts['low_satisfaction_count']),
+        }
+        return summary, overdue_by_status
+
+    def test_summary_matches_the_per_bucket_counts(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        context = _stakeholder_graph_context(request)
+        expected_summary, expected_overdue = self.baseline_summary()
+
+        self.assertEqual(context['summary_data'], expected_summary)
+        self.assertGreater(expected_summary['overdue_engagement_count'], 0)
+
+        total, overdue = context['charts']['charts']['plot_html_relationship']['data']
+        self.assertEqual(overdue['name'], 'Overdue Engagement')
+        self.assertEqual(
+            dict(zip(overdue['x'], overdue['y'])),
+            {status.title(): count for status, count in expected_overdue.items()},
+        )
+
+
+class StakeholderScoringParityTests(TestCase):
+    """The SQL recompute stores the engagement fields Stakeholder.save() computes in Python."""
+
+    def test_recompute_matches_save_for_every_level_combination(self):
+        organization = create_organization('Acme')
+        # Every level, plus one no longer in LEVEL_SCORES, in every weighted field
+        levels = [level for level, _ in Stakeholder.LEVEL_CHOICES] + ['legacy']
+        fields = list(Stakeholder.ENGAGEMENT_WEIGHTS)
+        # Written without save(), so every stored score starts stale
+        Stakeholder.objects.bulk_create([
+            Stakeholder(
+                organization_name=organization, stakeholder_name=f'Stakeholder {i}', stakeholder_type='internal',
+                stakeholder_code=f'STK-{i}', slug=f'stakeholder-{i}',
+                satisfaction_level=levels[i % len(levels)], **dict(zip(fields, combination)),
+            )
+            for i, combination in enumerate(itertools.product(levels, repeat=len(fields)))
+        ])
+
+        stale = Stakeholder.objects.filter(organization_name=organization).count()
+        self.assertEqual(StakeholderScoringService.diff(organization)['changed'], stale)
+        self.assertEqual(StakeholderScoringService.recompute(organization), stale)
+
+        for stakeholder in Stakeholder.objects.filter(organization_name=organization):
+            score = Stakeholder.engagement_priority_for(*(getattr(stakeholder, field) for field in (
+                'impact_level', 'influence_score', 'interest_level', 'risk_level',
+            )))
+            is_key, requires_attention = Stakeholder.engagement_flags(
+                score, stakeholder.risk_level, stakeholder.satisfaction_level,
+            )
+            # save() stores the score with the field's one decimal place
+            self.assertEqual(
+                (stakeholder.engagement_priority_score, stakeholder.is_key_stakeholder, stakeholder.requires_attention),
+                (score.quantize(Decimal('0.1')), is_key, requires_attention),
+                stakeholder.stakeholder_name,
+            )
+        self.assertEqual(StakeholderScoringService.diff(organization)['changed'], 0)
+
+
+class InitiativeReportMetricsParityTests(TestCase):
+    """The SQL initiative metrics equal the InitiativeReport properties the dashboard used to sum in Python."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        levels = list(InitiativeReport.STATUS_SCORES)
+        # (budget planned, budget spent, HR planned, HR used); no plan, overspending and a x.x5 utilization
+        amounts = [(0, 50, 0, 3), (1600, 100, 16, 1), (1000, 1250, 40, 40), (300, 100, 30, 7)]
+        for i, (budget, spent, hr, used) in enumerate(amounts * 4):
+            planning = InitiativePlanning.objects.create(
+                organization_name=cls.organization, initiative_focus_area='Growth', initiative_dimension='Sales',
+                initiative_name=f'Initiative {i}', description='Test', total_budget_planned=Decimal(budget),
+                total_hr_planned=Decimal(hr), baseline_status=levels[i % 5], target_status=levels[(i + 3) % 5],
+            )
+            for achieved in levels[i % 2::2]:
+                InitiativeReport.objects.create(
+                    organization_name=cls.organization, initiative_planning=planning,
+                    total_budget_spent=Decimal(spent), total_actual_hr=Decimal(used), achieved_status=achieved,
+                )
+
+    def reports(self):
+        return InitiativeReport.objects.filter(organization_name=self.organization)
+
+    def test_rows_match_the_properties(self):
+        rows = {row['pk']: row for row in InitiativeReportMetricsService.rows(self.reports())}
+
+        for report in self.reports().select_related('initiative_planning'):
+            row = rows[report.pk]
+            self.assertEqual(row['initiative_name'], report.initiative_planning.initiative_name)
+            self.assertEqual(
+                [row[name] for name in (
+                    'budget_planned', 'budget_spent', 'hr_planned', 'hr_used',
+                    'budget_utilization', 'hr_utilization', 'achievement',
+                )],
+                [float(value) for value in (
+                    report.planned_budget, report.total_budget_spent, report.planned_hr, report.total_actual_hr,
+                    report.budget_utilization_percent, report.hr_utilization_percent,
+                    report.status_achievement_percent,
+                )],
+                report.initiative_planning.initiative_name,
+            )
+
+    def test_summary_matches_the_python_totals(self):
+        reports = list(self.reports().select_related('initiative_planning'))
+        budget_utilizations = [r.budget_utilization_percent for r in reports if r.planned_budget > 0]
+        hr_utilizations = [r.hr_utilization_percent for r in reports if r.planned_hr > 0]
+        achievements = [r.status_achievement_percent for r in reports]
+
+        summary = InitiativeReportMetricsService.summary(self.reports())
+
+        self.assertEqual(
+            {name: _rounded(value) for name, value in summary.items()},
+            {name: _rounded(value) for name, value in {
+                'total_reports': len(reports),
+                'initiative_count': len({r.initiative_planning_id for r in reports}),
+                'total_budget_planned': sum(float(r.planned_budget) for r in reports),
+                'total_budget_spent': sum(float(r.total_budget_spent) for r in reports),
+                'total_hr_planned': sum(float(r.planned_hr) for r in reports),
+                'total_hr_used': sum(float(r.total_actual_hr) for r in reports),
+                'avg_budget_utilization': sum(budget_utilizations) / len(budget_utilizations),
+                'avg_hr_utilization': sum(hr_utilizations) / len(hr_utilizations),
+                'avg_achievement': sum(achievements) / len(achievements),
+                'high_performers': sum(1 for value in achievements if value >= 80),
+                'moderate_performers': sum(1 for value in achievements if 60 <= value < 80),
+                'low_performers': sum(1 for value in achievements if value < 60),
+            }.items()},
+        )
+
+
+class StoredReportMetricsParityTests(TestCase):
+    """
+    The metrics ReportMetricsService writes in SQL when a plan changes equal the ones
+    StrategicReport.save() computes from the changed plan.
+    """
+
+    METRICS = ('percent_achieved', 'variance', 'weighted_score')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cycle = StrategicCycle.objects.create(
+            organization_name=cls.organization, time_horizon='1 year', time_horizon_type='Short Term',
+            start_date=datetime.date(2024, 1, 1), end_date=datetime.date(2024, 12, 31),
+        )
+        objective = StrategyHierarchy.objects.create(
+            organization_name=cls.organization, strategic_perspective='Perspective', focus_area='Pillar',
+            objective='Objective', kpi='KPI',
+        )
+        with cls.captureOnCommitCallbacks(execute=True):
+            # (baseline, target, weight); a thirds ratio, a falling target and baseline == target
+            for baseline, target, weight in [(10, 40, 7), (0, 100, 25), (90, 30, 13), (50, 50, 10)]:
+                plan = StrategicActionPlan.objects.create(
+                    organization_name=cls.organization, strategic_cycle=cycle, strategy_hierarchy=objective,
+                    indicator_type='Lead', direction_of_change='Increasing',
+                    baseline=Decimal(baseline), target=Decimal(target), weight=Decimal(weight),
+                )
+                for achievement in (0, 13, 47):
+                    StrategicReport.objects.create(
+                        organization_name=cls.organization, action_plan=plan, achievement=Decimal(achievement),
+                    )
+
+    def stored(self):
+        return {
+            report.pk: tuple(getattr(report, name) for name in self.METRICS)
+            for report in StrategicReport.objects.filter(organization_name=self.organization)
+        }
+
+    def saved(self):
+        """The metrics after re-saving every report, as StrategicReport.save() computes them."""
+        for report in StrategicReport.objects.filter(organization_name=self.organization).select_related('action_plan'):
+            report.save()
+        return self.stored()
+
+    def test_plan_changes_propagate_the_save_metrics(self):
+        changes = [
+            {'baseline': Decimal(20)},
+            {'target': Decimal(70)},
+            {'weight': Decimal(3)},
+            {'baseline': Decimal(60), 'target': Decimal(60)},
+        ]
+        for plan, change in zip(StrategicActionPlan.objects.filter(organization_name=self.organization), changes):
+            for name, value in change.items():
+                setattr(plan, name, value)
+            with self.captureOnCommitCallbacks(execute=True):
+                plan.save()
+
+        self.assertEqual(self.stored(), self.saved())
+
+    def test_rebuild_matches_the_save_metrics(self):
+        # update() bypasses the plans' signals, so only rebuild() brings the reports up to date
+        StrategicActionPlan.objects.filter(organization_name=self.organization).update(
+            baseline=F('baseline') + 5, target=F('target') * 2, weight=F('weight') + 1,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            ReportMetricsService.rebuild(self.organization)
+
+        self.assertEqual(self.stored(), self.saved())
+
+
+class ReportPeriodParityTests(TestCase):
+    """ReportPeriodService picks the reports SwotReportForm used to keep per action plan in Python."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        other = create_organization('Other')
+        with cls.captureOnCommitCallbacks(execute=True):
+            plans = []
+            for organization in (cls.organization, other, cls.organization):
+                plans.append(StrategicActionPlan.objects.create(
+                    organization_name=organization, indicator_type='Lead', direction_of_change='Increasing',
+                    strategic_cycle=StrategicCycle.objects.create(
+                        organization_name=organization, time_horizon='1 year', time_horizon_type='Short Term',
+                        start_date=datetime.date(2024, 1, 1), end_date=datetime.date(2024, 12, 31),
+                    ),
+                    strategy_hierarchy=StrategyHierarchy.objects.create(
+                        organization_name=organization, strategic_perspective='Perspective', focus_area='Pillar',
+                        objective='Objective', kpi=f'KPI {len(plans)}',
+                    ),
+                    baseline=Decimal(0), target=Decimal(100), weight=Decimal(10),
+                ))
+            # Interleaved, so each plan's latest report is neither the first nor the last one written
+            for plan in plans * 3 + plans[:1]:
+                StrategicReport.objects.create(
+                    organization_name=plan.organization_name, action_plan=plan, achievement=Decimal(50),
+                )
+        cls.plans = plans
+
+    def setUp(self):
+        self.addCleanup(cache.clear)
+
+    def baseline_ids(self):
+        """The old form's pick: the first report of each plan by descending id."""
+        unique_ids, seen = [], set()
+        reports = StrategicReport.objects.filter(organization_name=self.organization).order_by('action_plan', '-id')
+        for report in reports:
+            if report.action_plan_id not in seen:
+                seen.add(report.action_plan_id)
+                unique_ids.append(report.id)
+        return set(unique_ids)
+
+    def test_latest_reports_match_the_python_pick(self):
+        self.assertEqual(
+            set(ReportPeriodService.latest_reports(self.organization).values_list('pk', flat=True)),
+            self.baseline_ids(),
+        )
+
+    def test_choices_follow_new_reports(self):
+        self.assertEqual({pk for pk, label in ReportPeriodService.choices(self.organization)}, self.baseline_ids())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            report = StrategicReport.objects.create(
+                organization_name=self.organization, action_plan=self.plans[2], achievement=Decimal(70),
+            )
+
+        choices = dict(ReportPeriodService.choices(self.organization))
+        self.assertEqual(set(choices), self.baseline_ids())
+        self.assertEqual(choices[report.pk], str(report))
+
+
+class RoleResolverCacheTests(TestCase):
+    """Committed invitation and member changes reach the cached roles without deleting entries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cls.user = CustomUser.objects.create_user(
+            'member', 'member@example.com', 'password', organization_name=cls.organization,
+        )
+
+    def setUp(self):
+        self.addCleanup(cache.clear)
+
+    def role(self):
+        # A fresh user per request, as the authentication middleware loads it
+        return RoleResolver(CustomUser.objects.get(pk=self.user.pk)).role
+
+    def test_invitation_changes(self):
+        self.assertIsNone(self.role())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invitation = OrganizationInvitation.objects.create(
+                organization_name=self.organization, email=self.user.email, role='viewer',
+                invited_by=self.user, status=OrganizationInvitation.ACCEPTED,
+            )
+        self.assertEqual(self.role(), 'viewer')
+
+        invitation.role = 'editor'
+        with self.captureOnCommitCallbacks(execute=True):
+            invitation.save()
+        self.assertEqual(self.role(), 'editor')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invitation.delete()
+        self.assertIsNone(self.role())
+
+    def test_cached_role_is_reused(self):
+        self.role()
+        with self.assertNumQueries(2):
+            # The user and its organization; the role comes from the cache
+            self.assertIsNone(self.role())
+
+    def test_user_leaving_and_rejoining(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            OrganizationInvitation.objects.create(
+                organization_name=self.organization, email=self.user.email, role='editor',
+                invited_by=self.user, status=OrganizationInvitation.ACCEPTED,
+            )
+        self.assertEqual(self.role(), 'editor')
+
+        # Leaving keeps the old entry in the cache; rejoining must not read it back
+        self.user.organization_name = create_organization('Other')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        OrganizationInvitation.objects.filter(email=self.user.email).update(role='viewer')
+        self.user.organization_name = self.organization
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.role(), 'viewer')
+
+    def test_profile_save_keeps_a_newer_permissions_version(self):
+        stale = OrganizationalProfile.objects.get(pk=self.organization.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            OrganizationInvitation.objects.create(organization_name=self.organization, email='new@example.com')
+        stale.contact_personnel = 'Manager'
+        stale.save()
+        self.organization.refresh_from_db()
+        self.assertEqual(self.organization.permissions_version, 1)
+        self.assertEqual(self.organization.contact_personnel, 'Manager')
+
+
+class StaleExportJobTests(TestCase):
+    """
+    A job left running by a worker that stopped is queued again and picked up by the next worker,
+    and the first worker can no longer change it.
+    """
+
+    def create_running_job(self, heartbeat_seconds_ago, params_key):
+        started_at = timezone.now() - datetime.timedelta(seconds=EXPORT_JOB_STALE_AFTER * 10)
+        return ExportJob.objects.create(
+            organization_name=create_organization('Acme'), export_type='stakeholder', params_key=params_key,
+            status=ExportJob.STATUS_RUNNING, progress=40, rows_written=400, started_at=started_at,
+            heartbeat_at=timezone.now() - datetime.timedelta(seconds=heartbeat_seconds_ago),
+        )
+
+    def test_stale_job_is_claimed_again(self):
+        stale = self.create_running_job(EXPORT_JOB_STALE_AFTER + 60, 'stale')
+        # Started as long ago, but still reporting progress
+        active = self.create_running_job(EXPORT_JOB_STALE_AFTER - 60, 'active')
+
+        claimed = ExportJobService.claim_next()
+
+        self.assertEqual(claimed.pk, stale.pk)
+        self.assertEqual(claimed.status, ExportJob.STATUS_RUNNING)
+        self.assertEqual((claimed.progress, claimed.rows_written), (0, 0))
+        self.assertGreater(claimed.started_at, timezone.now() - datetime.timedelta(seconds=60))
+        active.refresh_from_db()
+        self.assertEqual(active.status, ExportJob.STATUS_RUNNING)
+        self.assertIsNone(ExportJobService.claim_next())
+
+    def test_superseded_worker_leaves_the_job_alone(self):
+        stale = self.create_running_job(EXPORT_JOB_STALE_AFTER + 60, 'stale')
+        claimed = ExportJobService.claim_next()
+
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            # The first worker wakes up and finishes its run of the job
+            job = ExportJobService.run(stale)
+
+            self.assertEqual(job.status, ExportJob.STATUS_RUNNING)
+            self.assertEqual((job.started_at, job.progress, job.rows_written), (claimed.started_at, 0, 0))
+            self.assertFalse(job.file)
+
+            job = ExportJobService.run(claimed)
+            self.assertEqual(job.status, ExportJob.STATUS_DONE)
+            self.assertTrue(ExportJobService.file_exists(job))
+
+
+class ExpiredExportJobTests(TestCase):
+    """Finished jobs and their files are deleted once EXPORT_JOB_RETENTION has passed."""
+
+    def test_expired_jobs_are_deleted_with_their_files(self):
+        organization = create_organization('Acme')
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            jobs = []
+            for finished_seconds_ago in (EXPORT_JOB_RETENTION + 60, EXPORT_JOB_RETENTION - 60):
+                job = ExportJob.objects.create(
+                    organization_name=organization, export_type='stakeholder',
+                    params_key=str(finished_seconds_ago), status=ExportJob.STATUS_DONE,
+                    finished_at=timezone.now() - datetime.timedelta(seconds=finished_seconds_ago),
+                )
+                job.file.save('stakeholders.xlsx', ContentFile(b'xlsx'))
+                jobs.append(job)
+            queued = ExportJob.objects.create(organization_name=organization, export_type='stakeholder', params_key='q')
+            expired, kept = jobs
+
+            self.assertEqual(ExportJobService.purge_expired(), 1)
+
+            self.assertFalse(ExportJob.objects.filter(pk=expired.pk).exists())
+            self.assertFalse(expired.file.storage.exists(expired.file.name))
+            self.assertTrue(ExportJobService.file_exists(kept))
+            self.assertTrue(ExportJob.objects.filter(pk=queued.pk).exists())
+
+
+class ChartPayloadTests(TestCase):
+    """Chart data and figures share one template, sent once per payload."""
+
+    def test_chart_data_and_figures_share_the_template(self):
+        payload = ChartPayload.build({
+            'figure': go.Figure(go.Bar(x=['a'], y=[1])),
+            'data': ChartPayload.chart('bars', x=['a'], series=[{'name': 'Count', 'y': [1]}]),
+            'empty': None,
+        })
+
+        self.assertEqual(len(payload['templates']), 1)
+        self.assertEqual(payload['charts']['data']['template'], payload['charts']['figure']['layout']['template'])
+        self.assertEqual(payload['charts']['data']['kind'], 'bars')
+        self.assertIsNone(payload['charts']['empty'])
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            ChartPayload.chart('sunburst')
+
+
+class StrategicReportRollupParityTests(TestCase):
+    """
+    The dashboard's rollup of the precomputed aggregates gives the numbers the dashboard used to
+    compute with one GROUP BY query per section over the reports.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cycles = [
+            StrategicCycle.objects.create(
+                organization_name=cls.organization, time_horizon='1 year', time_horizon_type='Short Term',
+                start_date=datetime.date(2024, month, 1), end_date=datetime.date(2025, month, 28),
+            )
+            for month in (3, 9)
+        ]
+        objectives = [
+            StrategyHierarchy.objects.create(
+                organization_name=cls.organization, strategic_perspective=f'Perspective {i % 2}',
+                focus_area=f'Pillar {i % 2}', objective=f'Objective {i % 2}', kpi=f'KPI {i}',
+            )
+            for i in range(3)
+        ]
+        bodies = [
+            Stakeholder.objects.create(
+                organization_name=cls.organization, stakeholder_name=f'Department {i}', stakeholder_type='internal',
+            )
+            for i in range(3)
+        ]
+        statuses = ['pending', 'in_progress', 'completed']
+        with cls.captureOnCommitCallbacks(execute=True):
+            for i in range(6):
+                plan = StrategicActionPlan.objects.create(
+                    organization_name=cls.organization, strategic_cycle=cycles[i % 2],
+                    strategy_hierarchy=objectives[i % 3], indicator_type='Lead', direction_of_change='Increasing',
+                    baseline=Decimal(10), target=Decimal(110), weight=Decimal(5 + i),
+                )
+                # No body, one body, and two bodies sharing the plan's reports
+                plan.responsible_bodies.set(bodies[:i % 3])
+                for j in range(i + 2):
+                    StrategicReport.objects.create(
+                        organization_name=cls.organization, action_plan=plan,
+                        achievement=Decimal(17 * i + 13 * j), status=statuses[(i + j) % 3],
+                    )
+
+            # Another organization's reports never reach the numbers
+            other = create_organization('Other')
+            other_plan = StrategicActionPlan.objects.create(
+                organization_name=other, indicator_type='Lead', direction_of_change='Increasing',
+                strategic_cycle=StrategicCycle.objects.create(
+                    organization_name=other, time_horizon='1 year', time_horizon_type='Short Term',
+                    start_date=datetime.date(2024, 3, 1), end_date=datetime.date(2025, 3, 28),
+                ),
+                strategy_hierarchy=StrategyHierarchy.objects.create(
+                    organization_name=other, strategic_perspective='Perspective 0', focus_area='Pillar 0',
+                    objective='Objective 0', kpi='KPI 0',
+                ),
+                baseline=Decimal(0), target=Decimal(100), weight=Decimal(100),
+            )
+            StrategicReport.objects.create(organization_name=other, action_plan=other_plan, achievement=Decimal(500))
+        cls.cycles = cycles
+
+    def baseline_reports(self, cycle_id):
+        reports = StrategicReport.objects.filter(organization_name=self.organization)
+        if cycle_id:
+            reports = reports.filter(action_plan__strategic_cycle_id=cycle_id)
+        return reports
+
+    def baseline_groups(self, reports, **group):
+        """{key: (report count, average % achieved, average weighted score)}, as the old dashboard queried them."""
+        rows = reports.values(**group).annotate(
+            count=Count('id'), achievement=Avg('percent_achieved'), weighted=Avg('weighted_score'),
+        ).order_by()
+        return {
+            tuple(row[name] for name in group) if len(group) > 1 else row[next(iter(group))]:
+                (row['count'], _rounded(row['achievement']), _rounded(row['weighted']))
+            for row in rows
+        }
+
+    def baseline_performance(self, reports, field):
+        """The old dashboard's per-month values and ranking of one dimension."""
+        groups = self.baseline_groups(
+            reports.filter(**{f'{field}__isnull': False, 'action_plan__strategic_cycle__end_date__isnull': False}),
+            month=TruncMonth('action_plan__strategic_cycle__end_date'), key=F(field),
+        )
+        by_month, performance = {}, {}
+        for (month, key), (count, achievement, weighted) in sorted(groups.items()):
+            by_month.setdefault(month.strftime('%b %Y'), {})[key] = achievement
+            data = performance.setdefault(key, {'count': 0, 'achievement': [], 'weighted': []})
+            data['count'] += count
+            data['achievement'].append(achievement)
+            data['weighted'].append(weighted)
+        return by_month, {
+            key: (data['count'], _rounded(sum(data['achievement']) / len(data['achievement'])),
+                  _rounded(sum(data['weighted']) / len(data['weighted'])))
+            for key, data in performance.items()
+        }
+
+    def assertParity(self, cycle_id=None):
+        reports = self.baseline_reports(cycle_id)
+        rollup = StrategicReportRollup.for_organization(self.organization, cycle_id)
+        totals, monthly = rollup.compute(
+            ['total', 'status', 'cycle', 'responsible_body', 'month', 'objective', 'kpi'], by_month=True
+        )
+
+        def metrics(groups):
+            return {
+                key: (data['report_count'], _rounded(data['achievement']), _rounded(data['weighted_score']))
+                for key, data in groups.items()
+            }
+
+        overall = reports.aggregate(count=Count('id'), achievement=Avg('percent_achieved'), weighted=Avg('weighted_score'))
+        self.assertEqual(
+            metrics(totals['total']),
+            {None: (overall['count'], _rounded(overall['achievement']), _rounded(overall['weighted']))},
+        )
+        self.assertEqual(metrics(totals['status']), self.baseline_groups(reports, group_status=F('status')))
+        self.assertEqual(
+            metrics(totals['cycle']), self.baseline_groups(reports, cycle=F('action_plan__strategic_cycle__name')),
+        )
+        self.assertEqual(
+            metrics(totals['responsible_body']),
+            self.baseline_groups(
+                reports.filter(action_plan__responsible_bodies__isnull=False),
+                body=F('action_plan__responsible_bodies__stakeholder_name'),
+            ),
+        )
+        self.assertEqual(
+            metrics(totals['month']),
+            self.baseline_groups(reports, month=TruncMonth('action_plan__strategic_cycle__end_date')),
+        )
+
+        for dimension, field in (
+            ('responsible_body', 'action_plan__responsible_bodies__stakeholder_name'),
+            ('objective', 'action_plan__strategy_hierarchy__objective'),
+            ('kpi', 'action_plan__strategy_hierarchy__kpi'),
+        ):
+            by_month, ranking = StrategicReportRollup.performance(monthly[dimension])
+            expected_by_month, expected_performance = self.baseline_performance(reports, field)
+            self.assertEqual(
+                {month: {key: _rounded(value) for key, value in values.items()} for month, values in by_month.items()},
+                expected_by_month,
+            )
+            self.assertEqual(
+                {key: (data['count'], _rounded(data['avg_achievement']), _rounded(data['avg_weighted']))
+                 for key, data in ranking},
+                expected_performance,
+            )
+            counts = [data['count'] for _, data in ranking]
+            self.assertEqual(counts, sorted(counts, reverse=True))
+
+    def test_organization_wide_numbers_match(self):
+        self.assertParity()
+
+    def test_single_cycle_numbers_match(self):
+        for cycle in self.cycles:
+            self.assertParity(cycle.pk)
+
+    def test_reports_shared_by_several_bodies_are_counted_once(self):
+        totals = StrategicReportRollup.for_organization(self.organization).compute(['total', 'responsible_body'])
+
+        self.assertEqual(totals['total'][None]['report_count'], self.baseline_reports(None).count())
+        # Each body is credited with every report of its plans
+        self.assertGreater(
+            sum(data['report_count'] for data in totals['responsible_body'].values()),
+            self.baseline_reports(None).filter(action_plan__responsible_bodies__isnull=False).distinct().count(),
+        )
+
+
+class CodeSequenceTests(TestCase):
+    """Stakeholder codes continue from the codes issued before the counters, on either allocation path."""
+
+    def setUp(self):
+        self.organization = create_organization('Acme')
+
+    def test_codes_continue_after_the_seeded_highest(self):
+        for code in ('STK-ACM-DEP-0007', 'STK-ACM-DEP-0012', 'STK-ACM-DEP-0003', 'STK-ACM-FIN-0002', 'legacy'):
+            Stakeholder.objects.create(
+                organization_name=self.organization, stakeholder_name=f'Stakeholder {code}',
+                stakeholder_type='internal', stakeholder_code=code,
+            )
+        migration = importlib.import_module('management_project.migrations.0006_codesequence')
+        migration.seed_stakeholder_code_sequences(apps, None)
+
+        stakeholder = Stakeholder.objects.create(
+            organization_name=self.organization, stakeholder_name='Department', stakeholder_type='internal',
+        )
+
+        self.assertEqual(stakeholder.stakeholder_code, 'STK-ACM-DEP-0013')
+        self.assertEqual(SequenceService.next_value('STK-ACM-FIN'), 3)
+
+    def test_locked_update_allocates_the_same_blocks(self):
+        for upsert in (True, False):
+            with self.subTest(upsert=upsert), mock.patch.object(SequenceService, '_can_upsert', return_value=upsert):
+                CodeSequence.objects.all().delete()
+                blocks = [SequenceService.reserve('STK', 3), SequenceService.next_value('STK'),
+                          SequenceService.reserve('STK', 2)]
+                self.assertEqual(blocks, [3, 4, 6])
+
+
+class UniqueSlugTests(TestCase):
+    """Slugs stay unique and within max_length, whatever collides with them and when."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme Strategy Consulting')
+
+    def create_cycle(self):
+        return StrategicCycle.objects.create(
+            organization_name=self.organization, time_horizon='1 year', time_horizon_type='Short Term',
+            start_date=datetime.date(2025, 1, 1), end_date=datetime.date(2025, 12, 31),
+        )
+
+    def test_collisions_get_the_lowest_free_suffix(self):
+        slugs = [self.create_cycle().slug for _ in range(3)]
+
+        base = slugs[0]
+        self.assertEqual(slugs[1:], [f'{base[:48]}-1', f'{base[:48]}-2'])
+        StrategicCycle.objects.get(slug=slugs[1]).delete()
+        self.assertEqual(self.create_cycle().slug, f'{base[:48]}-1')
+
+    def test_long_bases_are_cut_to_max_length(self):
+        max_length = StrategicCycle._meta.get_field('slug').max_length
+        first, second = self.create_cycle(), self.create_cycle()
+
+        # The base (name, horizon and dates) is far longer than the field: the slug is its start,
+        # cut further for a suffix
+        self.assertEqual(len(first.slug), max_length)
+        self.assertTrue(slugify(first.name).startswith(first.slug))
+        self.assertEqual(second.slug, f"{first.slug[:max_length - 2].rstrip('-')}-1")
+
+    def test_slug_taken_by_a_concurrent_writer_is_replaced(self):
+        taken = self.create_cycle().slug
+        generate = UniqueSlugService.generate
+        calls = []
+
+        def generate_stale(instance, base, field_name='slug', reserved=()):
+            # The first pick was free when read, but another writer saved it before our insert
+            calls.append(base)
+            return taken if len(calls) == 1 else generate(instance, base, field_name, reserved)
+
+        with mock.patch.object(UniqueSlugService, 'generate', side_effect=generate_stale):
+            cycle = self.create_cycle()
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cycle.slug, f'{taken[:48]}-1')
+        self.assertEqual(StrategicCycle.objects.filter(slug=taken).count(), 1)
+
+
+class SearchIndexTests(TestCase):
+    """Searches match word prefixes within the organization, on SQLite (FTS5) and PostgreSQL (tsvector) alike."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = create_organization('Acme')
+        cls.john = Stakeholder.objects.create(
+            organization_name=cls.organization, stakeholder_name='John Smith',
+            stakeholder_type='internal', department='Finance',
+        )
+        Stakeholder.objects.create(
+            organization_name=cls.organization, stakeholder_name='Mary Jones',
+            stakeholder_type='internal', department='Operations',
+        )
+        Stakeholder.objects.create(
+            organization_name=create_organization('Other'), stakeholder_name='John Outsider',
+            stakeholder_type='internal',
+        )
+
+    def setUp(self):
+        if not (SearchIndexService.uses_fts() or SearchIndexService.uses_tsvector()):
+            self.skipTest("Substring matching on this database")
+
+    def matching_names(self, query):
+        stakeholders = SearchIndexService.filter(Stakeholder.objects.all(), 'stakeholder', self.organization, query)
+        return sorted(stakeholders.values_list('stakeholder_name', flat=True))
+
+    def test_filter_matches_word_prefixes(self):
+        self.assertEqual(self.matching_names('jo'), ['John Smith', 'Mary Jones'])
+        self.assertEqual(self.matching_names('john fin'), ['John Smith'])
+        self.assertEqual(self.matching_names('ohn'), [])
+
+    def test_search_ranks_and_highlights(self):
+        results = SearchIndexService.search(self.organization, 'finance')
+
+        self.assertEqual([(result['kind'], result['object_id']) for result in results], [('stakeholder', self.john.pk)])
+        self.assertEqual(results[0]['title'], 'John Smith')
+        self.assertIn('<mark>Finance</mark>', results[0]['snippet'])
+
+        results = SearchIndexService.search(self.organization, 'john')
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['title'], '<mark>John</mark> Smith')
@@ -26,6 +26,7 @@ urlpatterns = [
     # ✅ Export to Excel
     path('swot-analysis/export/', views.export_swot_analysis_to_excel, name='export_swot_analysis_to_excel'),
     path('swot-chart/', views.swot_analysis_chart, name='swot_analysis_report'),
+    path('swot-chart/data/', views.swot_analysis_chart_data, name='swot_analysis_chart_data'),
 
     # Vision
     path('vision/', views.vision_list, name='vision_list'),
@@ -56,12 +57,14 @@ urlpatterns = [
     path('stakeholders/', views.stakeholder_list, name='stakeholder_list'),
     # Export Stakeholders to Excel
     path("stakeholders/export/", views.export_stakeholders_to_excel, name="export_stakeholders"),
+    path("stakeholders/import/", views.import_stakeholders, name="import_stakeholders"),
     # Create update a Stakeholder
     path('stakeholders/create/', views.create_stakeholder, name='create_stakeholder'),
     path('stakeholders/update/<int:pk>/', views.update_stakeholder, name='update_stakeholder'),
     path('stakeholders/delete/<int:pk>/', views.delete_stakeholder, name='delete_stakeholder'),
     # Stakeholder Graph / Analytics View
     path('stakeholders/graph/', views.stakeholder_graph_view, name='stakeholder_graph'),
+    path('stakeholders/graph/data/', views.stakeholder_graph_data, name='stakeholder_graph_data'),
 
 
     # strategy cycle
@@ -85,11 +88,13 @@ urlpatterns = [
     #export excel
     path('strategic-reports/export/<slug:cycle_slug>/', views.export_strategic_report_to_excel, name='export_strategic_report'),
     path('strategic-report/chart/', views.strategic_report_chart, name='strategic_report_chart'),
+    path('strategic-report/chart/data/', views.strategic_report_chart_data, name='strategic_report_chart_data'),
 
 
     #action plan
     # Strategic Action Plan Chart
     path( 'strategic-action-plan/chart/', views.strategic_action_plan_chart, name='strategic_action_plan_chart'),
+    path('strategic-action-plan/chart/data/', views.strategic_action_plan_chart_data, name='strategic_action_plan_chart_data'),
     path('strategic-action-plan-by-cycle/', views.strategic_action_plan_by_cycle, name='strategic_action_plan_by_cycle'),
     path('strategic-action-plan/<slug:cycle_slug>/', views.strategic_action_plan_list, name='strategic_action_plan_list'),
     path( 'strategic-action-plan/<slug:slug>/', views.strategic_action_plan_detail, name='strategic_action_plan_detail'),
@@ -110,6 +115,7 @@ urlpatterns = [
     path('swot-report/update/<int:pk>/', views.update_swot_report, name='update_swot_report'),
     path('swot-report/delete/<int:pk>/', views.delete_swot_report, name='delete_swot_report'),
     path('swot-report-chart/', views.swot_report_chart, name='swot_report_chart'),
+    path('swot-report-chart/data/', views.swot_report_chart_data, name='swot_report_chart_data'),
 
     #
     # InitiativePlanning
@@ -131,6 +137,7 @@ urlpatterns = [
     path('initiative-report/delete/<int:pk>/', views.delete_initiative_report, name='delete_initiative_report'),
     path('initiative-report/export/', views.export_initiative_report_to_excel, name='export_initiative_report_to_excel'),
     path('reports/charts/', views.initiative_report_charts, name='initiative_report_charts'),
+    path('reports/charts/data/', views.initiative_report_charts_data, name='initiative_report_charts_data'),
 
     # -------------------- Initiative Resource Item Plan --------------------
     # -------------------- Initiative Resource Item Plan --------------------
@@ -171,5 +178,17 @@ urlpatterns = [
     path("risk-management/<int:pk>/delete/", views.delete_risk_management, name="delete_risk_management"),
     path('risk-management/export/', views.export_risk_management_excel, name='export_risk_management_excel'),
 
+    # Background export jobs
+    path('exports/<uuid:token>/', views.export_job_detail, name='export_job_detail'),
+    path('exports/<uuid:token>/status/', views.export_job_status, name='export_job_status'),
+    path('exports/<uuid:token>/download/', views.export_job_download, name='export_job_download'),
+
+    # Search across stakeholders, reports, SWOT entries and risks
+    path('search/', views.global_search, name='global_search'),
+
+    # Cascading dropdown choices
+    path('choices/<slug:catalog>/', views.choice_options, name='choice_options'),
+    path('choices/<slug:catalog>/search/', views.choice_search, name='choice_search'),
+
 
 ]
@@ -1,9 +1,11 @@
 # views/__init__.py
 from .dashboard import dashboard
+from .choices import choice_options, choice_search
+from .search import global_search
 
 
 from .swot_analysis import swot_analysis_list, create_swot_analysis, update_swot_analysis, delete_swot_analysis, \
-    export_swot_analysis_to_excel, swot_analysis_chart
+    export_swot_analysis_to_excel, swot_analysis_chart, swot_analysis_chart_data
 
 from .invitation import invitation_list, send_invitation, accept_invitation_token, \
     cancel_invitation, delete_invitation
@@ -15,7 +17,7 @@ from .values import values_list, create_values, update_values, delete_values
 from .strategy_hierarchy import strategy_hierarchy_list, create_strategy_hierarchy, update_strategy_hierarchy, delete_strategy_hierarchy
 
 from .stakeholder import  stakeholder_list, create_stakeholder, update_stakeholder, delete_stakeholder, \
-    export_stakeholders_to_excel, stakeholder_graph_view
+    export_stakeholders_to_excel, import_stakeholders, stakeholder_graph_view, stakeholder_graph_data
 
 from .organization import organizational_profile, create_organizational_profile, update_organizational_profile, \
     delete_organizational_profile
@@ -25,15 +27,15 @@ from .strategic_cycle import strategic_cycle_list, create_strategic_cycle, \
 
 from .strategic_action_plan import strategic_action_plan_by_cycle, strategic_action_plan_list, strategic_action_plan_detail, \
     create_strategic_action_plan, update_strategic_action_plan, delete_strategic_action_plan, \
-    export_strategic_action_plan_to_excel, strategic_action_plan_chart
+    export_strategic_action_plan_to_excel, strategic_action_plan_chart, strategic_action_plan_chart_data
 
 from .strategic_report import strategy_report_by_cycle_list, strategic_report_detail, strategic_report_list, \
     create_strategic_report, update_strategic_report, delete_strategic_report, \
-    export_strategic_report_to_excel, strategic_report_chart
+    export_strategic_report_to_excel, strategic_report_chart, strategic_report_chart_data
 
 
 from .swot_report import swot_report_list, \
-    create_swot_report, update_swot_report, delete_swot_report, swot_report_chart
+    create_swot_report, update_swot_report, delete_swot_report, swot_report_chart, swot_report_chart_data
 
 from .initiative_planning import  initiative_planning_list, create_initiative_planning, \
     update_initiative_planning, delete_initiative_planning, \
@@ -41,7 +43,7 @@ from .initiative_planning import  initiative_planning_list, create_initiative_pl
 
 from .initiative_report import initiative_report_list, create_initiative_report, \
     update_initiative_report, delete_initiative_report, export_initiative_report_to_excel, \
-    initiative_report_charts
+    initiative_report_charts, initiative_report_charts_data
 
 
 # -------------------- Initiative Resource Item Plan Views --------------------
@@ -56,4 +58,6 @@ from .initiative_resource_item_report import initiative_resource_item_report_lis
 
 
 from .risk_management import risk_management_list, create_risk_management, \
-    update_risk_management, delete_risk_management, export_risk_management_excel
\ No newline at end of file
+    update_risk_management, delete_risk_management, export_risk_management_excel
+
+from .export_job import export_job_detail, export_job_status, export_job_download
\ No newline at end of file
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_GET
+
+from management_project.services.choice_catalog import ChoiceCatalogService
+
+# The catalogs only change with a deploy; browsers revalidate with the ETag after this
+CHOICE_CATALOG_MAX_AGE = getattr(settings, 'CHOICE_CATALOG_MAX_AGE', 86400)
+CHOICE_SEARCH_MAX_LIMIT = 50
+
+
+@login_required
+@require_GET
+def choice_options(request, catalog):
+    """
+    Next level of a cascading dropdown, e.g.
+    /choices/strategy-hierarchy/?strategic_perspective=Financial -> the pillars of that perspective.
+    """
+    if catalog not in ChoiceCatalogService.CATALOGS:
+        raise Http404("Unknown choice catalog.")
+
+    path = ChoiceCatalogService.selected_path(catalog, request.GET)
+    return _catalog_response(request, *ChoiceCatalogService.options(catalog, path))
+
+
+@login_required
+@require_GET
+def choice_search(request, catalog):
+    """
+    Typeahead over the full paths of a catalog, e.g.
+    /choices/strategy-hierarchy/search/?q=cust sat -> the KPIs under "Customer Satisfaction".
+    """
+    if catalog not in ChoiceCatalogService.CATALOGS:
+        raise Http404("Unknown choice catalog.")
+
+    query = ChoiceCatalogService.search_query(request.GET.get('q', ''))
+    try:
+        limit = int(request.GET.get('limit', ChoiceCatalogService.SEARCH_LIMIT))
+    except ValueError:
+        limit = ChoiceCatalogService.SEARCH_LIMIT
+    limit = max(1, min(limit, CHOICE_SEARCH_MAX_LIMIT))
+    return _catalog_response(request, *ChoiceCatalogService.search(catalog, query, limit))
+
+
+def _catalog_response(request, body, etag):
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, max_age=CHOICE_CATALOG_MAX_AGE)
+    return response
@@ -1,7 +1,7 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from management_project.models import OrganizationalProfile, OrganizationInvitation
-from management_project.services.permissions import role_required, get_user_permissions
+from management_project.services.permissions import role_required, get_request_permissions
 from django.contrib.auth import get_user_model
 
 #
@@ -27,7 +27,7 @@ def dashboard(request):
         return redirect('create_organizational_profile')
 
     # Get permissions for template
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     return render(request, 'dashboard.html', {
         'permissions': permissions
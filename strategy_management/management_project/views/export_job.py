@@ -0,0 +1,56 @@
+from django.contrib.auth.decorators import login_required
+from django.http import FileResponse, Http404, JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+
+from management_project.models import ExportJob
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import ExportJobService
+
+
+def _get_export_job(request, token):
+    return get_object_or_404(
+        ExportJob.objects.select_related('requested_by'),
+        token=token,
+        organization_name=request.user.organization_name,
+    )
+
+
+def _export_job_status(job):
+    return {
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'progress': job.progress,
+        'rows_written': job.rows_written,
+        'finished': job.is_finished,
+        'error': job.error,
+        'download_url': reverse('export_job_download', args=[job.token])
+        if job.status == ExportJob.STATUS_DONE else None,
+    }
+
+
+@login_required
+def export_job_detail(request, token):
+    job = _get_export_job(request, token)
+    return render(request, 'export_job/detail.html', {
+        'job': job,
+        'status': _export_job_status(job),
+    })
+
+
+@login_required
+def export_job_status(request, token):
+    """Polled by the job page until the export is finished."""
+    job = _get_export_job(request, token)
+    return JsonResponse(_export_job_status(job))
+
+
+@login_required
+def export_job_download(request, token):
+    job = _get_export_job(request, token)
+    if job.status != ExportJob.STATUS_DONE or not ExportJobService.file_exists(job):
+        raise Http404("This export is not available.")
+    return FileResponse(
+        job.file.open('rb'), as_attachment=True,
+        filename=job.file.name.rsplit('/', 1)[-1], content_type=ExcelExport.CONTENT_TYPE,
+    )
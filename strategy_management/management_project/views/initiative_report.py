@@ -3,29 +3,30 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 from datetime import date
-import openpyxl
-from openpyxl.styles import Font, Alignment
-from django.http import HttpResponse
-from openpyxl.styles import Font, Alignment, PatternFill
 
 from django.utils import timezone
 from django.db.models.functions import TruncMonth
 
-from django.db.models import Q, Count, Sum, Avg, Max, Min
+from django.db.models import Count, Sum, Avg, Max, Min
 from django.db.models.functions import TruncMonth, TruncYear
 from django.utils import timezone
-from django.http import HttpResponse, JsonResponse
+from django.http import JsonResponse
 from django.core.paginator import Paginator
 
 # Plotly for charts
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from plotly.offline import plot
 # Date/Time
 from datetime import timedelta, datetime, date
 
 from management_project.models import InitiativeReport, InitiativePlanning
 from management_project.forms import InitiativeReportForm
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
+from management_project.services.initiative_report_metrics import InitiativeReportMetricsService
+from management_project.services.search_index import SearchIndexService
 
 # -------------------- LIST  --------------------
 
@@ -48,12 +49,7 @@ def initiative_report_list(request):
 
     # Search filter across InitiativePlanning fields
     if query:
-        timelines = timelines.filter(
-            Q(initiative_planning__initiative_name__icontains=query) |
-            Q(initiative_planning__initiative_dimension__icontains=query) |
-            Q(initiative_planning__initiative_focus_area__icontains=query)
-
-        )
+        timelines = SearchIndexService.filter(timelines, 'initiative_report', request.user.organization_name, query)
 
     # Order by report_date descending
     timelines = timelines.order_by('-report_date')
@@ -143,18 +139,24 @@ def delete_initiative_report(request, pk):
 
 
 @login_required
+@background_export('initiative_report')
 def export_initiative_report_to_excel(request):
     """
     Export InitiativeReport queryset to Excel with colored title and header row.
     Supports filtering by focus area and search query.
     Includes all fields: budget, HR, status, dates, risk, and notes.
     """
-    query = request.GET.get('search', '').strip()
-    selected_focus_area = request.GET.get('initiative_focus_area', '').strip()
+    return build_initiative_report_export(request.user.organization_name, request.GET).response()
+
+
+def build_initiative_report_export(organization, params, progress=None):
+    """Initiative report workbook; shared by the view and background export jobs."""
+    query = params.get('search', '').strip()
+    selected_focus_area = params.get('initiative_focus_area', '').strip()
 
     # Base queryset for user's organization
     reports = InitiativeReport.objects.filter(
-        organization_name=request.user.organization_name
+        organization_name=organization
     ).select_related('initiative_planning')
 
     # Apply filters
@@ -164,27 +166,10 @@ def export_initiative_report_to_excel(request):
         )
 
     if query:
-        reports = reports.filter(
-            Q(initiative_planning__initiative_name__icontains=query) |
-            Q(initiative_planning__initiative_dimension__icontains=query)
-        )
+        reports = SearchIndexService.filter(reports, 'initiative_report', organization, query)
 
     reports = reports.order_by('-report_date')
 
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Initiative Reports"
-
-    # ===== Title Row =====
-    total_columns = 26  # update to match all columns
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=total_columns)
-    title_cell = ws['A1']
-    title_cell.value = "Initiative Performance Reports"
-    title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-    title_cell.fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-    title_cell.alignment = Alignment(horizontal='center', vertical='center')
-
     # ===== Header Row =====
     headers = [
         "Focus Area", "Dimension", "Initiative Name", "Organization", "Report Date",
@@ -195,59 +180,44 @@ def export_initiative_report_to_excel(request):
         "Start Date", "End Date", "Remaining Days", "Remaining Months",
         "Notes"
     ]
-    ws.append(headers)
-
-    # Style header row
-    for cell in ws[2]:  # row 2 after title
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    # ===== Fill Data Rows =====
-    for r in reports:
-        row = [
-            r.initiative_planning.initiative_focus_area,
-            r.initiative_planning.initiative_dimension,
-            r.initiative_planning.initiative_name,
-            str(r.organization_name),
-            r.report_date.strftime("%Y-%m-%d"),
-            float(r.planned_budget),
-            float(r.total_budget_spent),
-            float(r.budget_remaining),
-            float(r.budget_utilization_percent),
-            float(r.total_actual_hr),
-            float(r.remaining_hr),
-            r.initiative_planning.baseline_status,
-            r.initiative_planning.target_status,
-            r.achieved_status,
-            float(r.status_achievement_percent),
-            r.initiative_planning.priority,
-            r.initiative_planning.impact,
-            r.initiative_planning.likelihood,
-            r.initiative_planning.risk_level,
-            r.initiative_planning.start_date.strftime("%Y-%m-%d") if r.initiative_planning.start_date else "",
-            r.initiative_planning.end_date.strftime("%Y-%m-%d") if r.initiative_planning.end_date else "",
-            r.remaining_days or "",
-            r.remaining_months or "",
-            r.notes or "",
-        ]
-        ws.append(row)
-
-    # ===== Adjust Column Widths =====
-    for column_cells in ws.iter_cols(min_row=2):
-        non_merged_cells = [cell for cell in column_cells if not isinstance(cell, openpyxl.cell.cell.MergedCell)]
-        if not non_merged_cells:
-            continue
-        length = max(len(str(cell.value)) if cell.value else 0 for cell in non_merged_cells)
-        ws.column_dimensions[non_merged_cells[0].column_letter].width = min(length + 2, 50)
-
-    # ===== Create Response =====
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+    # ===== Data Rows, produced lazily so the export streams =====
+    def report_rows():
+        for r in reports.iterator(chunk_size=2000):
+            yield [
+                r.initiative_planning.initiative_focus_area,
+                r.initiative_planning.initiative_dimension,
+                r.initiative_planning.initiative_name,
+                str(r.organization_name),
+                r.report_date.strftime("%Y-%m-%d"),
+                float(r.planned_budget),
+                float(r.total_budget_spent),
+                float(r.budget_remaining),
+                float(r.budget_utilization_percent),
+                float(r.total_actual_hr),
+                float(r.remaining_hr),
+                r.initiative_planning.baseline_status,
+                r.initiative_planning.target_status,
+                r.achieved_status,
+                float(r.status_achievement_percent),
+                r.initiative_planning.priority,
+                r.initiative_planning.impact,
+                r.initiative_planning.likelihood,
+                r.initiative_planning.risk_level,
+                r.initiative_planning.start_date.strftime("%Y-%m-%d") if r.initiative_planning.start_date else "",
+                r.initiative_planning.end_date.strftime("%Y-%m-%d") if r.initiative_planning.end_date else "",
+                r.remaining_days or "",
+                r.remaining_months or "",
+                r.notes or "",
+            ]
+
+    # ===== Build the workbook =====
+    export = ExcelExport("initiative_reports.xlsx", title_color="1F4E78", header_color="4F81BD", progress=progress)
+    export.add_sheet(
+        "Initiative Reports", headers, report_rows(),
+        heading="Initiative Performance Reports", min_width=0, max_width=50, total_rows=reports.count,
     )
-    response['Content-Disposition'] = 'attachment; filename=initiative_reports.xlsx'
-    wb.save(response)
-    return response
+    return export
 
 # views.py
 
@@ -255,16 +225,44 @@ def export_initiative_report_to_excel(request):
 @login_required
 def initiative_report_charts(request):
     """Complete initiative dashboard with all charts and KPIs in single view"""
+    context = _cached_initiative_report_charts_context(request)
+    return render(request, 'initiative_report/chart.html', context)
+
+
+@login_required
+def initiative_report_charts_data(request):
+    """Chart series of the initiative dashboard, drawn client-side by charts.js."""
+    context = _cached_initiative_report_charts_context(request)
+    return JsonResponse(context['charts'], encoder=ChartPayload.ENCODER)
+
+
+def _cached_initiative_report_charts_context(request):
+    time_range = request.GET.get('time_range', 'all')
+    params = {
+        'search': request.GET.get('search', '').strip(),
+        'initiative_focus_area': request.GET.get('initiative_focus_area', '').strip(),
+        'time_range': time_range,
+        # Relative time ranges move with the calendar, not only with data writes
+        'today': timezone.now().date() if time_range != 'all' else '',
+    }
+    return ChartCacheService.get_or_build(
+        'initiative_report_charts', request.user.organization_name, params,
+        lambda: _initiative_report_charts_context(request),
+    )
+
+
+def _initiative_report_charts_context(request):
+    """Dashboard context for the initiative report charts, cached by ChartCacheService."""
 
     # Get filter parameters
     query = request.GET.get('search', '').strip()
     selected_focus_area = request.GET.get('initiative_focus_area', '').strip()
     time_range = request.GET.get('time_range', 'all')
 
-    # Base queryset with optimal database queries
+    # Base queryset; the metrics below are read with values() and aggregates
     reports = InitiativeReport.objects.filter(
         organization_name=request.user.organization_name
-    ).select_related('initiative_planning')
+    )
 
     # Apply time range filter
     if time_range != 'all':
@@ -282,42 +280,34 @@ def initiative_report_charts(request):
         reports = reports.filter(initiative_planning__initiative_focus_area=selected_focus_area)
 
     if query:
-        reports = reports.filter(
-            Q(initiative_planning__initiative_name__icontains=query) |
-            Q(initiative_planning__initiative_dimension__icontains=query) |
-            Q(initiative_planning__initiative_focus_area__icontains=query)
-        )
+        reports = SearchIndexService.filter(reports, 'initiative_report', request.user.organization_name, query)
 
     # Get focus areas for dropdown
     focus_areas = InitiativePlanning.objects.filter(
         organization_name=request.user.organization_name
     ).values_list('initiative_focus_area', flat=True).distinct().order_by('initiative_focus_area')
 
-    # Calculate comprehensive statistics
-    total_reports = reports.count()
-    reports_list = list(reports)
-
-    # Calculate KPIs using model properties
-    total_budget_planned = sum(float(report.planned_budget) for report in reports_list)
-    total_budget_spent = sum(float(report.total_budget_spent) for report in reports_list)
-    total_hr_planned = sum(float(report.planned_hr) for report in reports_list)
-    total_hr_used = sum(float(report.total_actual_hr) for report in reports_list)
+    # Per-report figures and headline KPIs are computed by the database
+    reports_list = InitiativeReportMetricsService.rows(reports)
+    summary = InitiativeReportMetricsService.summary(reports)
+    total_reports = summary['total_reports']
 
-    budget_utilizations = [report.budget_utilization_percent for report in reports_list if report.planned_budget > 0]
-    hr_utilizations = [report.hr_utilization_percent for report in reports_list if report.planned_hr > 0]
-    achievement_values = [report.status_achievement_percent for report in reports_list]
+    total_budget_planned = summary['total_budget_planned']
+    total_budget_spent = summary['total_budget_spent']
+    total_hr_planned = summary['total_hr_planned']
+    total_hr_used = summary['total_hr_used']
 
-    avg_budget_utilization = sum(budget_utilizations) / len(budget_utilizations) if budget_utilizations else 0
-    avg_hr_utilization = sum(hr_utilizations) / len(hr_utilizations) if hr_utilizations else 0
-    avg_achievement = sum(achievement_values) / len(achievement_values) if achievement_values else 0
+    avg_budget_utilization = summary['avg_budget_utilization']
+    avg_hr_utilization = summary['avg_hr_utilization']
+    avg_achievement = summary['avg_achievement']
 
     remaining_budget = total_budget_planned - total_budget_spent
     remaining_hr = total_hr_planned - total_hr_used
 
     # Performance distribution
-    high_performers = sum(1 for r in reports_list if r.status_achievement_percent >= 80)
-    moderate_performers = sum(1 for r in reports_list if 60 <= r.status_achievement_percent < 80)
-    low_performers = sum(1 for r in reports_list if r.status_achievement_percent < 60)
+    high_performers = summary['high_performers']
+    moderate_performers = summary['moderate_performers']
+    low_performers = summary['low_performers']
 
     # Status distribution
     status_distribution = reports.values('achieved_status').annotate(
@@ -373,9 +363,9 @@ def initiative_report_charts(request):
 
     # Chart 1: Budget Planned vs Actual
     if reports_list:
-        initiative_names = [report.initiative_planning.initiative_name for report in reports_list]
-        planned_budgets = [float(report.planned_budget) for report in reports_list]
-        actual_spent = [float(report.total_budget_spent) for report in reports_list]
+        initiative_names = [report['initiative_name'] for report in reports_list]
+        planned_budgets = [report['budget_planned'] for report in reports_list]
+        actual_spent = [report['budget_spent'] for report in reports_list]
 
         fig1 = go.Figure()
         fig1.add_trace(go.Bar(
@@ -419,15 +409,15 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=60, r=40, t=80, b=120)
         )
-        charts['budget_chart'] = plot(fig1, output_type='div', include_plotlyjs=False)
+        charts['budget_chart'] = fig1
     else:
         charts['budget_chart'] = create_empty_chart("No budget data available", axis_config)
 
     # Chart 2: HR Planned vs Actual
     if reports_list:
-        initiative_names = [report.initiative_planning.initiative_name for report in reports_list]
-        planned_hr = [float(report.planned_hr) for report in reports_list]
-        actual_hr = [float(report.total_actual_hr) for report in reports_list]
+        initiative_names = [report['initiative_name'] for report in reports_list]
+        planned_hr = [report['hr_planned'] for report in reports_list]
+        actual_hr = [report['hr_used'] for report in reports_list]
 
         fig2 = go.Figure()
         fig2.add_trace(go.Bar(
@@ -470,14 +460,14 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=60, r=40, t=80, b=120)
         )
-        charts['hr_chart'] = plot(fig2, output_type='div', include_plotlyjs=False)
+        charts['hr_chart'] = fig2
     else:
         charts['hr_chart'] = create_empty_chart("No HR data available", axis_config)
 
     # Chart 3: Status Achievement %
     if reports_list:
-        initiative_names = [report.initiative_planning.initiative_name for report in reports_list]
-        achievement_percent = [report.status_achievement_percent for report in reports_list]
+        initiative_names = [report['initiative_name'] for report in reports_list]
+        achievement_percent = [report['achievement'] for report in reports_list]
 
         # Sort by achievement percentage for better visualization
         sorted_data = sorted(zip(initiative_names, achievement_percent), key=lambda x: x[1])
@@ -520,14 +510,14 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=60, r=40, t=80, b=120)
         )
-        charts['achievement_chart'] = plot(fig3, output_type='div', include_plotlyjs=False)
+        charts['achievement_chart'] = fig3
     else:
         charts['achievement_chart'] = create_empty_chart("No achievement data available", axis_config)
 
     # Chart 4: Budget Utilization %
     if reports_list:
-        initiative_names = [report.initiative_planning.initiative_name for report in reports_list]
-        utilization_percent = [report.budget_utilization_percent for report in reports_list]
+        initiative_names = [report['initiative_name'] for report in reports_list]
+        utilization_percent = [report['budget_utilization'] for report in reports_list]
 
         # Sort by utilization for better visualization
         sorted_data = sorted(zip(initiative_names, utilization_percent), key=lambda x: x[1])
@@ -577,14 +567,14 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=80, r=40, t=80, b=80)
         )
-        charts['budget_utilization_chart'] = plot(fig4, output_type='div', include_plotlyjs=False)
+        charts['budget_utilization_chart'] = fig4
     else:
         charts['budget_utilization_chart'] = create_empty_chart("No budget utilization data available", axis_config)
 
     # Chart 5: HR Utilization %
     if reports_list:
-        initiative_names = [report.initiative_planning.initiative_name for report in reports_list]
-        utilization_percent = [report.hr_utilization_percent for report in reports_list]
+        initiative_names = [report['initiative_name'] for report in reports_list]
+        utilization_percent = [report['hr_utilization'] for report in reports_list]
 
         # Sort by utilization for better visualization
         sorted_data = sorted(zip(initiative_names, utilization_percent), key=lambda x: x[1])
@@ -634,7 +624,7 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=80, r=40, t=80, b=80)
         )
-        charts['hr_utilization_chart'] = plot(fig5, output_type='div', include_plotlyjs=False)
+        charts['hr_utilization_chart'] = fig5
     else:
         charts['hr_utilization_chart'] = create_empty_chart("No HR utilization data available", axis_config)
 
@@ -672,29 +662,29 @@ def initiative_report_charts(request):
             plot_bgcolor='white',
             margin=dict(l=60, r=40, t=80, b=120)
         )
-        charts['monthly_trend_chart'] = plot(fig6, output_type='div', include_plotlyjs=False)
+        charts['monthly_trend_chart'] = fig6
     else:
         charts['monthly_trend_chart'] = create_empty_chart("No monthly trend data available", axis_config)
 
     context = {
-        'charts': charts,
-        'focus_areas': focus_areas,
+        'charts': ChartPayload.build(charts),
+        'focus_areas': list(focus_areas),
         'selected_focus_area': selected_focus_area,
         'search_query': query,
         'time_range': time_range,
         'stats': stats,
-        'status_distribution': status_distribution,
+        'status_distribution': list(status_distribution),
         'performance_distribution': performance_distribution,
         'total_reports': total_reports,
-        'initiative_count': len(set(r.initiative_planning_id for r in reports_list)),
+        'initiative_count': summary['initiative_count'],
         'monthly_trends': list(monthly_trends),
     }
 
-    return render(request, 'initiative_report/chart.html', context)
+    return context
 
 
 def create_empty_chart(message, axis_config):
-    """Create an empty chart with message and visible axes"""
+    """Create an empty chart figure with message and visible axes"""
     fig = go.Figure()
     fig.add_annotation(
         text=message,
@@ -723,7 +713,7 @@ def create_empty_chart(message, axis_config):
         ),
         margin=dict(l=60, r=40, t=80, b=80)
     )
-    return plot(fig, output_type='div', include_plotlyjs=False)
+    return fig
 #
 # @login_required
 # def initiative_report_charts(request):
@@ -5,6 +5,7 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from management_project.models import InitiativeResourceItemReport, InitiativeResourceItemPlan, InitiativePlanning
 from management_project.forms import InitiativeResourceItemReportForm
+from management_project.services.initiative_resource_usage import InitiativeResourceUsageService
 
 # -------------------- LIST INITIATIVE RESOURCE ITEM REPORTS --------------------
 @login_required
@@ -14,9 +15,7 @@ def initiative_resource_item_report_list(request):
     page_number = request.GET.get('page', 1)
 
     # Base queryset: all resource item reports for user's organization
-    reports = InitiativeResourceItemReport.objects.filter(
-        initiative_resource_plan__organization=request.user.organization_name
-    ).select_related('initiative_resource_plan', 'initiative_resource_plan__initiative_name')
+    reports = InitiativeResourceUsageService.report_queryset(request.user.organization_name)
 
     # Filter by selected initiative
     selected_initiative_name = None
@@ -12,7 +12,7 @@ from management_project.models import OrganizationalProfile, OrganizationInvitat
 from account.models import CustomUser
 from account.forms import CustomUserRegistrationForm
 from management_project.forms import OrganizationInvitationForm
-from management_project.services.permissions import role_required_invitation, get_user_permissions
+from management_project.services.permissions import role_required_invitation, get_request_permissions
 from django.contrib.auth import login
 
 
@@ -23,7 +23,7 @@ def invitation_list(request):
     """List all invitations for the current organization."""
     org = get_object_or_404(OrganizationalProfile, organization_name=request.user.organization_name)
 
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     invitations = org.invitations.all().order_by('-created_at')
 
@@ -40,7 +40,7 @@ def invitation_list(request):
 @role_required_invitation(['editor'])
 def send_invitation(request):
     """Send invitation if user has permission."""
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
     if not permissions.get('invitation_send', False):
         return HttpResponseForbidden("You do not have permission to send invitations.")
 
@@ -84,7 +84,7 @@ def send_invitation(request):
 @role_required_invitation(['editor'])
 def cancel_invitation(request, pk):
     """Cancel pending invitation."""
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
     if not permissions.get('invitation_delete', False):
         return HttpResponseForbidden("You do not have permission to cancel invitations.")
 
@@ -113,7 +113,7 @@ def cancel_invitation(request, pk):
 @role_required_invitation(['editor'])
 def delete_invitation(request, pk):
     """Permanently delete an invitation."""
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
     if not permissions.get('invitation_delete', False):
         return HttpResponseForbidden("You do not have permission to delete invitations.")
 
@@ -4,7 +4,7 @@ from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 from management_project.models import Mission
 from management_project.forms import MissionForm
-from management_project.services.permissions import role_required, get_user_permissions
+from management_project.services.permissions import role_required, get_request_permissions
 
 # -------------------- MISSION LIST --------------------
 @login_required
@@ -20,7 +20,7 @@ def mission_list(request):
     page_obj = paginator.get_page(page_number)
 
     # Get user permissions
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Only show form if user has create permission
     form = MissionForm() if permissions.get('mission_create', False) else None
@@ -38,7 +38,7 @@ def mission_list(request):
 @login_required
 @role_required(['editor'])  # Only editor can create
 def create_mission(request):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
     if request.method == 'POST':
         form = MissionForm(request.POST)
         if form.is_valid():
@@ -69,7 +69,7 @@ def update_mission(request, pk):
         pk=pk,
         organization_name=request.user.organization_name
     )
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     if request.method == 'POST':
         form = MissionForm(request.POST, instance=mission)
@@ -100,7 +100,7 @@ def delete_mission(request, pk):
         pk=pk,
         organization_name=request.user.organization_name
     )
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     if request.method == 'POST':
         mission.delete()
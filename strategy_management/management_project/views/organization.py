@@ -122,7 +122,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from management_project.models import OrganizationalProfile, OrganizationInvitation
 from management_project.forms import OrganizationalProfileForm
-from management_project.services.permissions import role_required, get_user_permissions
+from management_project.services.permissions import role_required, get_request_permissions
 from django.http import HttpResponseForbidden
 
 # --------------------
@@ -131,7 +131,7 @@ from django.http import HttpResponseForbidden
 @login_required
 @role_required(['editor', 'viewer'])
 def organizational_profile(request):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Only show profiles for the user's organization
     organizational_profiles = OrganizationalProfile.objects.filter(
@@ -150,7 +150,7 @@ def organizational_profile(request):
 # --------------------
 @login_required
 def create_organizational_profile(request):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Prevent creating if user already belongs to an accepted invitation
     if OrganizationInvitation.objects.filter(email=request.user.email, status='accepted').exists():
@@ -167,7 +167,7 @@ def create_organizational_profile(request):
             request.user.save()
 
             # Automatically create invitation for creator as editor
-            OrganizationInvitation.objects.create(
+            invitation = OrganizationInvitation.objects.create(
                 organization_name=org,
                 email=request.user.email,
                 role='editor',
@@ -195,7 +195,7 @@ def create_organizational_profile(request):
 # --------------------
 @login_required
 def update_organizational_profile(request, pk):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Ensure user can only update their organization
     organizational_profile = get_object_or_404(
@@ -227,7 +227,7 @@ def update_organizational_profile(request, pk):
 # --------------------
 @login_required
 def delete_organizational_profile(request, pk):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Ensure user can only delete their organization
     profile = get_object_or_404(
@@ -2,18 +2,12 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
-from django.db.models import Q
 
 from management_project.models import RiskManagement, StrategicCycle
 from management_project.forms import RiskManagementForm
-
-from io import BytesIO
-from django.http import HttpResponse
-from django.db.models import Q
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
+from management_project.services.search_index import SearchIndexService
 
 
 # -------------------- LIST (Category-based) --------------------
@@ -34,11 +28,7 @@ def risk_management_list(request):
 
     # Apply search filter (name, category, or mitigation)
     if search_query:
-        risks = risks.filter(
-            Q(risk_category__icontains=search_query) |
-            Q(risk_name__icontains=search_query) |
-            Q(mitigation_action__icontains=search_query)
-        )
+        risks = SearchIndexService.filter(risks, 'risk', request.user.organization_name, search_query)
 
     # Order by category (A-Z), then newest first
     risks = risks.order_by('risk_category', '-created_at')
@@ -145,14 +135,20 @@ def split_two_lines(text):
     return " ".join(words[:mid]) + "\n" + " ".join(words[mid:])
 
 @login_required
+@background_export('risk_management')
 def export_risk_management_excel(request):
     """Export risk management entries to Excel with strategic cycle filtering and search."""
-    search_query = request.GET.get('search', '').strip()
-    strategic_cycle_id = request.GET.get('strategic_cycle', '').strip()
+    return build_risk_management_export(request.user.organization_name, request.GET).response()
 
-    # Filter risks for the logged-in user's organization
+
+def build_risk_management_export(organization, params, progress=None):
+    """Risk management workbook; shared by the view and background export jobs."""
+    search_query = params.get('search', '').strip()
+    strategic_cycle_id = params.get('strategic_cycle', '').strip()
+
+    # Filter risks for the organization
     risks = RiskManagement.objects.filter(
-        organization_name=request.user.organization_name
+        organization_name=organization
     )
 
     # Filter by selected strategic cycle
@@ -161,56 +157,22 @@ def export_risk_management_excel(request):
 
     # Apply search filter (category, name, mitigation)
     if search_query:
-        risks = risks.filter(
-            Q(risk_category__icontains=search_query) |
-            Q(risk_name__icontains=search_query) |
-            Q(mitigation_action__icontains=search_query)
-        )
+        risks = SearchIndexService.filter(risks, 'risk', organization, search_query)
 
     # Order by category (A-Z), then newest created
     risks = risks.order_by('risk_category', '-created_at')
 
-    # Create Excel workbook
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Risk Management"
-
-    # Title row
-    title_text = "Risk Management Report"
-    sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=10)
-    title_cell = sheet.cell(row=1, column=1, value=title_text)
-    title_cell.font = Font(bold=True, size=14, color="FFFFFF")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-    title_cell.border = Border(
-        left=Side(border_style="thin"),
-        right=Side(border_style="thin"),
-        top=Side(border_style="thin"),
-        bottom=Side(border_style="thin")
-    )
-
     # Column headers
     headers = [
         "#", "Risk Category", "Risk Name", "Mitigation Action",
         "Likelihood", "Impact", "Severity Score", "Status",
         "Strategic Cycle", "Created At"
     ]
-    for col_num, header in enumerate(headers, start=1):
-        cell = sheet.cell(row=2, column=col_num, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.fill = PatternFill(start_color="4BACC6", end_color="4BACC6", fill_type="solid")
-        cell.border = Border(
-            left=Side(border_style="thin"),
-            right=Side(border_style="thin"),
-            top=Side(border_style="thin"),
-            bottom=Side(border_style="thin")
-        )
-
-    # Data rows
-    for row_idx, risk in enumerate(risks, start=3):
-        data = [
-            row_idx - 2,
+
+    # Data rows, produced lazily so the export streams
+    rows = (
+        [
+            index,
             split_two_lines(risk.risk_category),
             split_two_lines(risk.risk_name),
             split_two_lines(risk.mitigation_action),
@@ -221,42 +183,17 @@ def export_risk_management_excel(request):
             risk.strategic_cycle.name if risk.strategic_cycle else "",
             risk.created_at.strftime('%B %d, %Y %H:%M') if risk.created_at else "",
         ]
+        for index, risk in enumerate(risks.select_related('strategic_cycle').iterator(chunk_size=2000), start=1)
+    )
 
-        for col_num, value in enumerate(data, start=1):
-            cell = sheet.cell(row=row_idx, column=col_num, value=value)
-            # Wrap text for long fields
-            if col_num in [2, 3, 4, 9]:
-                cell.alignment = Alignment(horizontal="center", vertical="top", wrap_text=True)
-            else:
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            # Borders
-            cell.border = Border(
-                left=Side(border_style="thin"),
-                right=Side(border_style="thin"),
-                top=Side(border_style="thin"),
-                bottom=Side(border_style="thin")
-            )
-
-    # Adjust column widths
-    min_width = 10
-    max_width = 30
-    for col_idx in range(1, sheet.max_column + 1):
-        width = min_width
-        for row_idx in range(2, sheet.max_row + 1):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            if cell.value:
-                width = max(width, min(len(str(cell.value)) + 2, max_width))
-        sheet.column_dimensions[get_column_letter(col_idx)].width = width
-
-    # Save workbook to buffer
-    buffer = BytesIO()
-    workbook.save(buffer)
-    buffer.seek(0)
-
-    response = HttpResponse(
-        buffer,
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    # Wrap long text fields from the top; center everything else
+    top, centered = ExcelExport.CELL_CENTERED_TOP, ExcelExport.CELL_CENTERED
+    column_styles = [centered, top, top, top, centered, centered, centered, centered, top, centered]
+
+    export = ExcelExport("Risk_Management_Report.xlsx", progress=progress)
+    export.add_sheet(
+        "Risk Management", headers, rows, heading="Risk Management Report",
+        column_styles=column_styles, min_width=10, max_width=30, total_rows=risks.count,
     )
-    response['Content-Disposition'] = 'attachment; filename="Risk_Management_Report.xlsx"'
-    return response
+    return export
 
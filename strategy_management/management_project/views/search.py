@@ -0,0 +1,24 @@
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from management_project.models import SearchDocument
+from management_project.services.search_index import SearchIndexService
+
+
+@login_required
+def global_search(request):
+    """Ranked search across the organization's stakeholders, reports, SWOT entries and risks."""
+    query = request.GET.get('q', '').strip()
+    selected_kind = request.GET.get('kind', '').strip()
+    kinds = [selected_kind] if selected_kind in SearchIndexService.SOURCES else None
+
+    results = []
+    if query:
+        results = SearchIndexService.search(request.user.organization_name, query, kinds=kinds)
+
+    return render(request, 'search/results.html', {
+        'search_query': query,
+        'results': results,
+        'kind_choices': SearchDocument.KIND_CHOICES,
+        'selected_kind': selected_kind,
+    })
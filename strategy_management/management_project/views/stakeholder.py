@@ -1,22 +1,26 @@
 # Standard library imports
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Avg, Case, Count, IntegerField, Q, Value, When
-from django.http import HttpResponse
+from django.core.exceptions import ValidationError
+from django.db.models import Avg, Case, Count, IntegerField, Prefetch, Q, Value, When
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.core.paginator import Paginator
 
 # Third-party imports
 import plotly.graph_objects as go
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
 
 # Local project imports
-from management_project.forms import StakeholderForm
-from management_project.models import Stakeholder, models
+from management_project.forms import StakeholderForm, StakeholderImportForm
+from management_project.models import Stakeholder, StrategyHierarchy, models
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
+from management_project.services.search_index import SearchIndexService
+from management_project.services.stakeholder_import import StakeholderImportService
 
 #
 @login_required
@@ -36,14 +40,7 @@ def stakeholder_list(request):
 
     # Apply search filter across multiple fields
     if query:
-        search_filter = (
-            Q(stakeholder_name__icontains=query) |
-            Q(role__icontains=query) |
-            Q(department__icontains=query) |  # FK field now properly searched
-            Q(description__icontains=query) |
-            Q(contact_info__icontains=query)
-        )
-        stakeholders = stakeholders.filter(search_filter)
+        stakeholders = SearchIndexService.filter(stakeholders, 'stakeholder', request.user.organization_name, query)
 
     # Ordering
     stakeholders = stakeholders.order_by('stakeholder_type', 'priority', 'stakeholder_name')
@@ -137,11 +134,47 @@ def delete_stakeholder(request, pk):
 
 
 @login_required
+def import_stakeholders(request):
+    """Bulk-create stakeholders from an uploaded .xlsx/.csv file, reporting rejected rows."""
+    result = None
+    if request.method == "POST":
+        form = StakeholderImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            try:
+                result = StakeholderImportService.import_file(
+                    request.user.organization_name, form.cleaned_data['file']
+                )
+            except ValidationError as exc:
+                form.add_error('file', exc)
+            else:
+                if result['created']:
+                    messages.success(request, f"{result['created']} stakeholders imported successfully!")
+                if result['error_count']:
+                    messages.warning(request, f"{result['error_count']} rows were not imported.")
+    else:
+        form = StakeholderImportForm()
+
+    return render(request, "stakeholder_list/import.html", {
+        "form": form,
+        "result": result,
+    })
+
+
+@login_required
+@background_export('stakeholder')
 def export_stakeholders_to_excel(request):
-    query = request.GET.get('search', '').strip()
-    selected_type = request.GET.get('stakeholder_type', '').strip()
+    return build_stakeholder_export(request.user.organization_name, request.GET).response()
+
 
-    stakeholders = Stakeholder.objects.all()
+def build_stakeholder_export(organization, params, progress=None):
+    """Stakeholder workbook; shared by the view and background export jobs."""
+    query = params.get('search', '').strip()
+    selected_type = params.get('stakeholder_type', '').strip()
+
+    # Only the organization's stakeholders, with every row's objectives fetched alongside its chunk
+    stakeholders = Stakeholder.objects.filter(organization_name=organization).prefetch_related(
+        Prefetch('aligned_objectives', queryset=StrategyHierarchy.objects.only('id', 'objective'))
+    )
 
     # Filter by stakeholder type
     if selected_type:
@@ -149,15 +182,7 @@ def export_stakeholders_to_excel(request):
 
     # Apply search filter
     if query:
-        search_filter = (
-            Q(stakeholder_name__icontains=query) |
-            Q(role__icontains=query) |
-            Q(department__icontains=query) |
-            Q(description__icontains=query) |
-            Q(notes__icontains=query) |
-            Q(contact_info__icontains=query)
-        )
-        stakeholders = stakeholders.filter(search_filter)
+        stakeholders = SearchIndexService.filter(stakeholders, 'stakeholder', organization, query)
 
     # Helper to get field values
     def get_field_value(instance, field_name):
@@ -193,45 +218,18 @@ def export_stakeholders_to_excel(request):
 
     headers = [field.replace('_', ' ').title() for field in field_names]
 
-    # Workbook setup
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Stakeholders"
-
-    # Title
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(headers))
-    title_cell = ws.cell(row=1, column=1, value="Stakeholder List")
-    title_cell.font = Font(size=14, bold=True, color="FFFFFFFF")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
-    title_cell.fill = PatternFill(start_color="FF305496", end_color="FF305496", fill_type="solid")
-
-    # Headers
-    ws.append(headers)
-    for cell in ws[2]:
-        cell.fill = PatternFill(start_color="FF0070C0", end_color="FF0070C0", fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFFFF")
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-    # Data rows
-    for s in stakeholders:
-        row = [get_field_value(s, field) for field in field_names]
-        ws.append(row)
-
-    # Adjust column widths
-    for i, column_cells in enumerate(ws.columns, 1):
-        max_length = max((len(str(cell.value)) for cell in column_cells if cell.value), default=0) + 2
-        ws.column_dimensions[get_column_letter(i)].width = max(max_length, 12)
-
-    ws.row_dimensions[1].height = 25
-    ws.row_dimensions[2].height = 20
-
-    # Response
-    response = HttpResponse(
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    # Data rows, produced lazily so the export streams; one stakeholder query plus one
+    # objectives query per chunk, however many rows there are
+    rows = (
+        [get_field_value(s, field) for field in field_names]
+        for s in stakeholders.iterator(chunk_size=2000)
     )
-    response["Content-Disposition"] = 'attachment; filename=stakeholders.xlsx'
-    wb.save(response)
-    return response
+
+    export = ExcelExport("stakeholders.xlsx", title_color="305496", header_color="0070C0", progress=progress)
+    export.add_sheet(
+        "Stakeholders", headers, rows, heading="Stakeholder List", min_width=12, total_rows=stakeholders.count,
+    )
+    return export
 
 
 #
@@ -643,6 +641,28 @@ def export_stakeholders_to_excel(request):
 
 @login_required
 def stakeholder_graph_view(request):
+    context = _cached_stakeholder_graph_context(request)
+    return render(request, 'stakeholder_list/graph.html', context)
+
+
+@login_required
+def stakeholder_graph_data(request):
+    """Chart series of the stakeholder dashboard, drawn client-side by charts.js."""
+    context = _cached_stakeholder_graph_context(request)
+    return JsonResponse(context['charts'], encoder=ChartPayload.ENCODER)
+
+
+def _cached_stakeholder_graph_context(request):
+    # Overdue engagement counts move with the calendar, so the day is part of the key
+    params = {'today': date.today()}
+    return ChartCacheService.get_or_build(
+        'stakeholder_graph_view', request.user.organization_name, params,
+        lambda: _stakeholder_graph_context(request),
+    )
+
+
+def _stakeholder_graph_context(request):
+    """Chart context for the stakeholder dashboard, cached by ChartCacheService."""
     qs = Stakeholder.objects.filter(organization_name=request.user.organization_name)
 
     # Enhanced color palette with better contrast
@@ -652,14 +672,33 @@ def stakeholder_graph_view(request):
         "#aec7e8", "#ffbb78", "#98df8a", "#ff9896", "#c5b0d5"
     ]
 
-    # ------------------ STAKEHOLDER TYPE COUNT BOX ------------------
-    type_counts = qs.values('stakeholder_type').annotate(count=Count('id'))
-    type_data = {item['stakeholder_type']: item['count'] for item in type_counts}
+    # Engagements older than this are overdue
+    ninety_days_ago = date.today() - timedelta(days=90)
+    overdue = Q(last_engagement_date__lt=ninety_days_ago)
+
+    # ------------------ SUMMARY COUNTS (one conditional-aggregation query) ------------------
+    summary_counts = qs.aggregate(
+        total=Count('id'),
+        internal=Count('id', filter=Q(stakeholder_type='internal')),
+        external=Count('id', filter=Q(stakeholder_type='external')),
+        interface=Count('id', filter=Q(stakeholder_type='interface')),
+        high_risk=Count('id', filter=Q(risk_level__in=['high', 'very_high'])),
+        medium_risk=Count('id', filter=Q(risk_level='medium')),
+        low_risk=Count('id', filter=Q(risk_level__in=['low', 'very_low'])),
+        high_priority=Count('id', filter=Q(priority__in=['high', 'very_high'])),
+        key_stakeholders=Count('id', filter=Q(is_key_stakeholder=True)),
+        attention_required=Count('id', filter=Q(requires_attention=True)),
+        overdue_engagement=Count('id', filter=overdue),
+        high_satisfaction=Count('id', filter=Q(satisfaction_level__in=['high', 'very_high'])),
+        low_satisfaction=Count('id', filter=Q(satisfaction_level__in=['low', 'very_low'])),
+        avg_engagement=Avg('engagement_priority_score'),
+    )
 
-    total_stakeholders = qs.count()
-    internal_count = type_data.get('internal', 0)
-    external_count = type_data.get('external', 0)
-    interface_count = type_data.get('interface', 0)
+    # ------------------ STAKEHOLDER TYPE COUNT BOX ------------------
+    total_stakeholders = summary_counts['total']
+    internal_count = summary_counts['internal']
+    external_count = summary_counts['external']
+    interface_count = summary_counts['interface']
 
     # Create stakeholder type count box
     fig_type_count = go.Figure()
@@ -974,12 +1013,9 @@ def stakeholder_graph_view(request):
     )
 
     # ------------------ RELATIONSHIP STATUS OVERVIEW ------------------
-    # Calculate overdue engagements manually since it's a property
-    from datetime import date, timedelta
-    ninety_days_ago = date.today() - timedelta(days=90)
-
     relationship_data = qs.values('relationship_status').annotate(
         count=Count('id'),
+        overdue_count=Count('id', filter=overdue),
         avg_satisfaction=Avg(Case(
             When(satisfaction_level='very_low', then=1),
             When(satisfaction_level='low', then=2),
@@ -991,22 +1027,10 @@ def stakeholder_graph_view(request):
         ))
     ).order_by('relationship_status')
 
-    # Calculate overdue engagements for each relationship status
-    relationship_overdue = {}
-    for status in relationship_data:
-        status_qs = qs.filter(relationship_status=status['relationship_status'])
-        overdue_count = 0
-        for stakeholder in status_qs:
-            if (stakeholder.last_engagement_date and
-                    stakeholder.last_engagement_date < ninety_days_ago):
-                overdue_count += 1
-        relationship_overdue[status['relationship_status']] = overdue_count
-
     relationship_labels = [r['relationship_status'].title() for r in relationship_data]
     relationship_counts = [r['count'] for r in relationship_data]
     relationship_satisfaction = [r['avg_satisfaction'] or 0 for r in relationship_data]
-    relationship_overdue_counts = [relationship_overdue.get(status, 0) for status in
-                                   [r['relationship_status'] for r in relationship_data]]
+    relationship_overdue_counts = [r['overdue_count'] for r in relationship_data]
 
     fig_relationship = go.Figure()
     fig_relationship.add_trace(go.Bar(
@@ -1035,35 +1059,17 @@ def stakeholder_graph_view(request):
     )
 
     # ------------------ ENHANCED SUMMARY DATA ------------------
-    total_stakeholders = qs.count()
-
-    # Calculate percentages and averages with None handling
-    internal_count = qs.filter(stakeholder_type='internal').count()
-    external_count = qs.filter(stakeholder_type='external').count()
-    interface_count = qs.filter(stakeholder_type='interface').count()
-
-    # Risk analysis
-    high_risk_count = qs.filter(risk_level__in=['high', 'very_high']).count()
-    medium_risk_count = qs.filter(risk_level='medium').count()
-    low_risk_count = qs.filter(risk_level__in=['low', 'very_low']).count()
-
-    # Priority analysis
-    high_priority_count = qs.filter(priority__in=['high', 'very_high']).count()
-    key_stakeholder_count = qs.filter(is_key_stakeholder=True).count()
-    attention_required_count = qs.filter(requires_attention=True).count()
-
-    # Engagement analysis - calculate overdue manually
-    overdue_engagement_count = 0
-    for stakeholder in qs:
-        if (stakeholder.last_engagement_date and
-                stakeholder.last_engagement_date < ninety_days_ago):
-            overdue_engagement_count += 1
-
-    avg_engagement_score = qs.aggregate(avg=Avg('engagement_priority_score'))['avg'] or 0
-
-    # Satisfaction analysis
-    high_satisfaction_count = qs.filter(satisfaction_level__in=['high', 'very_high']).count()
-    low_satisfaction_count = qs.filter(satisfaction_level__in=['low', 'very_low']).count()
+    # Percentages and averages from the summary counts, with None handling
+    high_risk_count = summary_counts['high_risk']
+    medium_risk_count = summary_counts['medium_risk']
+    low_risk_count = summary_counts['low_risk']
+    high_priority_count = summary_counts['high_priority']
+    key_stakeholder_count = summary_counts['key_stakeholders']
+    attention_required_count = summary_counts['attention_required']
+    overdue_engagement_count = summary_counts['overdue_engagement']
+    avg_engagement_score = summary_counts['avg_engagement'] or 0
+    high_satisfaction_count = summary_counts['high_satisfaction']
+    low_satisfaction_count = summary_counts['low_satisfaction']
 
     summary_data = {
         'total_stakeholders': total_stakeholders,
@@ -1094,14 +1100,17 @@ def stakeholder_graph_view(request):
             (low_satisfaction_count / total_stakeholders * 100) if total_stakeholders > 0 else 0, 1),
     }
 
-    return render(request, 'stakeholder_list/graph.html', {
-        'plot_html_type_count': fig_type_count.to_html(full_html=False),  # New stakeholder type count box
-        'plot_html_category': fig_category.to_html(full_html=False),
-        'plot_html_role': fig_role.to_html(full_html=False),
-        'plot_html_type': fig_type.to_html(full_html=False),
-        'plot_html_risk_impact': fig_risk_impact.to_html(full_html=False),
-        'plot_html_engagement': fig_engagement.to_html(full_html=False),
-        'plot_html_priority': fig_priority.to_html(full_html=False),
-        'plot_html_relationship': fig_relationship.to_html(full_html=False),
+    return {
+        # Drawn client-side from stakeholder_graph_data
+        'charts': ChartPayload.build({
+            'plot_html_type_count': fig_type_count,  # New stakeholder type count box
+            'plot_html_category': fig_category,
+            'plot_html_role': fig_role,
+            'plot_html_type': fig_type,
+            'plot_html_risk_impact': fig_risk_impact,
+            'plot_html_engagement': fig_engagement,
+            'plot_html_priority': fig_priority,
+            'plot_html_relationship': fig_relationship,
+        }),
         'summary_data': summary_data,
-    })
\ No newline at end of file
+    }
@@ -6,21 +6,18 @@ from django.db.models import Q
 from django.contrib.auth.decorators import login_required
 from datetime import date
 import calendar
-from django.http import HttpResponse
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-from io import BytesIO
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from django.http import JsonResponse
 
 from django.shortcuts import render
 import plotly.graph_objs as go
-from plotly.offline import plot
 from collections import defaultdict
 
 from management_project.models import StrategicCycle, StrategicActionPlan, Stakeholder
 from management_project.forms import StrategicActionPlanForm
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
 
 
 @login_required
@@ -223,26 +220,19 @@ def split_two_lines(text):
     return " ".join(words[:mid]) + "\n" + " ".join(words[mid:])
 
 @login_required
+@background_export('strategic_action_plan')
 def export_strategic_action_plan_to_excel(request, cycle_slug):
-    cycle = get_object_or_404(StrategicCycle, slug=cycle_slug, organization_name=request.user.organization_name)
-    plans = StrategicActionPlan.objects.filter(strategic_cycle=cycle, organization_name=request.user.organization_name)
-
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = f"{cycle.name} ({cycle.start_date.year if cycle.start_date else ''})"
-
-    # Title row
-    title_text = f"Strategic Action Plan For: {cycle.name}"
-    sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=17)
-    title_cell = sheet.cell(row=1, column=1, value=title_text)
-    title_cell.font = Font(bold=True, size=14, color="FFFFFF")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-    title_cell.border = Border(
-        left=Side(border_style="thin"),
-        right=Side(border_style="thin"),
-        top=Side(border_style="thin"),
-        bottom=Side(border_style="thin")
+    params = {**request.GET.dict(), 'cycle_slug': cycle_slug}
+    return build_strategic_action_plan_export(request.user.organization_name, params).response()
+
+
+def build_strategic_action_plan_export(organization, params, progress=None):
+    """Action plan workbook for params['cycle_slug']; shared by the view and background export jobs."""
+    cycle = get_object_or_404(StrategicCycle, slug=params.get('cycle_slug'), organization_name=organization)
+    plans = (
+        StrategicActionPlan.objects.filter(strategic_cycle=cycle, organization_name=organization)
+        .select_related("strategy_hierarchy", "strategic_cycle")
+        .prefetch_related("responsible_bodies")
     )
 
     # Column headers
@@ -252,80 +242,68 @@ def export_strategic_action_plan_to_excel(request, cycle_slug):
         "Time Horizon", "Time Horizon Type", "Start Date", "End Date",
         "Duration (Days)", "Responsible Bodies", "Status"
     ]
-    for col_num, header in enumerate(headers, start=1):
-        cell = sheet.cell(row=2, column=col_num, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.fill = PatternFill(start_color="4BACC6", end_color="4BACC6", fill_type="solid")
-        cell.border = Border(
-            left=Side(border_style="thin"),
-            right=Side(border_style="thin"),
-            top=Side(border_style="thin"),
-            bottom=Side(border_style="thin")
-        )
 
-    # Data rows
-    for row_idx, plan in enumerate(plans, start=3):
-        data = [
-            row_idx - 2,
-            plan.strategy_hierarchy.strategic_perspective if plan.strategy_hierarchy else "",
-            split_two_lines(plan.strategy_hierarchy.focus_area if plan.strategy_hierarchy else ""),
-            split_two_lines(plan.strategy_hierarchy.objective if plan.strategy_hierarchy else ""),
-            split_two_lines(plan.strategy_hierarchy.kpi if plan.strategy_hierarchy else ""),
-            plan.get_indicator_type_display(),
-            plan.get_direction_of_change_display(),
-            plan.baseline,
-            plan.target,
-            plan.improvement_needed or 0.0,
-            plan.strategic_cycle.time_horizon if plan.strategic_cycle else "",
-            plan.strategic_cycle.time_horizon_type if plan.strategic_cycle else "",
-            plan.strategic_cycle.start_date.strftime('%B %d, %Y') if plan.strategic_cycle and plan.strategic_cycle.start_date else "",
-            plan.strategic_cycle.end_date.strftime('%B %d, %Y') if plan.strategic_cycle and plan.strategic_cycle.end_date else "",
-            plan.strategic_cycle.duration_days if plan.strategic_cycle else "",
-            ", ".join([body.stakeholder_name for body in plan.responsible_bodies.all()]),
-            plan.get_status_display() or "Pending",
-        ]
-        for col_num, value in enumerate(data, start=1):
-            cell = sheet.cell(row=row_idx, column=col_num, value=value)
-            # Wrap text for certain fields
-            if col_num in [3, 4, 5, 16]:  # Pillar, Objective, KPI, Responsible Bodies
-                cell.alignment = Alignment(horizontal="center", vertical="top", wrap_text=True)
-            else:
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            # Borders
-            cell.border = Border(
-                left=Side(border_style="thin"),
-                right=Side(border_style="thin"),
-                top=Side(border_style="thin"),
-                bottom=Side(border_style="thin")
-            )
-
-    # Minimized column widths with a reasonable minimum
-    min_width = 10
-    max_width = 20
-    for col_idx in range(1, sheet.max_column + 1):
-        width = min_width
-        for row_idx in range(2, sheet.max_row + 1):  # skip title row
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            if cell.value:
-                width = max(width, min(len(str(cell.value)) + 2, max_width))
-        sheet.column_dimensions[get_column_letter(col_idx)].width = width
-
-    # Save to buffer
-    buffer = BytesIO()
-    workbook.save(buffer)
-    buffer.seek(0)
-
-    response = HttpResponse(
-        buffer,
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    # Data rows, produced lazily so the export streams
+    def plan_rows():
+        for index, plan in enumerate(plans.iterator(chunk_size=2000), start=1):
+            yield [
+                index,
+                plan.strategy_hierarchy.strategic_perspective if plan.strategy_hierarchy else "",
+                split_two_lines(plan.strategy_hierarchy.focus_area if plan.strategy_hierarchy else ""),
+                split_two_lines(plan.strategy_hierarchy.objective if plan.strategy_hierarchy else ""),
+                split_two_lines(plan.strategy_hierarchy.kpi if plan.strategy_hierarchy else ""),
+                plan.get_indicator_type_display(),
+                plan.get_direction_of_change_display(),
+                plan.baseline,
+                plan.target,
+                plan.improvement_needed or 0.0,
+                plan.strategic_cycle.time_horizon if plan.strategic_cycle else "",
+                plan.strategic_cycle.time_horizon_type if plan.strategic_cycle else "",
+                plan.strategic_cycle.start_date.strftime('%B %d, %Y') if plan.strategic_cycle and plan.strategic_cycle.start_date else "",
+                plan.strategic_cycle.end_date.strftime('%B %d, %Y') if plan.strategic_cycle and plan.strategic_cycle.end_date else "",
+                plan.strategic_cycle.duration_days if plan.strategic_cycle else "",
+                ", ".join([body.stakeholder_name for body in plan.responsible_bodies.all()]),
+                plan.get_status_display() or "Pending",
+            ]
+
+    # Wrap Pillar, Objective, KPI and Responsible Bodies from the top; center everything else
+    top, centered = ExcelExport.CELL_CENTERED_TOP, ExcelExport.CELL_CENTERED
+    column_styles = [centered] * len(headers)
+    for column in (2, 3, 4, 15):
+        column_styles[column] = top
+
+    export = ExcelExport(f"Strategic_Action_Plan_{cycle.name}.xlsx", progress=progress)
+    export.add_sheet(
+        f"{cycle.name} ({cycle.start_date.year if cycle.start_date else ''})", headers, plan_rows(),
+        heading=f"Strategic Action Plan For: {cycle.name}",
+        column_styles=column_styles, min_width=10, max_width=20, total_rows=plans.count,
     )
-    response['Content-Disposition'] = f'attachment; filename="Strategic_Action_Plan_{cycle.name}.xlsx"'
-    return response
+    return export
 
 
 #
 def strategic_action_plan_chart(request):
+    context = _cached_strategic_action_plan_chart_context(request)
+    return render(request, "strategic_action_plan/chart.html", context)
+
+
+@login_required
+def strategic_action_plan_chart_data(request):
+    """Chart series of the action plan dashboard, drawn client-side by charts.js."""
+    context = _cached_strategic_action_plan_chart_context(request)
+    return JsonResponse(context["charts"], encoder=ChartPayload.ENCODER)
+
+
+def _cached_strategic_action_plan_chart_context(request):
+    params = {'cycle': request.GET.get("cycle") or '', 'body': request.GET.get("body") or ''}
+    return ChartCacheService.get_or_build(
+        'strategic_action_plan_chart', request.user.organization_name, params,
+        lambda: _strategic_action_plan_chart_context(request),
+    )
+
+
+def _strategic_action_plan_chart_context(request):
+    """Chart context for the action plan dashboard, cached by ChartCacheService."""
 
     # ---------------- Base queryset ----------------
     base_qs = (
@@ -437,11 +415,13 @@ def strategic_action_plan_chart(request):
 
     # ---------------- Context ----------------
     context = {
-        # Charts
-        "plot_overall_pie": plot(fig_overall_pie, output_type="div", include_plotlyjs=True),
-        "plot_overall_bar": plot(fig_overall_bar, output_type="div", include_plotlyjs=False),
-        "plot_filtered_pie": plot(fig_filtered_pie, output_type="div", include_plotlyjs=False),
-        "plot_filtered_bar": plot(fig_filtered_bar, output_type="div", include_plotlyjs=False),
+        # Charts, drawn client-side from strategic_action_plan_chart_data
+        "charts": ChartPayload.build({
+            "plot_overall_pie": fig_overall_pie,
+            "plot_overall_bar": fig_overall_bar,
+            "plot_filtered_pie": fig_filtered_pie,
+            "plot_filtered_bar": fig_filtered_bar,
+        }),
 
         # KPIs
         "total_plans_all": total_all,
@@ -452,9 +432,9 @@ def strategic_action_plan_chart(request):
         "completion_rate_filtered": rate_filtered,
 
         # Dropdowns
-        "cycles": cycles,
-        "responsible_bodies": responsible_bodies,
+        "cycles": list(cycles),
+        "responsible_bodies": list(responsible_bodies),
         "selected_cycle": int(selected_cycle) if selected_cycle else None,
         "selected_body": int(selected_body) if selected_body else None,
     }
-    return render(request, "strategic_action_plan/chart.html", context)
+    return context
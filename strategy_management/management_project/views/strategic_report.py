@@ -2,27 +2,24 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.urls import reverse
-from django.db.models import Q
 import calendar
 
 from django.contrib.auth.decorators import login_required
 from management_project.models import StrategicReport, StrategicActionPlan, StrategicCycle
 from management_project.forms import StrategicReportForm
+from management_project.services.strategic_report_analytics import StrategicReportRollup
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
+from management_project.services.search_index import SearchIndexService
+from management_project.services.strategic_scorecard import StrategicScorecardService
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-from io import BytesIO
+from django.http import JsonResponse
 
 #chart
 from django.shortcuts import render
-from django.db.models import Avg, Count
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from plotly.offline import plot
-from collections import defaultdict
 from datetime import datetime
 from plotly.colors import qualitative
 
@@ -73,15 +70,7 @@ def strategic_report_list(request, cycle_slug):
     # Search query
     search_query = request.GET.get("search", "").strip()
     if search_query:
-        reports = reports.filter(
-            Q(action_plan__strategy_hierarchy__strategic_perspective__icontains=search_query) |
-            Q(action_plan__strategy_hierarchy__focus_area__icontains=search_query) |
-            Q(action_plan__strategy_hierarchy__objective__icontains=search_query) |
-            Q(action_plan__strategy_hierarchy__kpi__icontains=search_query) |
-            Q(action_plan__strategic_cycle__end_date__icontains=search_query) |
-            Q(achievement__icontains=search_query) |
-            Q(status__icontains=search_query)
-        ).distinct()
+        reports = SearchIndexService.filter(reports, 'strategic_report', request.user.organization_name, search_query)
 
     # Pagination
     paginator = Paginator(reports, 10)
@@ -205,54 +194,35 @@ def break_text_every_3_words(text):
 
 
 @login_required
+@background_export('strategic_report')
 def export_strategic_report_to_excel(request, cycle_slug):
     """Export Strategic Reports with title, colored headers, and word breaks."""
+    params = {**request.GET.dict(), 'cycle_slug': cycle_slug}
+    return build_strategic_report_export(request.user.organization_name, params).response()
+
+
+def build_strategic_report_export(organization, params, progress=None):
+    """Strategic Reports workbook for params['cycle_slug']; shared by the view and background export jobs."""
 
     # 1️⃣ Get the cycle
     cycle = get_object_or_404(
         StrategicCycle,
-        slug=cycle_slug,
-        organization_name=request.user.organization_name,
+        slug=params.get('cycle_slug'),
+        organization_name=organization,
     )
 
     # 2️⃣ Query reports
     reports = (
         StrategicReport.objects.filter(
             action_plan__strategic_cycle=cycle,
-            organization_name=request.user.organization_name,
+            organization_name=organization,
         )
         .select_related("organization_name", "action_plan", "action_plan__strategy_hierarchy")
         .prefetch_related("action_plan__responsible_bodies")
         .order_by("-id")
     )
 
-    # 3️⃣ Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"{cycle.name[:28]} Reports"
-
-    # 4️⃣ Define styles
-    total_columns = 26
-    title_font = Font(size=14, bold=True, color="FFFFFF")
-    title_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="4BACC6", end_color="4BACC6", fill_type="solid")
-    border_style = Border(
-        left=Side(border_style="thin"),
-        right=Side(border_style="thin"),
-        top=Side(border_style="thin"),
-        bottom=Side(border_style="thin")
-    )
-
-    # 5️⃣ Add title row (merged)
-    title_text = f"Strategic Reports for {cycle.name}"
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=total_columns)
-    title_cell = ws.cell(row=1, column=1, value=title_text)
-    title_cell.font = title_font
-    title_cell.fill = title_fill
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    # 6️⃣ Column headers
+    # 3️⃣ Column headers
     headers = [
         "Report ID", "Organization", "Responsible Party", "Perspective",
         "Focus Area / Pillar", "Objective", "KPI", "Indicator Type",
@@ -262,83 +232,121 @@ def export_strategic_report_to_excel(request, cycle_slug):
         "Progress Summary", "Challenges", "Successes", "Lessons Learned",
         "Status", "Created At", "Updated At"
     ]
-    ws.append(headers)
-
-    # Format header row
-    for cell in ws[2]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.border = border_style
-
-    # 7️⃣ Add data rows
-    for report in reports:
-        ap = getattr(report, "action_plan", None)
-        hierarchy = getattr(ap, "strategy_hierarchy", None)
-
-        ws.append([
-            report.id,
-            getattr(report.organization_name, "organization_name", report.organization_name),
-            ", ".join([body.stakeholder_name for body in ap.responsible_bodies.all()]) if ap else "-",
-            getattr(hierarchy, "strategic_perspective", "-"),
-            getattr(hierarchy, "focus_area", "-"),
-            getattr(hierarchy, "objective", "-"),
-            getattr(hierarchy, "kpi", "-"),
-            getattr(ap, "indicator_type", "-") if ap else "-",
-            getattr(ap, "direction_of_change", "-") if ap else "-",
-            getattr(ap, "baseline", "-") if ap else "-",
-            getattr(ap, "target", "-") if ap else "-",
-            getattr(ap, "improvement_needed", "-") if ap else "-",
-            getattr(report, "achievement", "-"),
-            getattr(report, "percent_achieved", "-"),
-            getattr(report, "variance", "-"),
-            getattr(report, "weighted_score", "-"),
-            break_text_every_3_words(getattr(report, "data_source", "")),
-            break_text_every_3_words(getattr(report, "data_collector", "")),
-            break_text_every_3_words(getattr(report, "performance_summary", "")),
-            break_text_every_3_words(getattr(report, "progress_summary", "")),
-            break_text_every_3_words(getattr(report, "challenges", "")),
-            break_text_every_3_words(getattr(report, "successes", "")),
-            break_text_every_3_words(getattr(report, "lessons_learned", "")),
-            getattr(report, "get_status_display", lambda: "-")(),
-            report.created_at.strftime("%Y-%m-%d %H:%M") if report.created_at else "-",
-            report.updated_at.strftime("%Y-%m-%d %H:%M") if report.updated_at else "-",
-        ])
-
-    # 8️⃣ Format all cells (skip merged title row)
-    for column_cells in ws.iter_cols(min_row=2, max_row=ws.max_row):
-        max_length = 0
-        column = column_cells[0].column_letter
-        for cell in column_cells:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-            cell.border = border_style
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[column].width = min(max_length + 3, 20)
-
-    # 9️⃣ Prepare response
-    response = HttpResponse(
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    # 4️⃣ Data rows, produced lazily so the export streams
+    def report_rows():
+        for report in reports.iterator(chunk_size=2000):
+            ap = getattr(report, "action_plan", None)
+            hierarchy = getattr(ap, "strategy_hierarchy", None)
+
+            yield [
+                report.id,
+                getattr(report.organization_name, "organization_name", report.organization_name),
+                ", ".join([body.stakeholder_name for body in ap.responsible_bodies.all()]) if ap else "-",
+                getattr(hierarchy, "strategic_perspective", "-"),
+                getattr(hierarchy, "focus_area", "-"),
+                getattr(hierarchy, "objective", "-"),
+                getattr(hierarchy, "kpi", "-"),
+                getattr(ap, "indicator_type", "-") if ap else "-",
+                getattr(ap, "direction_of_change", "-") if ap else "-",
+                getattr(ap, "baseline", "-") if ap else "-",
+                getattr(ap, "target", "-") if ap else "-",
+                getattr(ap, "improvement_needed", "-") if ap else "-",
+                getattr(report, "achievement", "-"),
+                getattr(report, "percent_achieved", "-"),
+                getattr(report, "variance", "-"),
+                getattr(report, "weighted_score", "-"),
+                break_text_every_3_words(getattr(report, "data_source", "")),
+                break_text_every_3_words(getattr(report, "data_collector", "")),
+                break_text_every_3_words(getattr(report, "performance_summary", "")),
+                break_text_every_3_words(getattr(report, "progress_summary", "")),
+                break_text_every_3_words(getattr(report, "challenges", "")),
+                break_text_every_3_words(getattr(report, "successes", "")),
+                break_text_every_3_words(getattr(report, "lessons_learned", "")),
+                getattr(report, "get_status_display", lambda: "-")(),
+                report.created_at.strftime("%Y-%m-%d %H:%M") if report.created_at else "-",
+                report.updated_at.strftime("%Y-%m-%d %H:%M") if report.updated_at else "-",
+            ]
+
+    # 5️⃣ Report sheet with title, colored headers and bordered, wrapped cells
+    export = ExcelExport(f"Strategic_Reports_{cycle.slug}.xlsx", progress=progress)
+    export.add_sheet(
+        f"{cycle.name[:28]} Reports", headers, report_rows(),
+        heading=f"Strategic Reports for {cycle.name}",
+        body_style=ExcelExport.CELL, min_width=0, max_width=20, padding=3, total_rows=reports.count,
+    )
+
+    # 6️⃣ Summary sheet, rolled up by the same engine as the dashboard
+    summary_dimensions = [
+        ("perspective", "Perspective"),
+        ("pillar", "Focus Area / Pillar"),
+        ("objective", "Objective"),
+        ("kpi", "KPI"),
+        ("responsible_body", "Responsible Party"),
+    ]
+    rollup = StrategicReportRollup.for_organization(organization, cycle.id)
+    totals = rollup.compute([dimension for dimension, _ in summary_dimensions])
+    summary_rows = [
+        [
+            label, value, metrics["report_count"],
+            round(float(metrics["achievement"]), 2), round(float(metrics["weighted_score"]), 2),
+        ]
+        for dimension, label in summary_dimensions
+        for value, metrics in sorted(totals[dimension].items(), key=lambda item: -item[1]["report_count"])
+    ]
+    export.add_sheet(
+        "Summary", ["Dimension", "Value", "Reports", "Avg % Achieved", "Avg Weighted Score"], summary_rows,
+    )
+
+    # 7️⃣ Scorecard sheet: the cycle's composite weighted score, then per perspective and pillar
+    scorecard_rows = [
+        [
+            scorecard.strategic_perspective or "Whole cycle", scorecard.focus_area or "-",
+            scorecard.plan_count, scorecard.reported_plan_count,
+            scorecard.weight_total, scorecard.composite_score,
+        ]
+        for scorecard in StrategicScorecardService.for_cycle(organization, cycle.id)
+    ]
+    export.add_sheet(
+        "Scorecard",
+        ["Perspective", "Focus Area / Pillar", "Action Plans", "Reported Plans", "Weight Total", "Composite Score"],
+        scorecard_rows,
     )
-    filename = f"Strategic_Reports_{cycle.slug}.xlsx"
-    wb.save(response)
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+
+    return export
 
 #
-from django.db.models import Count, Avg, F
-from django.db.models.functions import TruncMonth
 from django.utils import timezone
 from datetime import datetime
-from collections import defaultdict
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from plotly.offline import plot
 
 
 @login_required
 def strategic_report_chart(request):
     """Complete strategic dashboard using Django aggregates and Plotly."""
+    context = _cached_strategic_report_chart_context(request)
+    return render(request, 'strategic_report/chart.html', {**context, 'current_date': timezone.now()})
+
+
+@login_required
+def strategic_report_chart_data(request):
+    """Chart series of the strategic dashboard, drawn client-side by charts.js."""
+    context = _cached_strategic_report_chart_context(request)
+    return JsonResponse(context['charts'], encoder=ChartPayload.ENCODER)
+
+
+def _cached_strategic_report_chart_context(request):
+    params = {
+        'strategic_cycle': request.GET.get("strategic_cycle", "all"),
+        'responsible_body': request.GET.get("responsible_body", "all"),
+    }
+    return ChartCacheService.get_or_build(
+        'strategic_report_chart', request.user.organization_name, params,
+        lambda: _strategic_report_chart_context(request),
+    )
+
+
+def _strategic_report_chart_context(request):
+    """Dashboard context for the strategic report chart, cached by ChartCacheService."""
 
     # Color palette for charts
     COLORS = ['#4e73df', '#1cc88a', '#36b9cc', '#f6c23e', '#e74a3b', '#858796',
@@ -348,232 +356,105 @@ def strategic_report_chart(request):
     cycle_filter = request.GET.get("strategic_cycle", "all")
     body_filter = request.GET.get("responsible_body", "all")
 
-    # Base queryset
-    reports = StrategicReport.objects.select_related(
-        "action_plan__strategic_cycle",
-        "action_plan__strategy_hierarchy"
-    ).prefetch_related("action_plan__responsible_bodies").filter(
-        organization_name=request.user.organization_name
-    )
-
-    # Apply filters
-    if cycle_filter != "all":
-        reports = reports.filter(action_plan__strategic_cycle_id=cycle_filter)
-    if body_filter != "all":
-        reports = reports.filter(action_plan__responsible_bodies__stakeholder_name=body_filter)
+    organization = request.user.organization_name
+    cycle_id = cycle_filter if cycle_filter != "all" else None
+    body_name = body_filter if body_filter != "all" else None
 
     # Get filter options
     strategic_cycles = StrategicCycle.objects.filter(
-        organization_name=request.user.organization_name
+        organization_name=organization
     )
-    responsible_bodies = list(reports.values_list(
-        'action_plan__responsible_bodies__stakeholder_name', flat=True
-    ).distinct().exclude(
-        action_plan__responsible_bodies__stakeholder_name__isnull=True
-    ).order_by('action_plan__responsible_bodies__stakeholder_name'))
 
-    # 1. CORE METRICS & COUNTS
-    total_reports = reports.count()
+    # One read of the precomputed aggregates replaces the per-section GROUP BY queries
+    rollup = StrategicReportRollup.for_organization(organization, cycle_id, body_name)
 
-    status_counts = list(reports.values('status').annotate(
-        count=Count('id')
-    ).order_by('-count'))
+    responsible_bodies = rollup.values('responsible_body')
 
-    # Counts by cycle and body
-    cycle_counts = list(reports.values(
-        'action_plan__strategic_cycle__name'
-    ).annotate(count=Count('id')).order_by('-count')) if cycle_filter == "all" else []
-
-    body_counts = list(reports.values(
-        'action_plan__responsible_bodies__stakeholder_name'
-    ).annotate(count=Count('id')).filter(
-        action_plan__responsible_bodies__stakeholder_name__isnull=False
-    ).order_by('-count')) if body_filter == "all" else []
-
-    overall_metrics = reports.aggregate(
-        achievement=Avg('percent_achieved'),
-        weighted_score=Avg('weighted_score')
+    # Every section below is answered from this single pass
+    totals, monthly = rollup.compute(
+        ['total', 'status', 'cycle', 'responsible_body', 'month', 'objective', 'kpi'], by_month=True
     )
 
-    # 2. MONTHLY PERFORMANCE
-    monthly_data = list(reports.filter(
-        action_plan__strategic_cycle__end_date__isnull=False
-    ).annotate(
-        month=TruncMonth('action_plan__strategic_cycle__end_date')
-    ).values('month').annotate(
-        achievement=Avg('percent_achieved'),
-        weighted_score=Avg('weighted_score'),
-        report_count=Count('id')
-    ).order_by('month'))
-
-    monthly_metrics = []
-    for metric in monthly_data:
-        if metric['month']:
-            monthly_metrics.append({
-                'month': metric['month'].strftime("%b %Y"),
-                'full_date': metric['month'].strftime("%B %d, %Y"),
-                'achievement': metric['achievement'] or 0,
-                'weighted_score': metric['weighted_score'] or 0,
-                'report_count': metric['report_count']
-            })
-
-    # 3. STAKEHOLDER PERFORMANCE
-    stakeholder_monthly_data = list(reports.filter(
-        action_plan__strategic_cycle__end_date__isnull=False,
-        action_plan__responsible_bodies__isnull=False
-    ).annotate(
-        month=TruncMonth('action_plan__strategic_cycle__end_date'),
-        stakeholder=F('action_plan__responsible_bodies__stakeholder_name')
-    ).values('month', 'stakeholder').annotate(
-        achievement=Avg('percent_achieved'),
-        weighted_score=Avg('weighted_score'),
-        report_count=Count('id')
-    ).order_by('month', 'stakeholder'))
-
-    # Organize stakeholder data
-    stakeholder_by_month = defaultdict(dict)
-    stakeholder_performance = defaultdict(lambda: {'achievement': [], 'count': 0, 'monthly': {}})
-
-    for item in stakeholder_monthly_data:
-        month_key = item['month'].strftime("%b %Y") if item['month'] else "Unknown"
-        stakeholder = item['stakeholder']
-
-        # For heatmap and trends
-        stakeholder_by_month[month_key][stakeholder] = item['achievement'] or 0
-
-        # For performance tracking
-        stakeholder_performance[stakeholder]['achievement'].append(item['achievement'] or 0)
-        stakeholder_performance[stakeholder]['count'] += item['report_count']
-        stakeholder_performance[stakeholder]['monthly'][month_key] = item['achievement'] or 0
-
-    # Calculate averages
-    for stakeholder in stakeholder_performance:
-        achievements = stakeholder_performance[stakeholder]['achievement']
-        stakeholder_performance[stakeholder]['avg_achievement'] = sum(achievements) / len(
-            achievements) if achievements else 0
-
-    # REMOVED: Top stakeholders limit - show all stakeholders
-    all_stakeholders = sorted(
-        [(s, data) for s, data in stakeholder_performance.items()],
-        key=lambda x: x[1]['count'], reverse=True
-    )
+    # 1. CORE METRICS & COUNTS
+    overall = totals['total'].get(None, {'achievement': None, 'weighted_score': None, 'report_count': 0})
+    total_reports = overall['report_count']
 
-    # 4. OBJECTIVE & KPI PERFORMANCE
-    # Monthly objective data
-    objective_monthly_data = list(reports.filter(
-        action_plan__strategic_cycle__end_date__isnull=False,
-        action_plan__strategy_hierarchy__objective__isnull=False
-    ).annotate(
-        month=TruncMonth('action_plan__strategic_cycle__end_date'),
-        objective=F('action_plan__strategy_hierarchy__objective')
-    ).values('month', 'objective').annotate(
-        achievement=Avg('percent_achieved'),
-        weighted_score=Avg('weighted_score'),
-        report_count=Count('id')
-    ).order_by('month', 'objective'))
-
-    # Organize objective data
-    objective_by_month = defaultdict(dict)
-    objective_performance = defaultdict(
-        lambda: {'achievement': [], 'weighted': [], 'count': 0, 'monthly_achievement': {}, 'monthly_weighted': {}})
-
-    for item in objective_monthly_data:
-        month_key = item['month'].strftime("%b %Y") if item['month'] else "Unknown"
-        objective = item['objective']
-
-        objective_by_month[month_key][objective] = item['achievement'] or 0
-
-        objective_performance[objective]['achievement'].append(item['achievement'] or 0)
-        objective_performance[objective]['weighted'].append(item['weighted_score'] or 0)
-        objective_performance[objective]['count'] += item['report_count']
-        objective_performance[objective]['monthly_achievement'][month_key] = item['achievement'] or 0
-        objective_performance[objective]['monthly_weighted'][month_key] = item['weighted_score'] or 0
-
-    # Calculate averages
-    for objective in objective_performance:
-        achievements = objective_performance[objective]['achievement']
-        weighteds = objective_performance[objective]['weighted']
-        objective_performance[objective]['avg_achievement'] = sum(achievements) / len(
-            achievements) if achievements else 0
-        objective_performance[objective]['avg_weighted'] = sum(weighteds) / len(weighteds) if weighteds else 0
-
-    # REMOVED: Top objectives limit - show all objectives
-    all_objectives = sorted(
-        [(obj, data) for obj, data in objective_performance.items()],
-        key=lambda x: x[1]['count'], reverse=True
+    status_counts = sorted(
+        [{'status': status, 'count': data['report_count']} for status, data in totals['status'].items()],
+        key=lambda item: -item['count']
     )
 
-    # Monthly KPI data
-    kpi_monthly_data = list(reports.filter(
-        action_plan__strategic_cycle__end_date__isnull=False,
-        action_plan__strategy_hierarchy__kpi__isnull=False
-    ).annotate(
-        month=TruncMonth('action_plan__strategic_cycle__end_date'),
-        kpi=F('action_plan__strategy_hierarchy__kpi')
-    ).values('month', 'kpi').annotate(
-        achievement=Avg('percent_achieved'),
-        weighted_score=Avg('weighted_score'),
-        report_count=Count('id')
-    ).order_by('month', 'kpi'))
-
-    # Organize KPI data
-    kpi_by_month = defaultdict(dict)
-    kpi_performance = defaultdict(
-        lambda: {'achievement': [], 'weighted': [], 'count': 0, 'monthly_achievement': {}, 'monthly_weighted': {}})
-
-    for item in kpi_monthly_data:
-        month_key = item['month'].strftime("%b %Y") if item['month'] else "Unknown"
-        kpi = item['kpi']
-
-        kpi_by_month[month_key][kpi] = item['achievement'] or 0
-
-        kpi_performance[kpi]['achievement'].append(item['achievement'] or 0)
-        kpi_performance[kpi]['weighted'].append(item['weighted_score'] or 0)
-        kpi_performance[kpi]['count'] += item['report_count']
-        kpi_performance[kpi]['monthly_achievement'][month_key] = item['achievement'] or 0
-        kpi_performance[kpi]['monthly_weighted'][month_key] = item['weighted_score'] or 0
-
-    # Calculate averages
-    for kpi in kpi_performance:
-        achievements = kpi_performance[kpi]['achievement']
-        weighteds = kpi_performance[kpi]['weighted']
-        kpi_performance[kpi]['avg_achievement'] = sum(achievements) / len(achievements) if achievements else 0
-        kpi_performance[kpi]['avg_weighted'] = sum(weighteds) / len(weighteds) if weighteds else 0
-
-    # REMOVED: Top KPIs limit - show all KPIs
-    all_kpis = sorted(
-        [(kpi, data) for kpi, data in kpi_performance.items()],
-        key=lambda x: x[1]['count'], reverse=True
-    )
+    # Counts by cycle and body
+    cycle_counts = sorted(
+        [{'action_plan__strategic_cycle__name': name, 'count': data['report_count']}
+         for name, data in totals['cycle'].items()],
+        key=lambda item: -item['count']
+    ) if cycle_filter == "all" else []
+
+    body_metrics = sorted(
+        [{'action_plan__responsible_bodies__stakeholder_name': body, **data}
+         for body, data in totals['responsible_body'].items()],
+        key=lambda item: -item['report_count']
+    ) if body_filter == "all" else []
+    body_counts = [
+        {'action_plan__responsible_bodies__stakeholder_name': item['action_plan__responsible_bodies__stakeholder_name'],
+         'count': item['report_count']}
+        for item in body_metrics
+    ]
 
-    # 5. FILTER-SPECIFIC DATA
+    overall_metrics = {
+        'achievement': overall['achievement'],
+        'weighted_score': overall['weighted_score'],
+    }
+
+    # Composite score of the selected cycle, read from its maintained scorecard
+    scorecard = StrategicScorecardService.composite(organization, cycle_id) if cycle_id else None
+
+    # 2. MONTHLY PERFORMANCE
+    monthly_metrics = [
+        {
+            'month': month.strftime("%b %Y"),
+            'full_date': month.strftime("%B %d, %Y"),
+            'achievement': data['achievement'] or 0,
+            'weighted_score': data['weighted_score'] or 0,
+            'report_count': data['report_count']
+        }
+        for month, data in sorted(totals['month'].items(), key=lambda item: item[0] or datetime.min.date())
+        if month
+    ]
+
+    # 3. STAKEHOLDER, OBJECTIVE & KPI PERFORMANCE
+    stakeholder_by_month, all_stakeholders = StrategicReportRollup.performance(monthly['responsible_body'])
+    objective_by_month, all_objectives = StrategicReportRollup.performance(monthly['objective'])
+    kpi_by_month, all_kpis = StrategicReportRollup.performance(monthly['kpi'])
+
+    # 4. FILTER-SPECIFIC DATA
     objectives_by_body = []
     kpis_by_body = []
 
     if body_filter != "all":
-        objectives_by_body = list(reports.filter(
-            action_plan__responsible_bodies__stakeholder_name=body_filter,
-            action_plan__strategy_hierarchy__objective__isnull=False
-        ).values(
-            'action_plan__strategy_hierarchy__objective'
-        ).annotate(
-            achievement=Avg('percent_achieved'),
-            weighted_score=Avg('weighted_score'),
-            report_count=Count('id')
-        ).order_by('-report_count'))
-
-        kpis_by_body = list(reports.filter(
-            action_plan__responsible_bodies__stakeholder_name=body_filter,
-            action_plan__strategy_hierarchy__kpi__isnull=False
-        ).values(
-            'action_plan__strategy_hierarchy__kpi'
-        ).annotate(
-            achievement=Avg('percent_achieved'),
-            weighted_score=Avg('weighted_score'),
-            report_count=Count('id')
-        ).order_by('-report_count'))
-
-    # 6. CREATE ALL CHARTS
+        objectives_by_body = sorted(
+            [{'action_plan__strategy_hierarchy__objective': objective, **data}
+             for objective, data in totals['objective'].items()],
+            key=lambda item: -item['report_count']
+        )
+
+        kpis_by_body = sorted(
+            [{'action_plan__strategy_hierarchy__kpi': kpi, **data}
+             for kpi, data in totals['kpi'].items()],
+            key=lambda item: -item['report_count']
+        )
+
+    # 6. CHART DATA
+    # Traces grow with the departments, objectives and KPIs, so the browser builds these
+    # figures from plain series (ChartPayload.chart(), charts.js) instead of go.Figure here
+
+    def month_order(month_by_key):
+        return sorted(month_by_key.keys(),
+                      key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
+
+    def shorten(name, length):
+        return name[:length] + '...' if len(name) > length else name
 
     # Chart 1: Status Distribution
     if status_counts:
@@ -585,315 +466,123 @@ def strategic_report_chart(request):
             "cancelled": {"name": "Cancelled", "color": "#9966FF"},
         }
 
-        labels = [status_map.get(s['status'], {}).get('name', s['status']) for s in status_counts]
-        values = [s['count'] for s in status_counts]
-        colors = [status_map.get(s['status'], {}).get('color', COLORS[0]) for s in status_counts]
-
-        fig = go.Figure(data=[go.Pie(
-            labels=labels, values=values, hole=0.5,
-            marker=dict(colors=colors),
-            textinfo='percent+label',
-            hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-        )])
-        fig.update_layout(
-            title_text='Report Status Distribution',
-            height=400,
-            annotations=[dict(text='Status', x=0.5, y=0.5, font_size=16, showarrow=False)]
+        status_plot = ChartPayload.chart(
+            'pie', title='Report Status Distribution', height=400, hole=0.5, center='Status',
+            labels=[status_map.get(s['status'], {}).get('name', s['status']) for s in status_counts],
+            values=[s['count'] for s in status_counts],
+            colors=[status_map.get(s['status'], {}).get('color', COLORS[0]) for s in status_counts],
         )
-        status_plot = plot(fig, output_type='div', config={'displayModeBar': False})
     else:
-        status_plot = "<div class='no-data'>No status data available</div>"
+        status_plot = None
 
     # Chart 2: Monthly Performance Overview
     if monthly_metrics:
-        months = [m['month'] for m in monthly_metrics]
-        achievement = [m['achievement'] for m in monthly_metrics]
-        weighted = [m['weighted_score'] for m in monthly_metrics]
-
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Average % Achieved by Month', 'Average Weighted Score by Month')
+        overview_plot = ChartPayload.chart(
+            'bar_panels', height=400, showlegend=False, tickangle=-45,
+            x=[m['month'] for m in monthly_metrics],
+            series=[
+                {'title': 'Average % Achieved by Month', 'name': '% Achieved', 'color': COLORS[0],
+                 'y': [m['achievement'] for m in monthly_metrics],
+                 'hovertemplate': '<b>%{x}</b><br>% Achieved: %{y:.2f}%<extra></extra>'},
+                {'title': 'Average Weighted Score by Month', 'name': 'Weighted Score', 'color': COLORS[1],
+                 'y': [m['weighted_score'] for m in monthly_metrics],
+                 'hovertemplate': '<b>%{x}</b><br>Weighted Score: %{y:.2f}<extra></extra>'},
+            ],
         )
-
-        fig.add_trace(go.Bar(
-            x=months, y=achievement, name='% Achieved',
-            marker_color=COLORS[0],
-            hovertemplate='<b>%{x}</b><br>% Achieved: %{y:.2f}%<extra></extra>'
-        ), 1, 1)
-
-        fig.add_trace(go.Bar(
-            x=months, y=weighted, name='Weighted Score',
-            marker_color=COLORS[1],
-            hovertemplate='<b>%{x}</b><br>Weighted Score: %{y:.2f}<extra></extra>'
-        ), 1, 2)
-
-        fig.update_layout(height=400, showlegend=False)
-        fig.update_xaxes(tickangle=-45)
-        overview_plot = plot(fig, output_type='div', config={'displayModeBar': False})
     else:
-        overview_plot = "<div class='no-data'>No monthly data available</div>"
+        overview_plot = None
 
-    # Chart 3: Stakeholder Heatmap
+    # Charts 3-5: Stakeholder Heatmap, Trends and Performance Distribution
     if stakeholder_by_month and all_stakeholders:
-        months = sorted(stakeholder_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
+        months = month_order(stakeholder_by_month)
         # REMOVED: Top stakeholder limit - use all stakeholders
         stakeholder_names = [s[0] for s in all_stakeholders]
 
-        z_data = []
-        for stakeholder in stakeholder_names:
-            row = []
-            for month in months:
-                row.append(stakeholder_by_month[month].get(stakeholder, 0))
-            z_data.append(row)
-
-        fig = go.Figure(data=go.Heatmap(
-            z=z_data, x=months, y=stakeholder_names,
-            colorscale='Viridis', hoverongaps=False,
-            hovertemplate='<b>%{y}</b><br>Month: %{x}<br>% Achieved: %{z:.2f}%<extra></extra>'
-        ))
-        fig.update_layout(
-            title='Department Performance Heatmap',
-            xaxis_title='Month', yaxis_title='Departments',
-            height=max(600, len(stakeholder_names) * 30),  # Dynamic height based on number of stakeholders
-            xaxis=dict(tickangle=-45)
+        heatmap_plot = ChartPayload.chart(
+            'heatmap', title='Department Performance Heatmap', x_title='Month', y_title='Departments',
+            # Dynamic height based on number of stakeholders
+            height=max(600, len(stakeholder_names) * 30), tickangle=-45,
+            x=months, y=stakeholder_names, colorscale='Viridis',
+            z=[[stakeholder_by_month[month].get(stakeholder, 0) for month in months]
+               for stakeholder in stakeholder_names],
+            hovertemplate='<b>%{y}</b><br>Month: %{x}<br>% Achieved: %{z:.2f}%<extra></extra>',
         )
-        heatmap_plot = plot(fig, output_type='div', config={'displayModeBar': False})
-    else:
-        heatmap_plot = "<div class='no-data'>No stakeholder data available</div>"
-
-    # Chart 4: Stakeholder Trends
-    if stakeholder_by_month and all_stakeholders:
-        months = sorted(stakeholder_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-        fig = go.Figure()
 
         # REMOVED: Limit of 8 stakeholders - show all stakeholders
-        for i, (stakeholder, data) in enumerate(all_stakeholders):
-            values = [data['monthly'].get(month, 0) for month in months]
-            fig.add_trace(go.Scatter(
-                x=months, y=values, mode='lines+markers',
-                name=stakeholder[:20] + '...' if len(stakeholder) > 20 else stakeholder,
-                line=dict(color=COLORS[i % len(COLORS)], width=2),
-                marker=dict(size=4),
-                hovertemplate=f'<b>{stakeholder}</b><br>Month: %{{x}}<br>% Achieved: %{{y:.2f}}%<extra></extra>'
-            ))
-
-        fig.update_layout(
-            title='Department Performance Trends',
-            xaxis_title='Month', yaxis_title='% Achieved',
-            height=500, xaxis=dict(tickangle=-45),
-            showlegend=True
+        trends_plot = ChartPayload.chart(
+            'lines', title='Department Performance Trends', x_title='Month', y_title='% Achieved',
+            height=500, tickangle=-45, showlegend=True, x=months,
+            series=[
+                {'name': shorten(stakeholder, 20), 'color': COLORS[i % len(COLORS)],
+                 'y': [data['monthly_achievement'].get(month, 0) for month in months],
+                 'hovertemplate': f'<b>{stakeholder}</b><br>Month: %{{x}}<br>% Achieved: %{{y:.2f}}%<extra></extra>'}
+                for i, (stakeholder, data) in enumerate(all_stakeholders)
+            ],
         )
-        trends_plot = plot(fig, output_type='div', config={'displayModeBar': False})
     else:
-        trends_plot = "<div class='no-data'>No trend data available</div>"
+        heatmap_plot = trends_plot = None
 
-    # Chart 5: Performance Distribution Boxplot
     if stakeholder_by_month:
-        months = sorted(stakeholder_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-
-        monthly_performance_data = []
-        for month in months:
-            performances = list(stakeholder_by_month[month].values())
-            monthly_performance_data.append(performances)
-
-        fig = go.Figure()
-        for i, month in enumerate(months):
-            fig.add_trace(go.Box(
-                y=monthly_performance_data[i], name=month,
-                boxpoints='outliers', marker_color=COLORS[i % len(COLORS)]
-            ))
-
-        fig.update_layout(
-            title='Performance Distribution by Month',
-            xaxis_title='Month', yaxis_title='% Achieved',
-            height=500, showlegend=False,
-            xaxis=dict(tickangle=-45)
+        boxplot_plot = ChartPayload.chart(
+            'boxes', title='Performance Distribution by Month', x_title='Month', y_title='% Achieved',
+            height=500, showlegend=False, tickangle=-45,
+            series=[
+                {'name': month, 'y': list(stakeholder_by_month[month].values()), 'color': COLORS[i % len(COLORS)]}
+                for i, month in enumerate(month_order(stakeholder_by_month))
+            ],
         )
-        boxplot_plot = plot(fig, output_type='div', config={'displayModeBar': False})
     else:
-        boxplot_plot = "<div class='no-data'>No performance data available</div>"
-
-    # Chart 6: Objective Achievement
-    if all_objectives and objective_by_month:
-        months = sorted(objective_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-        fig = go.Figure()
-
-        # REMOVED: Limit of top objectives - show all objectives
-        for i, (objective, data) in enumerate(all_objectives):
-            values = [data['monthly_achievement'].get(month, 0) for month in months]
-            fig.add_trace(go.Bar(
-                name=objective[:30] + '...' if len(objective) > 30 else objective,
-                x=months, y=values, marker_color=COLORS[i % len(COLORS)]
-            ))
-
-        fig.update_layout(
-            title='Objectives - % Achieved by Month',
-            xaxis_title='Month', yaxis_title='% Achieved',
-            height=500, barmode='group',
-            xaxis=dict(tickangle=-45)
+        boxplot_plot = None
+
+    # Charts 6-9: Objective and KPI Achievement and Weighted Scores by month
+    # REMOVED: Limit of top objectives/KPIs - show all of them
+    def monthly_bars(title, y_title, ranked, by_month, measure):
+        if not (ranked and by_month):
+            return None
+        months = month_order(by_month)
+        return ChartPayload.chart(
+            'bars', title=title, x_title='Month', y_title=y_title, height=500, tickangle=-45, x=months,
+            series=[
+                {'name': shorten(name, 30), 'color': COLORS[i % len(COLORS)],
+                 'y': [data[measure].get(month, 0) for month in months]}
+                for i, (name, data) in enumerate(ranked)
+            ],
         )
-        objective_achievement_plot = plot(fig, output_type='div', config={'displayModeBar': False})
-    else:
-        objective_achievement_plot = "<div class='no-data'>No objective data available</div>"
-
-    # Chart 7: Objective Weighted Scores
-    if all_objectives and objective_by_month:
-        months = sorted(objective_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-        fig = go.Figure()
-
-        # REMOVED: Limit of top objectives - show all objectives
-        for i, (objective, data) in enumerate(all_objectives):
-            values = [data['monthly_weighted'].get(month, 0) for month in months]
-            fig.add_trace(go.Bar(
-                name=objective[:30] + '...' if len(objective) > 30 else objective,
-                x=months, y=values, marker_color=COLORS[i % len(COLORS)]
-            ))
-
-        fig.update_layout(
-            title='Objectives - Weighted Score by Month',
-            xaxis_title='Month', yaxis_title='Weighted Score',
-            height=500, barmode='group',
-            xaxis=dict(tickangle=-45)
-        )
-        objective_weighted_plot = plot(fig, output_type='div', config={'displayModeBar': False})
-    else:
-        objective_weighted_plot = "<div class='no-data'>No objective weighted data available</div>"
-
-    # Chart 8: KPI Achievement
-    if all_kpis and kpi_by_month:
-        months = sorted(kpi_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-        fig = go.Figure()
-
-        # REMOVED: Limit of top KPIs - show all KPIs
-        for i, (kpi, data) in enumerate(all_kpis):
-            values = [data['monthly_achievement'].get(month, 0) for month in months]
-            fig.add_trace(go.Bar(
-                name=kpi[:30] + '...' if len(kpi) > 30 else kpi,
-                x=months, y=values, marker_color=COLORS[i % len(COLORS)]
-            ))
-
-        fig.update_layout(
-            title='KPIs - % Achieved by Month',
-            xaxis_title='Month', yaxis_title='% Achieved',
-            height=500, barmode='group',
-            xaxis=dict(tickangle=-45)
-        )
-        kpi_achievement_plot = plot(fig, output_type='div', config={'displayModeBar': False})
-    else:
-        kpi_achievement_plot = "<div class='no-data'>No KPI data available</div>"
-
-    # Chart 9: KPI Weighted Scores
-    if all_kpis and kpi_by_month:
-        months = sorted(kpi_by_month.keys(),
-                        key=lambda x: datetime.strptime(x, "%b %Y") if x != "Unknown" else datetime.min)
-        fig = go.Figure()
-
-        # REMOVED: Limit of top KPIs - show all KPIs
-        for i, (kpi, data) in enumerate(all_kpis):
-            values = [data['monthly_weighted'].get(month, 0) for month in months]
-            fig.add_trace(go.Bar(
-                name=kpi[:30] + '...' if len(kpi) > 30 else kpi,
-                x=months, y=values, marker_color=COLORS[i % len(COLORS)]
-            ))
-
-        fig.update_layout(
-            title='KPIs - Weighted Score by Month',
-            xaxis_title='Month', yaxis_title='Weighted Score',
-            height=500, barmode='group',
-            xaxis=dict(tickangle=-45)
-        )
-        kpi_weighted_plot = plot(fig, output_type='div', config={'displayModeBar': False})
-    else:
-        kpi_weighted_plot = "<div class='no-data'>No KPI weighted data available</div>"
-
-    # NEW: Stakeholder Performance Table Data
-    # Enhanced stakeholder performance with weighted scores
-    stakeholder_performance_with_weighted = defaultdict(lambda: {
-        'achievement': [],
-        'weighted_score': [],
-        'count': 0,
-        'monthly_achievement': {},
-        'monthly_weighted': {}
-    })
 
-    for item in stakeholder_monthly_data:
-        month_key = item['month'].strftime("%b %Y") if item['month'] else "Unknown"
-        stakeholder = item['stakeholder']
-
-        stakeholder_performance_with_weighted[stakeholder]['achievement'].append(item['achievement'] or 0)
-        stakeholder_performance_with_weighted[stakeholder]['weighted_score'].append(item['weighted_score'] or 0)
-        stakeholder_performance_with_weighted[stakeholder]['count'] += item['report_count']
-        stakeholder_performance_with_weighted[stakeholder]['monthly_achievement'][month_key] = item['achievement'] or 0
-        stakeholder_performance_with_weighted[stakeholder]['monthly_weighted'][month_key] = item['weighted_score'] or 0
-
-    # Calculate averages for enhanced stakeholder data
-    for stakeholder in stakeholder_performance_with_weighted:
-        achievements = stakeholder_performance_with_weighted[stakeholder]['achievement']
-        weighteds = stakeholder_performance_with_weighted[stakeholder]['weighted_score']
-        stakeholder_performance_with_weighted[stakeholder]['avg_achievement'] = sum(achievements) / len(
-            achievements) if achievements else 0
-        stakeholder_performance_with_weighted[stakeholder]['avg_weighted'] = sum(weighteds) / len(
-            weighteds) if weighteds else 0
-
-    # Convert to list of tuples for template iteration
-    stakeholder_performance_list = sorted(
-        [(stakeholder, data) for stakeholder, data in stakeholder_performance_with_weighted.items()],
-        key=lambda x: x[1]['count'], reverse=True
+    objective_achievement_plot = monthly_bars(
+        'Objectives - % Achieved by Month', '% Achieved', all_objectives, objective_by_month, 'monthly_achievement'
+    )
+    objective_weighted_plot = monthly_bars(
+        'Objectives - Weighted Score by Month', 'Weighted Score', all_objectives, objective_by_month,
+        'monthly_weighted'
+    )
+    kpi_achievement_plot = monthly_bars(
+        'KPIs - % Achieved by Month', '% Achieved', all_kpis, kpi_by_month, 'monthly_achievement'
+    )
+    kpi_weighted_plot = monthly_bars(
+        'KPIs - Weighted Score by Month', 'Weighted Score', all_kpis, kpi_by_month, 'monthly_weighted'
     )
 
-    # NEW: Stakeholder Performance Comparison Chart - Show ALL stakeholders
-    if stakeholder_performance_with_weighted:
-        # Get ALL stakeholders for comparison
-        all_stakeholders_comparison = stakeholder_performance_list
-
-        stakeholders = [s[0] for s in all_stakeholders_comparison]
-        avg_achievements = [s[1]['avg_achievement'] for s in all_stakeholders_comparison]
-        avg_weighted = [s[1]['avg_weighted'] for s in all_stakeholders_comparison]
-
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-        fig.add_trace(
-            go.Bar(
-                x=stakeholders,
-                y=avg_achievements,
-                name="Avg % Achieved",
-                marker_color=COLORS[0],
-                hovertemplate='<b>%{x}</b><br>Avg Achievement: %{y:.1f}%<extra></extra>'
-            ),
-            secondary_y=False,
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=stakeholders,
-                y=avg_weighted,
-                name="Avg Weighted Score",
-                marker_color=COLORS[1],
-                mode='lines+markers',
-                hovertemplate='<b>%{x}</b><br>Avg Weighted: %{y:.2f}<extra></extra>'
-            ),
-            secondary_y=True,
-        )
+    # NEW: Stakeholder Performance Table Data (same ranking as the heatmap/trends)
+    stakeholder_performance_list = all_stakeholders
 
-        fig.update_layout(
-            title_text='Stakeholder Performance Comparison',
-            xaxis_title='Departments',
-            height=max(600, len(stakeholders) * 30),  # Dynamic height based on number of stakeholders
-            xaxis=dict(tickangle=-45)
+    # NEW: Stakeholder Performance Comparison Chart - Show ALL stakeholders
+    if stakeholder_performance_list:
+        stakeholders = [s[0] for s in stakeholder_performance_list]
+        stakeholder_comparison_plot = ChartPayload.chart(
+            'bar_line', title='Stakeholder Performance Comparison', x_title='Departments',
+            # Dynamic height based on number of stakeholders
+            height=max(600, len(stakeholders) * 30), tickangle=-45,
+            y_titles=['Average % Achieved', 'Average Weighted Score'], x=stakeholders,
+            bar={'name': 'Avg % Achieved', 'color': COLORS[0],
+                 'y': [s[1]['avg_achievement'] for s in stakeholder_performance_list],
+                 'hovertemplate': '<b>%{x}</b><br>Avg Achievement: %{y:.1f}%<extra></extra>'},
+            line={'name': 'Avg Weighted Score', 'color': COLORS[1],
+                  'y': [s[1]['avg_weighted'] for s in stakeholder_performance_list],
+                  'hovertemplate': '<b>%{x}</b><br>Avg Weighted: %{y:.2f}<extra></extra>'},
         )
-
-        fig.update_yaxes(title_text="Average % Achieved", secondary_y=False)
-        fig.update_yaxes(title_text="Average Weighted Score", secondary_y=True)
-
-        stakeholder_comparison_plot = plot(fig, output_type='div', config={'displayModeBar': False})
     else:
-        stakeholder_comparison_plot = "<div class='no-data'>No stakeholder comparison data available</div>"
+        stakeholder_comparison_plot = None
 
     # Prepare context
     context = {
@@ -907,16 +596,9 @@ def strategic_report_chart(request):
             'weighted_score': overall_metrics['weighted_score'] or 0,
             'percent_achieved': overall_metrics['achievement'] or 0,
         },
+        'scorecard': scorecard,
         'date_metrics': monthly_metrics,
-        'body_metrics': list(reports.values(
-            'action_plan__responsible_bodies__stakeholder_name'
-        ).annotate(
-            achievement=Avg('percent_achieved'),
-            weighted_score=Avg('weighted_score'),
-            report_count=Count('id')
-        ).filter(
-            action_plan__responsible_bodies__stakeholder_name__isnull=False
-        ).order_by('-report_count')) if body_filter == "all" else [],
+        'body_metrics': body_metrics,
 
         # Data for tables - using all elements instead of top elements
         'top_objectives': all_objectives,
@@ -930,33 +612,33 @@ def strategic_report_chart(request):
         'objectives_by_body': objectives_by_body,
         'kpis_by_body': kpis_by_body,
 
-        # All Charts
-        'status_plot': status_plot,
-        'overview_plot': overview_plot,
-        'stakeholder_heatmap_plot': heatmap_plot,
-        'stakeholder_line_plot': trends_plot,
-        'performance_boxplot_plot': boxplot_plot,
-        'objective_achievement_plot': objective_achievement_plot,
-        'objective_weighted_plot': objective_weighted_plot,
-        'kpi_achievement_plot': kpi_achievement_plot,
-        'kpi_weighted_plot': kpi_weighted_plot,
-
-        # NEW: Stakeholder comparison chart
-        'stakeholder_comparison_plot': stakeholder_comparison_plot,
+        # All Charts, drawn client-side from strategic_report_chart_data
+        'charts': ChartPayload.build({
+            'status_plot': status_plot,
+            'overview_plot': overview_plot,
+            'stakeholder_heatmap_plot': heatmap_plot,
+            'stakeholder_line_plot': trends_plot,
+            'performance_boxplot_plot': boxplot_plot,
+            'objective_achievement_plot': objective_achievement_plot,
+            'objective_weighted_plot': objective_weighted_plot,
+            'kpi_achievement_plot': kpi_achievement_plot,
+            'kpi_weighted_plot': kpi_weighted_plot,
+            # NEW: Stakeholder comparison chart
+            'stakeholder_comparison_plot': stakeholder_comparison_plot,
+        }, config={'displayModeBar': False}),
 
         # Filters
-        'strategic_cycles': strategic_cycles,
+        'strategic_cycles': list(strategic_cycles),
         'responsible_bodies': responsible_bodies,
         'selected_cycle': cycle_filter,
         'selected_body': body_filter,
-        'current_date': timezone.now(),
 
         # Filter states
         'cycle_filter_name': strategic_cycles.get(id=cycle_filter).name if cycle_filter != "all" else "All Cycles",
         'body_filter_name': body_filter if body_filter != "all" else "All Bodies",
     }
 
-    return render(request, 'strategic_report/chart.html', context)
+    return context
 #
 #
 # from django.db.models import Count, Avg, F
@@ -1302,7 +984,7 @@ def strategic_report_chart(request):
 #
 #         # REMOVED: Limit of 8 stakeholders - show all stakeholders
 #         for i, (stakeholder, data) in enumerate(all_stakeholders):
-#             values = [data['monthly'].get(month, 0) for month in months]
+#             values = [data['monthly_achievement'].get(month, 0) for month in months]
 #             fig.add_trace(go.Scatter(
 #                 x=months, y=values, mode='lines+markers',
 #                 name=stakeholder[:20] + '...' if len(stakeholder) > 20 else stakeholder,
@@ -3,17 +3,17 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from management_project.models import SwotAnalysis
 from management_project.forms import SwotAnalysisForm
-from django.db.models import Q
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.excel_export import ExcelExport
+from management_project.services.export_jobs import background_export
+from management_project.services.search_index import SearchIndexService
 
 from django.core.paginator import Paginator
 
-from django.http import HttpResponse
+from django.http import JsonResponse
 from django.core.paginator import Paginator
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-
 
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
@@ -42,12 +42,7 @@ def swot_analysis_list(request):
 
     # Search filter across multiple fields
     if query:
-        swots = swots.filter(
-            Q(swot_type__icontains=query) |
-            Q(swot_pillar__icontains=query) |
-            Q(swot_factor__icontains=query) |
-            Q(description__icontains=query)
-        )
+        swots = SearchIndexService.filter(swots, 'swot_analysis', request.user.organization_name, query)
 
     # Ordering
     swots = swots.order_by('swot_type', 'priority', '-created_at')
@@ -130,53 +125,27 @@ def delete_swot_analysis(request, pk):
 
 
 @login_required
+@background_export('swot_analysis')
 def export_swot_analysis_to_excel(request):
-    # Get filters from request
-    query = request.GET.get('search', '').strip()
-    selected_type = request.GET.get('swot_type', '').strip()
+    return build_swot_analysis_export(request.user.organization_name, request.GET).response()
+
+
+def build_swot_analysis_export(organization, params, progress=None):
+    """SWOT analysis workbook; shared by the view and background export jobs."""
+    # Get filters
+    query = params.get('search', '').strip()
+    selected_type = params.get('swot_type', '').strip()
 
     # Base queryset
     swots = SwotAnalysis.objects.filter(
-        organization_name=request.user.organization_name
+        organization_name=organization
     )
 
     # Apply filters
     if selected_type:
         swots = swots.filter(swot_type=selected_type)
     if query:
-        search_filter = (
-            Q(swot_type__icontains=query) |
-            Q(swot_pillar__icontains=query) |
-            Q(swot_factor__icontains=query) |
-            Q(description__icontains=query)
-        )
-        swots = swots.filter(search_filter)
-
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "SWOT Analysis"
-
-    # Styles
-    title_font = Font(size=14, bold=True, color="FFFFFF")
-    header_font = Font(bold=True, color="FFFFFF")
-    title_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-    header_fill = PatternFill(start_color="4BACC6", end_color="4BACC6", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-
-    # Title row
-    total_columns = 9
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=total_columns)
-    title_cell = ws.cell(row=1, column=1)
-    title_cell.value = "SWOT Analysis Report"
-    title_cell.font = title_font
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
-    title_cell.fill = title_fill
+        swots = SearchIndexService.filter(swots, 'swot_analysis', organization, query)
 
     # Header row
     headers = [
@@ -184,17 +153,10 @@ def export_swot_analysis_to_excel(request):
         "Priority", "Impact", "Likelihood",
         "Created At", "Updated At"
     ]
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=2, column=col_num)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = border
-
-    # Data rows
-    for row_num, swot in enumerate(swots, start=3):
-        row_data = [
+
+    # Data rows, produced lazily so the export streams
+    rows = (
+        [
             swot.swot_type,
             swot.swot_pillar,
             swot.swot_factor,
@@ -205,33 +167,40 @@ def export_swot_analysis_to_excel(request):
             swot.created_at.strftime("%Y-%m-%d %H:%M"),
             swot.updated_at.strftime("%Y-%m-%d %H:%M"),
         ]
-        for col_num, value in enumerate(row_data, 1):
-            cell = ws.cell(row=row_num, column=col_num)
-            cell.value = value
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-            cell.border = border
-
-    # Auto-adjust column widths (skip merged cells)
-    for i, col in enumerate(ws.columns, 1):
-        max_length = 0
-        for cell in col:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        column_letter = get_column_letter(i)
-        ws.column_dimensions[column_letter].width = max_length + 5
-
-    # Prepare response
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        for swot in swots.iterator(chunk_size=2000)
+    )
+
+    export = ExcelExport("SWOT_Analysis_Report.xlsx", progress=progress)
+    export.add_sheet(
+        "SWOT Analysis", headers, rows, heading="SWOT Analysis Report",
+        body_style=ExcelExport.CELL, min_width=0, padding=5, total_rows=swots.count,
     )
-    response['Content-Disposition'] = 'attachment; filename=SWOT_Analysis_Report.xlsx'
-    wb.save(response)
-    return response
+    return export
 
 
 
 @login_required
 def swot_analysis_chart(request):
+    context = _cached_swot_analysis_chart_context(request)
+    return render(request, 'swot_analysis/chart.html', context)
+
+
+@login_required
+def swot_analysis_chart_data(request):
+    """Chart series of the SWOT analysis dashboard, drawn client-side by charts.js."""
+    context = _cached_swot_analysis_chart_context(request)
+    return JsonResponse(context['charts'], encoder=ChartPayload.ENCODER)
+
+
+def _cached_swot_analysis_chart_context(request):
+    return ChartCacheService.get_or_build(
+        'swot_analysis_chart', request.user.organization_name, {},
+        lambda: _swot_analysis_chart_context(request),
+    )
+
+
+def _swot_analysis_chart_context(request):
+    """Chart context for the SWOT analysis dashboard, cached by ChartCacheService."""
     qs = SwotAnalysis.objects.filter(
         organization_name=request.user.organization_name
     )
@@ -353,12 +322,15 @@ def swot_analysis_chart(request):
         'threats_count': threats_count,
     }
 
-    return render(request, 'swot_analysis/chart.html', {
-        'plot_html_swot_type': fig_swot_type.to_html(full_html=False),
-        'plot_html_priority': fig_priority.to_html(full_html=False),
-        'plot_html_impact': fig_impact.to_html(full_html=False),
-        'plot_html_likelihood': fig_likelihood.to_html(full_html=False),
-        'plot_html_pillar': fig_pillar.to_html(full_html=False),
+    return {
+        # Drawn client-side from swot_analysis_chart_data
+        'charts': ChartPayload.build({
+            'plot_html_swot_type': fig_swot_type,
+            'plot_html_priority': fig_priority,
+            'plot_html_impact': fig_impact,
+            'plot_html_likelihood': fig_likelihood,
+            'plot_html_pillar': fig_pillar,
+        }),
         'summary_data': summary_data,
-    })
+    }
 
@@ -7,12 +7,15 @@ from django.urls import reverse
 
 from management_project.models import SwotReport, StrategicCycle, StrategicReport
 from management_project.forms import SwotReportForm
+from management_project.services.chart_cache import ChartCacheService
+from management_project.services.chart_payload import ChartPayload
+from management_project.services.search_index import SearchIndexService
 
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 import openpyxl
 from openpyxl.utils import get_column_letter
 
-from django.db.models import Count, Q
+from django.db.models import Count
 import plotly.graph_objects as go
 
 
@@ -45,15 +48,7 @@ def swot_report_list(request):
 
     # Apply search filter
     if query:
-        swots = swots.filter(
-            Q(swot_type__icontains=query) |
-            Q(swot_pillar__icontains=query) |
-            Q(swot_factor__icontains=query) |
-            Q(description__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__name__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__time_horizon__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__time_horizon_type__icontains=query)
-        )
+        swots = SearchIndexService.filter(swots, 'swot_report', request.user.organization_name, query)
 
     # Available strategic cycles for filter dropdown
     strategic_cycles = StrategicCycle.objects.filter(
@@ -174,15 +169,7 @@ def swot_report_list(request):
 
     # Apply search filter
     if query:
-        swots = swots.filter(
-            Q(swot_type__icontains=query) |
-            Q(swot_pillar__icontains=query) |
-            Q(swot_factor__icontains=query) |
-            Q(description__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__name__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__time_horizon__icontains=query) |
-            Q(strategic_report_period__action_plan__strategic_cycle__time_horizon_type__icontains=query)
-        )
+        swots = SearchIndexService.filter(swots, 'swot_report', request.user.organization_name, query)
 
     # Ordering
     swots = swots.order_by("swot_type", "priority", "-created_at")
@@ -255,6 +242,27 @@ def swot_report_list(request):
 
 @login_required
 def swot_report_chart(request):
+    context = _cached_swot_report_chart_context(request)
+    return render(request, 'swot_report/chart.html', context)
+
+
+@login_required
+def swot_report_chart_data(request):
+    """Chart series of the SWOT report dashboard, drawn client-side by charts.js."""
+    context = _cached_swot_report_chart_context(request)
+    return JsonResponse(context['charts'], encoder=ChartPayload.ENCODER)
+
+
+def _cached_swot_report_chart_context(request):
+    params = {'cycle': request.GET.get("cycle") or ''}
+    return ChartCacheService.get_or_build(
+        'swot_report_chart', request.user.organization_name, params,
+        lambda: _swot_report_chart_context(request),
+    )
+
+
+def _swot_report_chart_context(request):
+    """Chart context for the SWOT report dashboard, cached by ChartCacheService."""
     qs = SwotReport.objects.filter(
         organization_name=request.user.organization_name
     )
@@ -389,13 +397,16 @@ def swot_report_chart(request):
         'strategic_report_period__action_plan__strategic_cycle__name', flat=True
     ).distinct()
 
-    return render(request, 'swot_report/chart.html', {
-        'plot_html_swot_type': fig_swot_type.to_html(full_html=False),
-        'plot_html_priority': fig_priority.to_html(full_html=False),
-        'plot_html_impact': fig_impact.to_html(full_html=False),
-        'plot_html_likelihood': fig_likelihood.to_html(full_html=False),
-        'plot_html_pillar': fig_pillar.to_html(full_html=False),
+    return {
+        # Drawn client-side from swot_report_chart_data
+        'charts': ChartPayload.build({
+            'plot_html_swot_type': fig_swot_type,
+            'plot_html_priority': fig_priority,
+            'plot_html_impact': fig_impact,
+            'plot_html_likelihood': fig_likelihood,
+            'plot_html_pillar': fig_pillar,
+        }),
         'summary_data': summary_data,
-        'all_cycles': all_cycles,
+        'all_cycles': list(all_cycles),
         'selected_cycle': cycle_filter
-    })
+    }
@@ -88,7 +88,7 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from management_project.models import Vision
 from management_project.forms import VisionForm
-from management_project.services.permissions import role_required, get_user_permissions
+from management_project.services.permissions import role_required, get_request_permissions
 
 # -------------------- VISION LIST --------------------
 @login_required
@@ -99,7 +99,7 @@ def vision_list(request):
     ).order_by('-id')
 
     # Get permissions for the logged-in user
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     # Only show form if user has create permission
     form = VisionForm() if permissions.get('vision_create', False) else None
@@ -117,7 +117,7 @@ def vision_list(request):
 @login_required
 @role_required(['editor'])  # Only editor can create
 def create_vision(request):
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
     if request.method == 'POST':
         form = VisionForm(request.POST)
         if form.is_valid():
@@ -144,7 +144,7 @@ def create_vision(request):
 @role_required(['editor'])  # Only editor can update
 def update_vision(request, pk):
     vision = get_object_or_404(Vision, pk=pk, organization_name=request.user.organization_name)
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     if request.method == 'POST':
         form = VisionForm(request.POST, instance=vision)
@@ -171,7 +171,7 @@ def update_vision(request, pk):
 @role_required(['editor'])  # Only editor can delete
 def delete_vision(request, pk):
     vision = get_object_or_404(Vision, pk=pk, organization_name=request.user.organization_name)
-    permissions = get_user_permissions(request.user)
+    permissions = get_request_permissions(request)
 
     if request.method == 'POST':
         vision.delete()
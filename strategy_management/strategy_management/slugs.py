@@ -0,0 +1,114 @@
+from django.db import IntegrityError, transaction
+from django.utils.text import slugify
+
+
+class UniqueSlugService:
+    """
+    Unique slugs for the slugged models of every app (management_project's StrategicCycle and
+    Stakeholder, landing_page's posts).
+
+    The slugs already taken under the base are read in one prefix (LIKE 'stem%') query, which
+    the slug's unique index answers (on PostgreSQL through the pattern-ops index Django adds
+    next to it). The first free "<base>-<n>" suffix is then chosen in memory, and the base is
+    cut so the slug fits the field's max_length. Nothing is pre-checked on save: if a concurrent writer takes the slug
+    first, the unique constraint rejects the insert and a new slug is picked.
+
+    Usage, in a model's save():
+        UniqueSlugService.save(self, f"{self.title}", super().save, *args, **kwargs)
+    """
+
+    FIELD_NAME = 'slug'
+    MAX_ATTEMPTS = 5
+    # Room kept for "-<n>" when the base has to be cut to fit max_length
+    SUFFIX_RESERVE = 6
+
+    @classmethod
+    def save(cls, instance, base, save, *args, field_name=FIELD_NAME, **kwargs):
+        """
+        Call save(*args, **kwargs), filling instance.<field_name> from `base` first when it is
+        empty and retrying with the next free slug when the insert hits the unique constraint.
+        """
+        if getattr(instance, field_name):
+            return save(*args, **kwargs)
+
+        for attempt in range(1, cls.MAX_ATTEMPTS + 1):
+            slug = cls.generate(instance, base, field_name)
+            setattr(instance, field_name, slug)
+            try:
+                with transaction.atomic():
+                    return save(*args, **kwargs)
+            except IntegrityError:
+                setattr(instance, field_name, '')
+                # Only a slug collision is worth another attempt
+                if attempt == cls.MAX_ATTEMPTS or not cls._is_taken(instance, field_name, slug):
+                    raise
+
+    @classmethod
+    def generate(cls, instance, base, field_name=FIELD_NAME, reserved=()):
+        """
+        First slug for `base` not used by another row of the instance's model
+        (nor in `reserved`, slugs already handed to other unsaved instances).
+        """
+        max_length = instance._meta.get_field(field_name).max_length
+        base = cls._slugify(instance, base, field_name)
+
+        # Every slug the chosen one could collide with starts with this stem
+        stem = base[:max_length - cls.SUFFIX_RESERVE].rstrip('-') or base
+        taken = set(
+            cls._others(instance)
+            .filter(**{f'{field_name}__startswith': stem})
+            .order_by()
+            .values_list(field_name, flat=True)
+        )
+        taken.update(slug for slug in reserved if slug.startswith(stem))
+        if base not in taken:
+            return base
+
+        # Lowest free "<base>-<n>", as the old exists() loops produced
+        number = 1
+        while cls._with_suffix(base, number, max_length) in taken:
+            number += 1
+        return cls._with_suffix(base, number, max_length)
+
+    @classmethod
+    def generate_many(cls, instances, bases, field_name=FIELD_NAME):
+        """
+        Fill the slug of unsaved instances (e.g. before bulk_create) from their `bases`.
+        The whole batch is checked in one query; each collision costs one generate() query.
+        """
+        candidates = [cls._slugify(instance, base, field_name) for instance, base in zip(instances, bases)]
+        if not candidates:
+            return
+        model = type(instances[0])
+        taken = set(
+            model._default_manager.filter(**{f'{field_name}__in': candidates})
+            .order_by()
+            .values_list(field_name, flat=True)
+        )
+        for instance, base, slug in zip(instances, bases, candidates):
+            if slug in taken:
+                slug = cls.generate(instance, base, field_name, reserved=taken)
+            taken.add(slug)
+            setattr(instance, field_name, slug)
+
+    @staticmethod
+    def _slugify(instance, base, field_name):
+        field = instance._meta.get_field(field_name)
+        slug = slugify(base, allow_unicode=field.allow_unicode)[:field.max_length].strip('-')
+        return slug or instance._meta.model_name
+
+    @staticmethod
+    def _with_suffix(base, number, max_length):
+        suffix = f"-{number}"
+        return f"{base[:max_length - len(suffix)].rstrip('-')}{suffix}"
+
+    @staticmethod
+    def _others(instance):
+        queryset = type(instance)._default_manager.all()
+        if instance.pk is not None:
+            queryset = queryset.exclude(pk=instance.pk)
+        return queryset
+
+    @classmethod
+    def _is_taken(cls, instance, field_name, slug):
+        return cls._others(instance).filter(**{field_name: slug}).exists()